@@ -0,0 +1,135 @@
+#!/bin/false
+
+# Copyright (c) 2022 Vít Labuda. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without modification, are permitted provided that the
+# following conditions are met:
+#  1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following
+#     disclaimer.
+#  2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the
+#     following disclaimer in the documentation and/or other materials provided with the distribution.
+#  3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote
+#     products derived from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES,
+# INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+# Parses a corpus of HTML documents using both the 'html' and the 'lxmlhtml' document parser modules and compares the
+#  information they extract. The documents in '_EQUIVALENT_CORPUS' must produce identical results; the ones in
+#  '_KNOWN_DIFFERENCES_CORPUS' illustrate the known differences between the two parsers (see the note in
+#  'LXMLHTMLDocumentParserModule') and must produce different results - if one of them stops differing (e.g. after a
+#  library upgrade), the note should be revisited.
+# Usage (from the directory where this script is located): python3 compare_html_document_parsers.py
+
+
+from typing import Any, Optional, Sequence, Tuple
+import sys
+import asyncio
+from spideriment_ng.helpers.containers.FetchedFileContainer import FetchedFileContainer
+from spideriment_ng.helpers.containers.document.DocumentContainer import DocumentContainer
+from spideriment_ng.helpers.containers.document.URLContainer import URLContainer
+from spideriment_ng.modules.documentparsers.DocumentParserModuleIface import DocumentParserModuleIface
+from spideriment_ng.modules.documentparsers.html.HTMLDocumentParserModule import HTMLDocumentParserModule
+from spideriment_ng.modules.documentparsers.lxmlhtml.LXMLHTMLDocumentParserModule import LXMLHTMLDocumentParserModule
+
+
+_DOCUMENT_URL = URLContainer(validated=True, certainly_absolute=True, url="http://example.com/")
+
+_EQUIVALENT_CORPUS: Tuple[Tuple[bytes, Optional[str]], ...] = (  # (data, encoding declared by the server)
+    (b'', None),
+    (b'   ', None),
+    (b'plain text only', None),
+    (b'<!DOCTYPE html><html lang=" cs "><head><meta charset="utf-8"><title> T\xc3\xadtle </title><meta name="Description" content=" desc "><meta name="keywords" content="a, b,,c "><meta name="AUTHOR" content="me"></head><body><h1>H1</h1><h2>H2 <em>x</em></h2><p>Para &amp; <strong>strong</strong> tail</p><ul><li>one</li><li> </li><li>two<a href=" /x ">link</a></li></ul><img src="a.png" alt=" alt "><img src=" "><img src="b.png" title="t"><script>var x="<p>no</p>";</script><style>p{}</style><!-- comment --><a href="/y"><img src="c.png"></a><a>nohref</a><h5>h5</h5><h4>h4</h4></body></html>', None),
+    (b'<?xml version="1.0" encoding="utf-8"?><!DOCTYPE html><html xmlns="http://www.w3.org/1999/xhtml"><head><title>X</title></head><body><p>p1</p><p>p2</p></body></html>', None),
+    (b'<html><head><title></title></head><body><h1> </h1><h2>second</h2></body></html>', None),
+    (b'<html><body><h3>h3</h3><em>e</em><strong>s</strong><em>e2</em><li>l</li><p>&nbsp;</p><p>a&#160;b</p></body></html>', None),
+    (b'<html><body><a href="javascript:void(0)">JS</a><a href="#top"> top </a><a href="">empty</a></body></html>', None),
+    (b'<html><body><script><p>x</p></script><style>a</style>t<noscript><p>ns</p></noscript></body></html>', None),
+    (b'<p>x<ruby>a<rt>b<em>c</em>d</rt>e</ruby>f</p><template><h1>t</h1><em>te</em><rt>inner</rt>tail</template><ul><li>z<rp>(</rp></li></ul>', "utf-8"),
+    (b'<template>only template text</template>', "utf-8"),
+    (b'<rt>only rt</rt>', "utf-8"),
+    (b'<meta name="robots" content=""><meta name="robots" content="noindex"><p>x</p>', None),
+    (b'<meta name="description"><meta name="description" content=" second "><html lang=""><html lang="de"><p>x</p>', None),
+    (b'<html><head><meta name="robots" content="index, NOFOLLOW"></head><body>x</body></html>', None),
+    (b'<html><head><meta name="robots" content="index"></head><body><div>only <b>div</b> text</div></body></html>', None),
+    (b'<html><head><meta http-equiv="content-type" content="text/html; charset=iso-8859-2"></head><body><p>\xe8e\xb9tina</p></body></html>', None),
+    (b'<html><head><meta charset="windows-1250"></head><body><p>\x9e\xe1</p></body></html>', None),
+    (b'<p>\xe8e\xb9tina</p>', "iso-8859-2"),
+    (b'<html><body><p>in</p></body></html><p>after</p><a href="/y">y</a>', None),  # Content after '</html>'
+    (b'<div>' * 3000 + b'<p>deep</p>' + b'</div>' * 3000, "utf-8"),  # Nested too deeply for libxml2
+    (b'<div>' * 2100 + b'<a href="/deep">deep</a>' + b'</div>' * 2100 + b'<a href="/z">z</a>', "utf-8"),
+)
+
+_KNOWN_DIFFERENCES_CORPUS: Tuple[Tuple[bytes, Optional[str]], ...] = (
+    (b'<body><p>a <p>b <div>c</div></body>', None),  # Optional end tags of paragraphs...
+    (b'<body><ul><li>x<li>y</ul></body>', None),  # ... and of list items
+    (b'<body><a href="/1">one <a href="/2">two</a></a></body>', None),  # Nested links
+    (b'<body><p>a &bogus; b</p></body>', None),  # Unknown entities
+    (b'<body><textarea><p>t</p></textarea><iframe><p>i</p></iframe><xmp><p>x</p></xmp><plaintext><p>p</p></body>', None),  # Raw text elements
+    (b'<html><body><p>a<ruby>kan<rt>ji</rt></ruby>b<template><p>tpl</p></template><!--c-->d<![CDATA[x]]></p></body></html>', None),  # Paragraphs nested in a paragraph
+    (b'<body>' + (b'<p>p' * 300) + (b'</p>' * 300) + b'</body>', "utf-8"),  # Deeply nested paragraphs
+)
+
+
+def _dump_parsing_result(parsing_result: Any) -> Any:
+    if isinstance(parsing_result, Exception):
+        return parsing_result.__class__.__name__
+
+    assert isinstance(parsing_result, DocumentContainer)
+    return (
+        parsing_result.get_title(),
+        parsing_result.get_description(),
+        tuple(parsing_result.get_keywords()),
+        parsing_result.get_language(),
+        parsing_result.get_author(),
+        tuple((snippet.get_snippet_type(), snippet.get_snippet_text()) for snippet in parsing_result.get_content_snippets()),
+        tuple((link.get_href_url().get_url(), link.get_link_text()) for link in parsing_result.get_links()),
+        tuple((image.get_src_url().get_url(), image.get_alt_text(), image.get_title_text()) for image in parsing_result.get_images())
+    )
+
+
+async def _parse_using_module(module_instance: DocumentParserModuleIface, data: bytes, encoding: Optional[str]) -> Any:
+    try:
+        return _dump_parsing_result(await module_instance.parse(FetchedFileContainer(_DOCUMENT_URL, data, False, "text/html", encoding)))
+    except Exception as e:
+        return _dump_parsing_result(e)
+
+
+async def _count_unexpected_results(module_instances: Sequence[DocumentParserModuleIface], corpus: Tuple[Tuple[bytes, Optional[str]], ...], expect_equivalence: bool) -> int:
+    unexpected_result_count = 0
+
+    for data, encoding in corpus:
+        results = [(await _parse_using_module(module_instance, data, encoding)) for module_instance in module_instances]
+        equivalent = all((result == results[0]) for result in results)
+        if equivalent == expect_equivalence:
+            continue
+
+        unexpected_result_count += 1
+        print(f"{'Different' if expect_equivalence else 'Identical'} results: {data[:80]!r}")
+        for module_instance, result in zip(module_instances, results):
+            print(f"  {module_instance.__class__.__name__}: {result!r}")
+
+    return unexpected_result_count
+
+
+async def _main() -> int:
+    module_instances = [(await module_class.create_instance(module_class.get_module_info().get_configuration_blueprint().use({}), "comparison")) for module_class in (HTMLDocumentParserModule, LXMLHTMLDocumentParserModule)]
+
+    unexpected_result_count = await _count_unexpected_results(module_instances, _EQUIVALENT_CORPUS, expect_equivalence=True)
+    unexpected_result_count += await _count_unexpected_results(module_instances, _KNOWN_DIFFERENCES_CORPUS, expect_equivalence=False)
+
+    for module_instance in module_instances:
+        await module_instance.destroy_instance()
+
+    print(f"{len(_EQUIVALENT_CORPUS) + len(_KNOWN_DIFFERENCES_CORPUS)} documents compared, {unexpected_result_count} unexpected result(s).")
+    return (0 if unexpected_result_count == 0 else 1)
+
+
+if __name__ == '__main__':
+    sys.exit(asyncio.run(_main()))
@@ -24,8 +24,10 @@ from typing import Final
 
 
 class LimitsConfiguration:
-    def __init__(self, worker_processes: int, worker_tasks_per_process: int, max_document_size: int,
-                 max_robots_txt_size: int, request_timeout: int, max_redirects: int, max_crawling_delay: int,
+    def __init__(self, worker_processes: int, worker_tasks_per_process: int, url_lease_batch_size: int,
+                 max_buffered_crawling_results: int, crawling_result_flush_interval: int, max_document_size: int,
+                 max_robots_txt_size: int, robots_txt_cache_ttl: int, robots_txt_not_found_cache_ttl: int,
+                 robots_txt_error_cache_ttl: int, robots_txt_promoted_cache_ttl: int, request_timeout: int, max_redirects: int, max_crawling_delay: int,
                  url_max_length: int, title_max_length: int, description_max_length: int, keyword_max_length: int,
                  author_max_length: int, content_snippet_max_length: int, link_text_max_length: int,
                  img_alt_text_max_length: int, img_title_max_length: int, max_keywords_per_document: int,
@@ -34,9 +36,16 @@ class LimitsConfiguration:
 
         self._worker_processes: Final[int] = worker_processes
         self._worker_tasks_per_process: Final[int] = worker_tasks_per_process
+        self._url_lease_batch_size: Final[int] = url_lease_batch_size
+        self._max_buffered_crawling_results: Final[int] = max_buffered_crawling_results
+        self._crawling_result_flush_interval: Final[int] = crawling_result_flush_interval
 
         self._max_document_size: Final[int] = max_document_size
         self._max_robots_txt_size: Final[int] = max_robots_txt_size
+        self._robots_txt_cache_ttl: Final[int] = robots_txt_cache_ttl
+        self._robots_txt_not_found_cache_ttl: Final[int] = robots_txt_not_found_cache_ttl
+        self._robots_txt_error_cache_ttl: Final[int] = robots_txt_error_cache_ttl
+        self._robots_txt_promoted_cache_ttl: Final[int] = robots_txt_promoted_cache_ttl
         self._request_timeout: Final[int] = request_timeout
         self._max_redirects: Final[int] = max_redirects
         self._max_crawling_delay: Final[int] = max_crawling_delay
@@ -63,12 +72,33 @@ class LimitsConfiguration:
     def get_worker_tasks_per_process(self) -> int:
         return self._worker_tasks_per_process
 
+    def get_url_lease_batch_size(self) -> int:
+        return self._url_lease_batch_size
+
+    def get_max_buffered_crawling_results(self) -> int:
+        return self._max_buffered_crawling_results
+
+    def get_crawling_result_flush_interval(self) -> int:
+        return self._crawling_result_flush_interval
+
     def get_max_document_size(self) -> int:
         return self._max_document_size
 
     def get_max_robots_txt_size(self) -> int:
         return self._max_robots_txt_size
 
+    def get_robots_txt_cache_ttl(self) -> int:
+        return self._robots_txt_cache_ttl
+
+    def get_robots_txt_not_found_cache_ttl(self) -> int:
+        return self._robots_txt_not_found_cache_ttl
+
+    def get_robots_txt_error_cache_ttl(self) -> int:
+        return self._robots_txt_error_cache_ttl
+
+    def get_robots_txt_promoted_cache_ttl(self) -> int:
+        return self._robots_txt_promoted_cache_ttl
+
     def get_request_timeout(self) -> int:
         return self._request_timeout
 
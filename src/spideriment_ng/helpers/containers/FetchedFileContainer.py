@@ -21,15 +21,20 @@
 
 
 from typing import Final, Optional
+from spideriment_ng.helpers.containers.document.URLContainer import URLContainer
 
 
 class FetchedFileContainer:
-    def __init__(self, data: bytes, are_data_cut_off: bool, hinted_mime_type: str, hinted_encoding: Optional[str]):
+    def __init__(self, fetched_url: URLContainer, data: bytes, are_data_cut_off: bool, hinted_mime_type: str, hinted_encoding: Optional[str]):
+        self._fetched_url: Final[URLContainer] = fetched_url
         self._data: Final[bytes] = data
         self._are_data_cut_off: Final[bool] = are_data_cut_off
         self._hinted_mime_type: Final[str] = hinted_mime_type
         self._hinted_encoding: Final[Optional[str]] = hinted_encoding
 
+    def get_fetched_url(self) -> URLContainer:
+        return self._fetched_url
+
     def get_data(self) -> bytes:
         return self._data
 
@@ -0,0 +1,72 @@
+#!/bin/false
+
+# Copyright (c) 2022 Vít Labuda. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without modification, are permitted provided that the
+# following conditions are met:
+#  1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following
+#     disclaimer.
+#  2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the
+#     following disclaimer in the documentation and/or other materials provided with the distribution.
+#  3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote
+#     products derived from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES,
+# INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+from typing import Final, Optional
+import re
+import chardet
+from .EncodingDetectorIface import EncodingDetectorIface
+
+
+class ChardetEncodingDetector(EncodingDetectorIface):
+    # 'chardet' is implemented in pure Python, so it is fed only a bounded sample of the data, in chunks, and the
+    #  detection ends as soon as it is confident enough - the detection's cost does therefore not grow with the size of
+    #  the data. As the encodings differ mostly in how they encode non-ASCII characters, the sample starts shortly before
+    #  the first non-ASCII byte, so documents whose beginning is ASCII-only (e.g. HTML documents with a long <head>) are
+    #  still detected reliably.
+
+    _MINIMUM_ACCEPTABLE_CONFIDENCE: Final[float] = 0.2
+    _MAX_SAMPLE_SIZE: Final[int] = 65536
+    _SAMPLE_CHUNK_SIZE: Final[int] = 4096
+    _SAMPLE_CONTEXT_BEFORE_NON_ASCII_BYTE: Final[int] = 1024
+    _NON_ASCII_BYTE_REGEX: Final[re.Pattern] = re.compile(rb'[\x80-\xff]')
+
+    def detect_encoding(self, binary_data: bytes) -> Optional[str]:
+        if binary_data.isascii():
+            return "ascii"
+
+        sample = self._take_sample(binary_data)
+
+        detector = chardet.UniversalDetector()
+        for chunk_start in range(0, len(sample), self.__class__._SAMPLE_CHUNK_SIZE):
+            detector.feed(sample[chunk_start:chunk_start + self.__class__._SAMPLE_CHUNK_SIZE])
+            if detector.done:
+                break
+        chardet_result = detector.close()
+
+        if (chardet_result["encoding"] is None) or (chardet_result["confidence"] < self.__class__._MINIMUM_ACCEPTABLE_CONFIDENCE):
+            return None
+
+        return chardet_result["encoding"]
+
+    def _take_sample(self, binary_data: bytes) -> bytes:
+        if len(binary_data) <= self.__class__._MAX_SAMPLE_SIZE:
+            return binary_data
+
+        # Byte order marks must not be cut off
+        if binary_data.startswith((b"\xef\xbb\xbf", b"\xfe\xff", b"\xff\xfe")):
+            return binary_data[:self.__class__._MAX_SAMPLE_SIZE]
+
+        first_non_ascii_byte = self.__class__._NON_ASCII_BYTE_REGEX.search(binary_data)
+        assert (first_non_ascii_byte is not None)  # The data are not ASCII-only
+
+        sample_start = max(0, first_non_ascii_byte.start() - self.__class__._SAMPLE_CONTEXT_BEFORE_NON_ASCII_BYTE)
+        return binary_data[sample_start:sample_start + self.__class__._MAX_SAMPLE_SIZE]
@@ -20,20 +20,55 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 
-from typing import Final
+from typing import Final, Optional, FrozenSet
+import collections
 import codecs
-import chardet
+from .EncodingDetectorIface import EncodingDetectorIface
+from .ChardetEncodingDetector import ChardetEncodingDetector
+from .exc.DecodingHelperBaseExc import DecodingHelperBaseExc
 from .exc.FailedToDecodeBinaryDataExc import FailedToDecodeBinaryDataExc
 from .exc.UnknownEncodingExc import UnknownEncodingExc
 from .exc.FailedToDetectEncodingExc import FailedToDetectEncodingExc
 
 
 class DecodingHelper:
-    _CHARDET_MINIMUM_ACCEPTABLE_CONFIDENCE: Final[float] = 0.2
+    _MAX_DETECTED_ENCODING_CACHE_SIZE: Final[int] = 4096
+    _SELF_VALIDATING_CODEC_NAMES: Final[FrozenSet[str]] = frozenset(("ascii", "utf-8", "utf-8-sig"))  # As returned by 'codecs.lookup()'
+
+    # The encodings detected for data with the same cache key (e.g. documents from the same host, which tend to use the
+    #  same encoding) are remembered - if the data can be decoded using the encoding last detected for the cache key,
+    #  the (costly) automatic detection is skipped.
+    # Only self-validating encodings (ASCII and UTF-8) are remembered, since data in another encoding can rarely be
+    #  decoded using them without errors. Single-byte encodings (e.g. 'cp1251') are able to decode almost any data, so
+    #  a successful decoding would not prove anything (e.g. a UTF-8 document from a host whose previous document was in
+    #  'cp1251' would be turned into mojibake). The same goes for the legacy multi-byte encodings among themselves -
+    #  e.g. 'shift_jis' or 'big5' data can usually be decoded as 'gb18030' without errors.
+    # If no encoding detector is specified, 'chardet' is used (see 'ChardetEncodingDetector'); 'charset-normalizer' can
+    #  be used instead (see 'CharsetNormalizerEncodingDetector').
+
+    def __init__(self, encoding_detector: Optional[EncodingDetectorIface] = None):
+        self._encoding_detector: Final[EncodingDetectorIface] = (ChardetEncodingDetector() if encoding_detector is None else encoding_detector)
+        self._detected_encoding_cache: Final[collections.OrderedDict[str, str]] = collections.OrderedDict()  # An LRU cache
+
+    def try_detecting_encoding_and_try_decoding_data_using_it(self, binary_data: bytes, detection_cache_key: Optional[str]) -> str:
+        if detection_cache_key is not None:
+            cached_encoding = self._detected_encoding_cache.get(detection_cache_key, None)
+            if cached_encoding is not None:
+                try:
+                    decoded_data = self.try_decoding_data_using_encoding(binary_data, cached_encoding, ignore_errors=False)
+                except DecodingHelperBaseExc:
+                    del self._detected_encoding_cache[detection_cache_key]
+                else:
+                    self._detected_encoding_cache.move_to_end(detection_cache_key)
+                    return decoded_data
 
-    def try_detecting_encoding_and_try_decoding_data_using_it(self, binary_data: bytes) -> str:
         detected_encoding = self._automatically_detect_encoding(binary_data)
-        return self.validate_encoding_and_try_decoding_data_using_it(binary_data, detected_encoding)
+        decoded_data = self.validate_encoding_and_try_decoding_data_using_it(binary_data, detected_encoding)
+
+        if (detection_cache_key is not None) and self._is_encoding_self_validating(detected_encoding):
+            self._put_detected_encoding_into_cache(detection_cache_key, self._normalize_encoding_name(detected_encoding))
+
+        return decoded_data
 
     def validate_encoding_and_try_decoding_data_using_it(self, binary_data: bytes, encoding_name: str) -> str:
         encoding_name = self._normalize_encoding_name(encoding_name)
@@ -57,10 +92,20 @@ class DecodingHelper:
         except LookupError:
             raise UnknownEncodingExc(encoding_name)
 
-    def _automatically_detect_encoding(self, binary_data: bytes) -> str:
-        chardet_result = chardet.detect(binary_data)
+    def _is_encoding_self_validating(self, encoding_name: str) -> bool:
+        # The encoding has already been validated
+        return codecs.lookup(self._normalize_encoding_name(encoding_name)).name in self.__class__._SELF_VALIDATING_CODEC_NAMES
 
-        if (chardet_result["encoding"] is None) or (chardet_result["confidence"] < self.__class__._CHARDET_MINIMUM_ACCEPTABLE_CONFIDENCE):
+    def _automatically_detect_encoding(self, binary_data: bytes) -> str:
+        detected_encoding = self._encoding_detector.detect_encoding(binary_data)
+        if detected_encoding is None:
             raise FailedToDetectEncodingExc()
 
-        return chardet_result["encoding"]
+        return detected_encoding
+
+    def _put_detected_encoding_into_cache(self, detection_cache_key: str, encoding_name: str) -> None:
+        self._detected_encoding_cache[detection_cache_key] = encoding_name
+        self._detected_encoding_cache.move_to_end(detection_cache_key)
+
+        while len(self._detected_encoding_cache) > self.__class__._MAX_DETECTED_ENCODING_CACHE_SIZE:
+            self._detected_encoding_cache.popitem(last=False)
@@ -0,0 +1,235 @@
+#!/bin/false
+
+# Copyright (c) 2022 Vít Labuda. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without modification, are permitted provided that the
+# following conditions are met:
+#  1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following
+#     disclaimer.
+#  2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the
+#     following disclaimer in the documentation and/or other materials provided with the distribution.
+#  3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote
+#     products derived from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES,
+# INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+from typing import Final, Optional, Tuple, Set
+import codecs
+from .exc.FailedToSniffEncodingExc import FailedToSniffEncodingExc
+
+
+class HTMLEncodingSniffingHelper:
+    # Determines the encoding of HTML documents from their binary data, following the byte order mark sniffing and the
+    #  prescan algorithm defined in the HTML Living Standard (https://html.spec.whatwg.org/multipage/parsing.html#prescan-a-byte-stream-to-determine-its-encoding),
+    #  so that the documents do not have to be decoded and parsed just to find out what encoding they use.
+
+    # The standard prescans only the first 1024 bytes; a slightly bigger part of the document is prescanned, since there
+    #  are pages which declare their encoding after a long <head> preamble
+    _PRESCANNED_BYTE_COUNT: Final[int] = 4096
+
+    _BYTE_ORDER_MARKS: Final[Tuple[Tuple[bytes, str], ...]] = (
+        (codecs.BOM_UTF8, "utf-8-sig"),  # The '-sig' and plain 'utf-16' codecs strip the byte order mark when decoding
+        (codecs.BOM_UTF16_BE, "utf-16"),
+        (codecs.BOM_UTF16_LE, "utf-16"),
+    )
+
+    _WHITESPACE_BYTES: Final[bytes] = b"\t\n\x0c\r "
+    _QUOTE_BYTES: Final[bytes] = b"\"'"
+
+    _UTF16_CODEC_NAMES: Final[Tuple[str, ...]] = ("utf-16", "utf-16-be", "utf-16-le")
+
+    def sniff_encoding_from_bom(self, binary_data: bytes) -> str:
+        for bom, encoding_name in self.__class__._BYTE_ORDER_MARKS:
+            if binary_data.startswith(bom):
+                return encoding_name
+
+        raise FailedToSniffEncodingExc()
+
+    def prescan_for_encoding(self, binary_data: bytes) -> str:
+        data = binary_data[:self.__class__._PRESCANNED_BYTE_COUNT]
+        data_length = len(data)
+        whitespace_bytes = self.__class__._WHITESPACE_BYTES
+
+        position = 0
+        while position < data_length:
+            if data.startswith(b"<!--", position):
+                position = data.find(b"-->", position + 2)
+                if position == -1:
+                    break
+                position += 2
+
+            elif (data[position:position + 5].lower() == b"<meta") and (len(data) > position + 5) and (data[position + 5:position + 6] in (whitespace_bytes + b"/")):
+                encoding_name, position = self._process_meta_element(data, position + 5)
+                if encoding_name is not None:
+                    return encoding_name
+
+            elif (data.startswith(b"<", position) and data[position + 1:position + 2].isalpha()) or (data.startswith(b"</", position) and data[position + 2:position + 3].isalpha()):
+                position += 1
+                while (position < data_length) and (data[position:position + 1] not in (whitespace_bytes + b">")):
+                    position += 1
+                position = self._skip_attributes(data, position)
+
+            elif data.startswith(b"<!", position) or data.startswith(b"</", position) or data.startswith(b"<?", position):
+                position = data.find(b">", position + 2)
+                if position == -1:
+                    break
+
+            position += 1
+
+        raise FailedToSniffEncodingExc()
+
+    def _skip_attributes(self, data: bytes, position: int) -> int:
+        while True:
+            attribute = self._get_attribute(data, position)
+            if attribute is None:
+                return position
+            _, _, position = attribute
+
+    def _process_meta_element(self, data: bytes, position: int) -> Tuple[Optional[str], int]:
+        # Returns the declared encoding's name (if any), and the position right after the element's attributes
+        attribute_names: Set[bytes] = set()
+        got_pragma = False
+        need_pragma = None
+        charset = None
+
+        while True:
+            attribute = self._get_attribute(data, position)
+            if attribute is None:
+                break
+            name, value, position = attribute
+
+            if name in attribute_names:
+                continue
+            attribute_names.add(name)
+
+            if name == b"http-equiv":
+                if value == b"content-type":
+                    got_pragma = True
+            elif name == b"content":
+                if charset is None:
+                    extracted_charset = self._extract_charset_from_content(value)
+                    if extracted_charset is not None:
+                        charset = extracted_charset
+                        need_pragma = True
+            elif name == b"charset":
+                if charset is None:  # A 'content' attribute preceding this one takes precedence
+                    charset = value
+                    need_pragma = False
+
+        if (need_pragma is None) or (need_pragma and not got_pragma) or (charset is None):
+            return None, position
+
+        return self._get_encoding_name_from_label(charset), position
+
+    def _get_attribute(self, data: bytes, position: int) -> Optional[Tuple[bytes, bytes, int]]:
+        # Returns the attribute's lowercased name and value, and the position right after the attribute, or None if there
+        #  are no more attributes in the current tag
+        data_length = len(data)
+        whitespace_bytes = self.__class__._WHITESPACE_BYTES
+
+        while (position < data_length) and (data[position:position + 1] in (whitespace_bytes + b"/")):
+            position += 1
+        if (position >= data_length) or (data[position:position + 1] == b">"):
+            return None
+
+        # Name
+        name_start = position
+        while True:
+            if position >= data_length:
+                return None
+            byte = data[position:position + 1]
+            if (byte == b"=") and (position > name_start):
+                name = data[name_start:position].lower()
+                position += 1
+                break
+            if byte in whitespace_bytes:
+                name = data[name_start:position].lower()
+                while (position < data_length) and (data[position:position + 1] in whitespace_bytes):
+                    position += 1
+                if data[position:position + 1] != b"=":
+                    return name, b"", position
+                position += 1
+                break
+            if byte in (b"/", b">"):
+                return data[name_start:position].lower(), b"", position
+            position += 1
+
+        # Value
+        while (position < data_length) and (data[position:position + 1] in whitespace_bytes):
+            position += 1
+        if position >= data_length:
+            return None
+
+        byte = data[position:position + 1]
+        if byte in self.__class__._QUOTE_BYTES:
+            value_end = data.find(byte, position + 1)
+            if value_end == -1:
+                return None
+            return name, data[position + 1:value_end].lower(), value_end + 1
+        if byte == b">":
+            return name, b"", position
+
+        value_start = position
+        while (position < data_length) and (data[position:position + 1] not in (whitespace_bytes + b">")):
+            position += 1
+        if position >= data_length:
+            return None
+        return name, data[value_start:position].lower(), position
+
+    def _extract_charset_from_content(self, content: bytes) -> Optional[bytes]:
+        # 'content' is already lowercased
+        content_length = len(content)
+        whitespace_bytes = self.__class__._WHITESPACE_BYTES
+
+        position = 0
+        while True:
+            position = content.find(b"charset", position)
+            if position == -1:
+                return None
+            position += 7
+
+            while (position < content_length) and (content[position:position + 1] in whitespace_bytes):
+                position += 1
+            if content[position:position + 1] == b"=":
+                break
+
+        position += 1
+        while (position < content_length) and (content[position:position + 1] in whitespace_bytes):
+            position += 1
+        if position >= content_length:
+            return None
+
+        byte = content[position:position + 1]
+        if byte in self.__class__._QUOTE_BYTES:
+            value_end = content.find(byte, position + 1)
+            if value_end == -1:
+                return None
+            return content[position + 1:value_end]
+
+        value_start = position
+        while (position < content_length) and (content[position:position + 1] not in (whitespace_bytes + b";")):
+            position += 1
+        return content[value_start:position]
+
+    def _get_encoding_name_from_label(self, label: bytes) -> Optional[str]:
+        try:
+            label_string = label.decode("ascii").strip()
+            if label_string == "x-user-defined":
+                return "windows-1252"
+
+            encoding_name = codecs.lookup(label_string).name
+        except (UnicodeError, LookupError):
+            return None
+
+        # An ASCII-compatible document (which is what a successful prescan implies) cannot be encoded in UTF-16
+        if encoding_name in self.__class__._UTF16_CODEC_NAMES:
+            return "utf-8"
+
+        return encoding_name
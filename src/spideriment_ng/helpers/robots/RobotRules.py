@@ -0,0 +1,124 @@
+#!/bin/false
+
+# Copyright (c) 2022 Vít Labuda. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without modification, are permitted provided that the
+# following conditions are met:
+#  1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following
+#     disclaimer.
+#  2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the
+#     following disclaimer in the documentation and/or other materials provided with the distribution.
+#  3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote
+#     products derived from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES,
+# INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+from __future__ import annotations
+from typing import Final, Sequence, Tuple
+import urllib.parse
+from spideriment_ng.helpers.robots.RobotRule import RobotRule
+
+
+class RobotRules:
+    # The rules of a robots.txt file which apply to the program, compiled for fast matching. A rule set is kept for
+    #  each distinct group of rules applying to (any of) the program's user agent names; a URL is allowed only if all
+    #  the rule sets allow it. In the vast majority of cases, there is at most one rule set.
+    # Within a rule set, the rule with the longest path pattern matching the URL wins; if an 'Allow' and a 'Disallow'
+    #  rule have equally long patterns, 'Allow' wins (RFC 9309). The rules of each set are ordered by priority, so the
+    #  first matching rule decides.
+    # Path patterns are matched without regular expressions - a pattern is split into the literal parts between its '*'
+    #  wildcards, which are looked up in the path from left to right. This takes linear time regardless of the number
+    #  of wildcards, whereas a backtracking regex engine may take exponential time on patterns like '/*a*a*a*a*b'
+    #  coming from untrusted robots.txt files.
+
+    _CompiledRule = Tuple[Tuple[str, ...], bool, bool]  # literal parts of the path pattern, anchored at end, allowed
+
+    def __init__(self, rule_sets: Sequence[Sequence[RobotRule]], crawling_delay: int):
+        assert (crawling_delay >= 0)
+
+        self._rule_sets: Final[Tuple[Tuple[RobotRule, ...], ...]] = tuple(tuple(rule_set) for rule_set in rule_sets if len(rule_set) > 0)
+        self._crawling_delay: Final[int] = crawling_delay  # Zero means that there is no delay
+        self._compiled_rule_sets: Final[Tuple[Tuple[RobotRules._CompiledRule, ...], ...]] = tuple(self._compile_rule_set(rule_set) for rule_set in self._rule_sets)
+
+    @classmethod
+    def generate_allow_all_rules(cls) -> RobotRules:
+        return cls(rule_sets=(), crawling_delay=0)
+
+    def get_rule_sets(self) -> Sequence[Sequence[RobotRule]]:
+        return self._rule_sets
+
+    def get_crawling_delay(self) -> int:  # Zero means that there is no delay
+        return self._crawling_delay
+
+    def is_url_allowed(self, url: str) -> bool:
+        if len(self._compiled_rule_sets) == 0:
+            return True
+
+        matched_path = self.normalize_url_path(url)
+        for compiled_rule_set in self._compiled_rule_sets:
+            for literal_parts, anchored_at_end, allowed in compiled_rule_set:
+                if self._does_path_pattern_match(literal_parts, anchored_at_end, matched_path):
+                    if not allowed:
+                        return False
+                    break
+
+        return True
+
+    @staticmethod
+    def normalize_url_path(url: str) -> str:
+        # Both the matched URL paths and the rules' path patterns are normalized in the same way, so different
+        #  percent-encodings of the same characters match each other
+        split_url = urllib.parse.urlsplit(url)
+        path = (split_url.path or "/")
+        if split_url.query:
+            path += ("?" + split_url.query)
+
+        return RobotRules.normalize_path_fragment(path)
+
+    @staticmethod
+    def normalize_path_fragment(path_fragment: str) -> str:
+        return urllib.parse.quote(urllib.parse.unquote(path_fragment), safe="/")
+
+    def _compile_rule_set(self, rule_set: Tuple[RobotRule, ...]) -> Tuple[RobotRules._CompiledRule, ...]:
+        prioritized_rules = sorted(rule_set, key=lambda rule: (-len(rule.get_path_pattern()), not rule.is_allowed()))
+
+        return tuple(self._compile_rule(rule) for rule in prioritized_rules)
+
+    def _compile_rule(self, rule: RobotRule) -> RobotRules._CompiledRule:
+        path_pattern = rule.get_path_pattern()
+        anchored_at_end = path_pattern.endswith("$")
+        if anchored_at_end:
+            path_pattern = path_pattern[:-1]
+
+        return tuple(path_pattern.split("*")), anchored_at_end, rule.is_allowed()
+
+    def _does_path_pattern_match(self, literal_parts: Tuple[str, ...], anchored_at_end: bool, path: str) -> bool:
+        # The first literal part must be at the start of the path. Each of the following ones is looked up at the leftmost
+        #  position after the previous one - if a part matches at a position, matching it further to the right cannot
+        #  help the parts after it. The last part of a pattern anchored at the end must be at the end of the path instead.
+        first_literal_part = literal_parts[0]
+        if not path.startswith(first_literal_part):
+            return False
+
+        position = len(first_literal_part)
+        if len(literal_parts) == 1:
+            return (not anchored_at_end) or (position == len(path))
+
+        for literal_part in literal_parts[1:-1]:
+            position = path.find(literal_part, position)
+            if position < 0:
+                return False
+            position += len(literal_part)
+
+        last_literal_part = literal_parts[-1]
+        if anchored_at_end:
+            return ((len(path) - len(last_literal_part)) >= position) and path.endswith(last_literal_part)
+
+        return path.find(last_literal_part, position) >= 0
@@ -0,0 +1,152 @@
+#!/bin/false
+
+# Copyright (c) 2022 Vít Labuda. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without modification, are permitted provided that the
+# following conditions are met:
+#  1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following
+#     disclaimer.
+#  2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the
+#     following disclaimer in the documentation and/or other materials provided with the distribution.
+#  3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote
+#     products derived from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES,
+# INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+from typing import Final, Optional, Sequence, List, Tuple
+import re
+import math
+from spideriment_ng.helpers.robots.RobotRule import RobotRule
+from spideriment_ng.helpers.robots.RobotRules import RobotRules
+from spideriment_ng.helpers.robots._RobotGroup import _RobotGroup
+
+
+class RobotRulesCompiler:
+    # Parses robots.txt files and compiles the rules which apply to any of the specified user agent names.
+    # Consecutive 'User-agent' lines start a group of rules. A group applies to a user agent name if one of its
+    #  'User-agent' values (case-insensitively) is a substring of the name (as in 'urllib.robotparser'); the rules of
+    #  all the groups applying to a name are combined. If no group applies to a name, the '*' groups are used instead.
+    # The '*' and '$' wildcards in paths are supported. 'Crawl-delay' and 'Request-rate' are translated to a crawling
+    #  delay in seconds; the longest of the delays applying to any of the user agent names is used.
+
+    _DEFAULT_USER_AGENT: Final[str] = "*"
+    _MAX_WILDCARDS_PER_RULE: Final[int] = 32
+    # Longer delays are capped, so they still fit into an unsigned 32-bit integer (see '_RobotRulesSerializer'); they
+    #  are far longer than any sane 'max_crawling_delay' limit, so the crawler refuses them nevertheless
+    _MAX_CRAWLING_DELAY: Final[int] = (2 ** 32) - 1
+
+    def __init__(self, user_agents: Sequence[str]):
+        assert (len(user_agents) > 0)
+
+        self._user_agents: Final[Tuple[str, ...]] = tuple(dict.fromkeys(user_agent.lower() for user_agent in user_agents))  # Deduplicated, in the original order
+
+    def compile_robots_txt(self, robots_txt: str) -> RobotRules:
+        groups = self._parse_robots_txt_into_groups(robots_txt)
+
+        rule_sets = []
+        crawling_delay = 0
+        for user_agent in self._user_agents:
+            applying_groups = self._get_groups_applying_to_user_agent(groups, user_agent)
+
+            rule_set = tuple(dict.fromkeys(rule for group in applying_groups for rule in group.get_rules()))
+            if rule_set not in rule_sets:  # Many user agent names usually share the same rules
+                rule_sets.append(rule_set)
+
+            crawling_delay = max([crawling_delay] + [group.get_crawling_delay() for group in applying_groups])
+
+        return RobotRules(rule_sets=rule_sets, crawling_delay=crawling_delay)
+
+    def _parse_robots_txt_into_groups(self, robots_txt: str) -> List[_RobotGroup]:
+        groups = []
+        current_group = None
+        previous_line_was_user_agent = False
+
+        for line in robots_txt.lstrip("\ufeff").splitlines():
+            line = line.split("#", 1)[0].strip()
+            key, separator, value = line.partition(":")
+            if not separator:
+                continue
+
+            key = key.strip().lower()
+            value = value.strip()
+
+            if key == "user-agent":
+                if (current_group is None) or (not previous_line_was_user_agent):
+                    current_group = _RobotGroup()
+                    groups.append(current_group)
+                current_group.add_user_agent(value.lower())
+                previous_line_was_user_agent = True
+                continue
+
+            if key not in ("allow", "disallow", "crawl-delay", "request-rate"):
+                continue  # e.g. 'Sitemap', which does not belong to any group
+            previous_line_was_user_agent = False
+
+            if current_group is None:
+                continue  # Rules before the first 'User-agent' line do not belong to any group
+
+            if key in ("allow", "disallow"):
+                rule = self._parse_rule(value, allowed=(key == "allow"))
+                if rule is not None:
+                    current_group.add_rule(rule)
+            elif key == "crawl-delay":
+                current_group.extend_crawling_delay(self._parse_crawl_delay(value))
+            else:
+                current_group.extend_crawling_delay(self._parse_request_rate(value))
+
+        return groups
+
+    def _parse_rule(self, path_pattern: str, allowed: bool) -> Optional[RobotRule]:
+        if len(path_pattern) == 0:
+            return None  # An empty rule does not match anything
+
+        anchored_at_end = path_pattern.endswith("$")
+        if anchored_at_end:
+            path_pattern = path_pattern[:-1]
+
+        # Consecutive wildcards are equivalent to a single one. Rules with an excessive number of wildcards are ignored,
+        #  as they are not written by people, and matching them would be needlessly costly (see 'RobotRules').
+        path_pattern = re.sub(r'\*{2,}', "*", path_pattern)
+        if path_pattern.count("*") > self.__class__._MAX_WILDCARDS_PER_RULE:
+            return None
+
+        normalized_path_pattern = "*".join(RobotRules.normalize_path_fragment(literal_part) for literal_part in path_pattern.split("*"))
+        if anchored_at_end:
+            normalized_path_pattern += "$"
+
+        return RobotRule(normalized_path_pattern, allowed)
+
+    def _parse_crawl_delay(self, value: str) -> int:
+        try:
+            crawl_delay = math.ceil(min(float(value), self.__class__._MAX_CRAWLING_DELAY))  # Infinity is capped as well
+        except (ValueError, OverflowError):  # NaN
+            return 0
+
+        return max(crawl_delay, 0)
+
+    def _parse_request_rate(self, value: str) -> int:
+        requests, separator, seconds = value.partition("/")
+        if (not separator) or (not requests.strip().isdigit()) or (not seconds.strip().isdigit()):
+            return 0
+
+        try:
+            return min(math.ceil(int(seconds) / int(requests)), self.__class__._MAX_CRAWLING_DELAY)
+        except (ZeroDivisionError, OverflowError):
+            return 0
+
+    def _get_groups_applying_to_user_agent(self, groups: List[_RobotGroup], user_agent: str) -> List[_RobotGroup]:
+        applying_groups = [group for group in groups if any(self._does_group_user_agent_apply(group_user_agent, user_agent) for group_user_agent in group.get_user_agents())]
+        if len(applying_groups) > 0:
+            return applying_groups
+
+        return [group for group in groups if self.__class__._DEFAULT_USER_AGENT in group.get_user_agents()]
+
+    def _does_group_user_agent_apply(self, group_user_agent: str, user_agent: str) -> bool:
+        return (len(group_user_agent) > 0) and (group_user_agent != self.__class__._DEFAULT_USER_AGENT) and (group_user_agent in user_agent)
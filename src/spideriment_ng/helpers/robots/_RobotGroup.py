@@ -0,0 +1,51 @@
+#!/bin/false
+
+# Copyright (c) 2022 Vít Labuda. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without modification, are permitted provided that the
+# following conditions are met:
+#  1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following
+#     disclaimer.
+#  2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the
+#     following disclaimer in the documentation and/or other materials provided with the distribution.
+#  3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote
+#     products derived from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES,
+# INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+from typing import Final, List, Sequence
+from spideriment_ng.helpers.robots.RobotRule import RobotRule
+
+
+class _RobotGroup:
+    # A group of robots.txt rules being parsed.
+
+    def __init__(self):
+        self._user_agents: Final[List[str]] = []
+        self._rules: Final[List[RobotRule]] = []
+        self._crawling_delay: int = 0
+
+    def add_user_agent(self, user_agent: str) -> None:
+        self._user_agents.append(user_agent)
+
+    def add_rule(self, rule: RobotRule) -> None:
+        self._rules.append(rule)
+
+    def extend_crawling_delay(self, crawling_delay: int) -> None:
+        self._crawling_delay = max(self._crawling_delay, crawling_delay)
+
+    def get_user_agents(self) -> Sequence[str]:
+        return self._user_agents
+
+    def get_rules(self) -> Sequence[RobotRule]:
+        return self._rules
+
+    def get_crawling_delay(self) -> int:
+        return self._crawling_delay
@@ -0,0 +1,81 @@
+#!/bin/false
+
+# Copyright (c) 2022 Vít Labuda. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without modification, are permitted provided that the
+# following conditions are met:
+#  1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following
+#     disclaimer.
+#  2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the
+#     following disclaimer in the documentation and/or other materials provided with the distribution.
+#  3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote
+#     products derived from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES,
+# INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+from __future__ import annotations
+from typing import Final, Sequence, Any, Callable
+import asyncio
+import concurrent.futures
+import sqlite3
+
+
+class SQLiteDatabaseThread:
+    # Since the 'sqlite3' module is blocking, all the operations with a SQLite database are carried out in a dedicated
+    #  thread, which owns the database connection (a connection must be used only by the thread which has created it);
+    #  this also serializes the operations of the worker process's tasks.
+    # The database is operated in the WAL mode, so readers do not block the writer. The 'sqlite3' module's own
+    #  transaction handling is disabled - the users of the connection either start and end transactions explicitly, or
+    #  let each statement be carried out in its own implicit transaction.
+
+    def __init__(self, thread_executor: concurrent.futures.ThreadPoolExecutor, database_connection: sqlite3.Connection):
+        self._thread_executor: Final[concurrent.futures.ThreadPoolExecutor] = thread_executor
+        self._database_connection: Final[sqlite3.Connection] = database_connection
+
+    @classmethod
+    async def open(cls, database_file_path: str, busy_timeout: int, initialization_queries: Sequence[str]) -> SQLiteDatabaseThread:
+        """
+        :raises sqlite3.Error
+        """
+
+        thread_executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        try:
+            database_connection = await asyncio.get_running_loop().run_in_executor(thread_executor, cls._open_database_connection, database_file_path, busy_timeout, initialization_queries)
+        except sqlite3.Error as e:
+            thread_executor.shutdown(wait=False)
+            raise e
+
+        return cls(thread_executor, database_connection)
+
+    @staticmethod
+    def _open_database_connection(database_file_path: str, busy_timeout: int, initialization_queries: Sequence[str]) -> sqlite3.Connection:
+        database_connection = sqlite3.connect(database_file_path, timeout=busy_timeout, isolation_level=None)
+
+        try:
+            database_connection.execute("PRAGMA journal_mode = WAL;")
+            database_connection.execute("PRAGMA synchronous = NORMAL;")  # Safe in the WAL mode (only durability may be lost on power failure)
+            for initialization_query in initialization_queries:
+                database_connection.execute(initialization_query)
+        except Exception as e:
+            database_connection.close()
+            raise e
+
+        return database_connection
+
+    async def close(self) -> None:
+        await self.run(self._database_connection.close)
+        self._thread_executor.shutdown(wait=True)
+
+    async def run(self, func: Callable, *args) -> Any:
+        return await asyncio.get_running_loop().run_in_executor(self._thread_executor, func, *args)
+
+    # The connection must be used only by functions which are being run in the database thread (see 'run()')!
+    def get_database_connection(self) -> sqlite3.Connection:
+        return self._database_connection
@@ -21,7 +21,7 @@
 
 
 from __future__ import annotations
-from typing import Any
+from typing import Any, Dict
 import abc
 from spideriment_ng.modules.ModuleInfo import ModuleInfo
 
@@ -51,3 +51,8 @@ class ModuleIface(metaclass=abc.ABCMeta):
         """
 
         raise NotImplementedError(self.__class__.destroy_instance.__qualname__)
+
+    def get_statistics(self) -> Dict[str, int]:
+        # Counters describing the work of the instance (e.g. cache hits), which are logged when the worker process is
+        #  terminating; modules which do not count anything do not have to override this method
+        return dict()
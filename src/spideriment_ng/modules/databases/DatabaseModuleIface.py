@@ -20,13 +20,12 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 
-from typing import Sequence, Optional
+from typing import Sequence
 import abc
 from spideriment_ng.helpers.containers.document.URLContainer import URLContainer
-from spideriment_ng.helpers.containers.document.DocumentContainer import DocumentContainer
-from spideriment_ng.helpers.CrawlingErrorReason import CrawlingErrorReason
 from spideriment_ng.modules.ModuleIface import ModuleIface
 from spideriment_ng.modules.databases.CrawledURLHandleIface import CrawledURLHandleIface
+from spideriment_ng.modules.databases.crawlingresults.CrawlingResultBase import CrawlingResultBase
 
 
 class DatabaseModuleIface(ModuleIface, metaclass=abc.ABCMeta):
@@ -41,42 +40,34 @@ class DatabaseModuleIface(ModuleIface, metaclass=abc.ABCMeta):
 
         raise NotImplementedError(self.__class__.announce_start_urls.__qualname__)
 
-    @abc.abstractmethod
-    async def get_url_to_crawl(self) -> CrawledURLHandleIface:
+    @abc.abstractmethod  # At least one and at most 'max_url_count' URLs are returned.
+    async def get_urls_to_crawl(self, max_url_count: int) -> Sequence[CrawledURLHandleIface]:
         """
         :raises DatabaseModuleBaseExc
         """
 
-        raise NotImplementedError(self.__class__.get_url_to_crawl.__qualname__)
+        raise NotImplementedError(self.__class__.get_urls_to_crawl.__qualname__)
 
-    @abc.abstractmethod  # The redirected URL must be different from the original URL!
-    async def announce_redirected_url(self, original_url: CrawledURLHandleIface, validated_absolute_redirected_url: URLContainer) -> CrawledURLHandleIface:
+    @abc.abstractmethod  # Returns URLs obtained using 'get_urls_to_crawl()' which will not be crawled (e.g. on shutdown).
+    async def release_urls_to_crawl(self, unused_urls: Sequence[CrawledURLHandleIface]) -> None:
         """
         :raises DatabaseModuleBaseExc
         """
 
-        raise NotImplementedError(self.__class__.announce_redirected_url.__qualname__)
+        raise NotImplementedError(self.__class__.release_urls_to_crawl.__qualname__)
 
-    @abc.abstractmethod
-    async def finish_crawling_with_delay(self, original_url: CrawledURLHandleIface, delay_seconds: int) -> None:
-        """
-        :raises DatabaseModuleBaseExc
-        """
-
-        raise NotImplementedError(self.__class__.finish_crawling_with_delay.__qualname__)
-
-    @abc.abstractmethod
-    async def finish_crawling_with_error(self, original_url: CrawledURLHandleIface, redirected_url: Optional[CrawledURLHandleIface], error_reason: CrawlingErrorReason) -> None:
+    @abc.abstractmethod  # The redirected URL must be different from the original URL!
+    async def announce_redirected_url(self, original_url: CrawledURLHandleIface, validated_absolute_redirected_url: URLContainer) -> CrawledURLHandleIface:
         """
         :raises DatabaseModuleBaseExc
         """
 
-        raise NotImplementedError(self.__class__.finish_crawling_with_error.__qualname__)
+        raise NotImplementedError(self.__class__.announce_redirected_url.__qualname__)
 
-    @abc.abstractmethod
-    async def finish_crawling_with_success(self, original_url: CrawledURLHandleIface, redirected_url: Optional[CrawledURLHandleIface], validated_document: DocumentContainer) -> None:
+    @abc.abstractmethod  # All the results should be stored at once (e.g. in a single transaction), if possible.
+    async def finish_crawling(self, crawling_results: Sequence[CrawlingResultBase]) -> None:
         """
         :raises DatabaseModuleBaseExc
         """
 
-        raise NotImplementedError(self.__class__.finish_crawling_with_success.__qualname__)
+        raise NotImplementedError(self.__class__.finish_crawling.__qualname__)
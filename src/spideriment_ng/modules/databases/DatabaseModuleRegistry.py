@@ -24,11 +24,13 @@ from typing import Final, Tuple, Sequence, Type
 from spideriment_ng.modules._ModuleRegistryDefaultBase import _ModuleRegistryDefaultBase
 from spideriment_ng.modules.databases.DatabaseModuleIface import DatabaseModuleIface
 from spideriment_ng.modules.databases.mysql.MySQLDatabaseModule import MySQLDatabaseModule
+from spideriment_ng.modules.databases.sqlite.SQLiteDatabaseModule import SQLiteDatabaseModule
 
 
 class DatabaseModuleRegistry(_ModuleRegistryDefaultBase):
     _DATABASE_MODULES: Final[Tuple[Type[DatabaseModuleIface], ...]] = (
         MySQLDatabaseModule,
+        SQLiteDatabaseModule,
     )
 
     @classmethod
@@ -21,31 +21,39 @@
 
 
 from __future__ import annotations
-from typing import Final, Optional, Sequence, Tuple, Any, Callable
+from typing import Final, Optional, Sequence, Tuple, Dict, Any, Callable
 import enum
+import asyncio
 import functools
 import warnings
 import os.path
 import glob
+import itertools
 import contextlib
 import aiomysql
+import pymysql
 from datalidator.blueprints.impl.ObjectBlueprint import ObjectBlueprint
 from spideriment_ng.SpiderimentConstants import SpiderimentConstants
 from spideriment_ng.helpers.FlagCarrier import FlagCarrier
-from spideriment_ng.helpers.CrawlingErrorReason import CrawlingErrorReason
-from spideriment_ng.helpers.containers.document.DocumentContainer import DocumentContainer
 from spideriment_ng.helpers.containers.document.URLContainer import URLContainer
 from spideriment_ng.modules.ModuleInfo import ModuleInfo
 from spideriment_ng.modules.ModuleType import ModuleType
 from spideriment_ng.modules.databases.CrawledURLHandleIface import CrawledURLHandleIface
 from spideriment_ng.modules.databases.DatabaseModuleIface import DatabaseModuleIface
+from spideriment_ng.modules.databases.crawlingresults.CrawlingResultBase import CrawlingResultBase
+from spideriment_ng.modules.databases.crawlingresults.CrawlingDelayResult import CrawlingDelayResult
+from spideriment_ng.modules.databases.crawlingresults.CrawlingErrorResult import CrawlingErrorResult
+from spideriment_ng.modules.databases.crawlingresults.CrawlingSuccessResult import CrawlingSuccessResult
 from spideriment_ng.modules.databases.mysql._MySQLDatabaseModuleConfigModel import _MySQLDatabaseModuleConfigModel
+from spideriment_ng.modules.databases.mysql._MySQLLeaseOptionsValidator import _MySQLLeaseOptionsValidator
 from spideriment_ng.modules.databases.mysql._MySQLCrawledURLHandle import _MySQLCrawledURLHandle
+from spideriment_ng.modules.databases.mysql._MySQLIDCache import _MySQLIDCache
 from spideriment_ng.modules.databases.mysql._constants.Database import Database  # noqa
 from spideriment_ng.modules.databases.mysql._constants.EnumValues import EnumValues  # noqa
 from spideriment_ng.modules.databases.mysql._constants.Functions import Functions  # noqa
 from spideriment_ng.modules.databases.mysql._constants.Procedures import Procedures  # noqa
 from spideriment_ng.modules.databases.mysql._constants.SelectQueries import SelectQueries  # noqa
+from spideriment_ng.modules.databases.mysql._constants.BulkInsertQueries import BulkInsertQueries  # noqa
 from spideriment_ng.modules.databases.mysql.exc.MySQLDatabaseModuleBaseExc import MySQLDatabaseModuleBaseExc
 from spideriment_ng.modules.databases.mysql.exc.MySQLConnectionFailureExc import MySQLConnectionFailureExc
 from spideriment_ng.modules.databases.mysql.exc.MySQLDisconnectionFailureExc import MySQLDisconnectionFailureExc
@@ -54,6 +62,7 @@ from spideriment_ng.modules.databases.mysql.exc.MySQLResultFetchFailureExc impor
 from spideriment_ng.modules.databases.mysql.exc.MySQLNoMoreLinksToCrawlExc import MySQLNoMoreLinksToCrawlExc
 from spideriment_ng.modules.databases.mysql.exc.MySQLUnacceptableRedirectedURLExc import MySQLUnacceptableRedirectedURLExc
 from spideriment_ng.modules.databases.mysql.exc.MySQLLockingFailureExc import MySQLLockingFailureExc
+from spideriment_ng.modules.databases.mysql.exc.MySQLCrawlerNotRegisteredExc import MySQLCrawlerNotRegisteredExc
 
 
 # Decorator
@@ -70,6 +79,25 @@ def _mysql_async_exception_handling_context(func: Callable) -> Callable:
     return _async_exception_handling_wrapper_function
 
 
+# Decorator
+def _mysql_async_transaction_retrying_context(func: Callable) -> Callable:
+    # When the global lock is not used, concurrent transactions may deadlock or time out while waiting for row locks. In
+    #  such a case, the failed transaction has been rolled back as a whole, so the operation is simply carried out again.
+    @functools.wraps(func)
+    async def _async_transaction_retrying_wrapper_function(self, *args, **kwargs) -> Any:
+        attempt = 1
+        while True:
+            try:
+                return await func(self, *args, **kwargs)
+            except pymysql.err.MySQLError as e:
+                if (attempt >= Database.MAX_TRANSACTION_ATTEMPTS) or (len(e.args) < 1) or (e.args[0] not in Database.RETRIABLE_TRANSACTION_ERROR_CODES):
+                    raise e
+
+            attempt += 1
+
+    return _async_transaction_retrying_wrapper_function
+
+
 class MySQLDatabaseModule(DatabaseModuleIface):
     class _ModuleState(enum.Enum):
         UNPREPARED = 10
@@ -80,25 +108,45 @@ class MySQLDatabaseModule(DatabaseModuleIface):
     _MODULE_INFO: Final[ModuleInfo] = ModuleInfo(
         type_=ModuleType.DATABASE,
         name="mysql",
-        configuration_blueprint=ObjectBlueprint(_MySQLDatabaseModuleConfigModel)
+        configuration_blueprint=ObjectBlueprint(_MySQLDatabaseModuleConfigModel, validators=(_MySQLLeaseOptionsValidator(),))
     )
 
     # NOTE: This module does not support recrawling of documents (a URL may be crawled only once) and ensures that only
     #  one worker task globally (!) can crawl a specific URL at the same time. However, this behaviour is not required
     #  and/or enforced by the rest of this program in any way - a fully working database module which does not behave
     #  in the aforementioned ways could be implemented.
+    # By default, all the operations are serialized using a global (named) lock. If it is disabled, URLs are claimed
+    #  using row locks ('SELECT ... FOR UPDATE SKIP LOCKED' and atomic DELETEs), and operations of different worker tasks
+    #  and crawler instances are carried out concurrently.
+    # The IDs of filetypes, languages, authors, keywords, links and images are cached in each worker process (in separate
+    #  LRU caches), so the values which repeat across documents do not have to be looked up in the database again.
+    # Each crawler (i.e. worker process) periodically sends heartbeats to the database. If a crawler stops sending them
+    #  (e.g. because its process has been killed), the links it has leased are eventually returned to the crawl frontier
+    #  by the other crawlers, so they do not stay stuck in the 'currently_crawled_links' table forever.
 
     @classmethod
     def get_module_info(cls) -> ModuleInfo:
         return cls._MODULE_INFO
 
-    def __init__(self, mysql_client: aiomysql.Pool, mysql_host: str, mysql_port: int, instance_name: str):
+    def __init__(self, mysql_client: aiomysql.Pool, mysql_host: str, mysql_port: int, use_global_lock: bool, id_cache_size: int, lease_heartbeat_interval: int, lease_timeout: int, instance_name: str):
         self._mysql_client: Final[aiomysql.Pool] = mysql_client
         self._mysql_host: Final[str] = mysql_host
         self._mysql_port: Final[int] = mysql_port
+        self._use_global_lock: Final[bool] = use_global_lock
+        self._filetype_id_cache: Final[_MySQLIDCache] = _MySQLIDCache(id_cache_size)
+        self._language_id_cache: Final[_MySQLIDCache] = _MySQLIDCache(id_cache_size)
+        self._author_id_cache: Final[_MySQLIDCache] = _MySQLIDCache(id_cache_size)
+        self._keyword_id_cache: Final[_MySQLIDCache] = _MySQLIDCache(id_cache_size)
+        self._link_id_cache: Final[_MySQLIDCache] = _MySQLIDCache(id_cache_size)
+        self._image_id_cache: Final[_MySQLIDCache] = _MySQLIDCache(id_cache_size)
+        self._id_caches: Final[Tuple[_MySQLIDCache, ...]] = (self._filetype_id_cache, self._language_id_cache, self._author_id_cache, self._keyword_id_cache, self._link_id_cache, self._image_id_cache)
+        self._lease_heartbeat_interval: Final[int] = lease_heartbeat_interval
+        self._lease_timeout: Final[int] = lease_timeout
         self._instance_name: Final[str] = instance_name
         self._state: MySQLDatabaseModule._ModuleState = self.__class__._ModuleState.UNPREPARED
         self._active_crawler_id: Optional[int] = None
+        self._lease_heartbeat_task: Optional[asyncio.Task] = None
+        self._lease_heartbeat_exception: Optional[MySQLDatabaseModuleBaseExc] = None
 
     @classmethod
     async def create_instance(cls, module_options: _MySQLDatabaseModuleConfigModel, instance_name: str) -> MySQLDatabaseModule:
@@ -118,7 +166,7 @@ class MySQLDatabaseModule(DatabaseModuleIface):
         except Exception as f:  # It is not clear what exceptions does 'aiomysql' raise
             raise MySQLConnectionFailureExc(mysql_host, mysql_port, str(f))
 
-        module_instance = cls(mysql_client, mysql_host, mysql_port, instance_name)
+        module_instance = cls(mysql_client, mysql_host, mysql_port, module_options.use_global_lock, module_options.id_cache_size, module_options.lease_heartbeat_interval, module_options.lease_timeout, instance_name)
         await module_instance._prepare_database_on_client_connection()
 
         return module_instance
@@ -151,6 +199,7 @@ class MySQLDatabaseModule(DatabaseModuleIface):
         try:
             await self._create_database_objects()
             await self._register_active_crawler()
+            self._start_lease_heartbeat_task()
         except Exception as e:
             self._state = self.__class__._ModuleState.BROKEN
             raise e
@@ -184,11 +233,66 @@ class MySQLDatabaseModule(DatabaseModuleIface):
             )
             success_flag_carrier.set(True)  # If all the previous code succeeds... (i.e. it does not raise an exception)
 
+    def _start_lease_heartbeat_task(self) -> None:
+        assert (self._lease_heartbeat_task is None)
+
+        self._lease_heartbeat_task = asyncio.create_task(self._send_lease_heartbeats_periodically())
+
+    async def _stop_lease_heartbeat_task(self) -> None:
+        assert (self._lease_heartbeat_task is not None)
+
+        self._lease_heartbeat_task.cancel()
+        await asyncio.wait((self._lease_heartbeat_task,))
+        self._lease_heartbeat_task = None
+
+    def _raise_lease_heartbeat_exception_if_any(self) -> None:
+        if self._lease_heartbeat_exception is not None:
+            raise self._lease_heartbeat_exception
+
+    async def _send_lease_heartbeats_periodically(self) -> None:
+        while True:
+            await asyncio.sleep(self._lease_heartbeat_interval)
+
+            # If the database cannot be reached or locked at the moment, the heartbeat is simply sent again in the next
+            #  iteration (the lease timeout is guaranteed to be longer than the heartbeat interval). Other failures (e.g.
+            #  the crawler's leases having been reclaimed by another crawler) are permanent, so the heartbeats are stopped
+            #  and the failure is reported by the next operation which needs the leases, which stops the worker process.
+            try:
+                await self._send_lease_heartbeat_and_reclaim_expired_leases()
+            except (MySQLCommunicationFailureExc, MySQLLockingFailureExc):
+                pass
+            except MySQLDatabaseModuleBaseExc as e:
+                self._lease_heartbeat_exception = e
+                return
+
+    @_mysql_async_exception_handling_context
+    @_mysql_async_transaction_retrying_context
+    async def _send_lease_heartbeat_and_reclaim_expired_leases(self) -> None:
+        assert (self._active_crawler_id is not None)
+
+        async with self._safe_mysql_cursor() as (cursor, success_flag_carrier):
+            crawler_registered = await self._call_mysql_function(
+                cursor=cursor,
+                function_name=Functions.SEND_ACTIVE_CRAWLER_HEARTBEAT,
+                args=(self._active_crawler_id,),
+                result_filter=bool
+            )
+            if not crawler_registered:
+                raise MySQLCrawlerNotRegisteredExc(self._active_crawler_id)
+
+            await self._call_mysql_procedure(
+                cursor=cursor,
+                procedure_name=Procedures.RECLAIM_EXPIRED_LEASES,
+                args=(self._lease_timeout,)
+            )
+            success_flag_carrier.set(True)  # If all the previous code succeeds... (i.e. it does not raise an exception)
+
     @_mysql_async_exception_handling_context
     async def _cleanup_database_on_client_disconnection(self) -> None:
         assert (self._state == self.__class__._ModuleState.OPERATIONAL)
 
         try:
+            await self._stop_lease_heartbeat_task()
             await self._unregister_active_crawler()
         except Exception as e:
             self._state = self.__class__._ModuleState.BROKEN
@@ -199,17 +303,26 @@ class MySQLDatabaseModule(DatabaseModuleIface):
     async def _unregister_active_crawler(self) -> None:
         assert (self._active_crawler_id is not None)
 
-        async with self._safe_mysql_cursor() as (cursor, success_flag_carrier):
-            await self._call_mysql_procedure(
-                cursor=cursor,
-                procedure_name=Procedures.UNREGISTER_ACTIVE_CRAWLER,
-                args=(self._active_crawler_id,)
-            )
-            success_flag_carrier.set(True)  # If all the previous code succeeds... (i.e. it does not raise an exception)
+        # A crawler whose leases have expired has already been unregistered by the crawler which reclaimed them
+        if not isinstance(self._lease_heartbeat_exception, MySQLCrawlerNotRegisteredExc):
+            async with self._safe_mysql_cursor() as (cursor, success_flag_carrier):
+                await self._call_mysql_procedure(
+                    cursor=cursor,
+                    procedure_name=Procedures.UNREGISTER_ACTIVE_CRAWLER,
+                    args=(self._active_crawler_id,)
+                )
+                success_flag_carrier.set(True)  # If all the previous code succeeds... (i.e. it does not raise an exception)
 
         self._active_crawler_id = None
 
+    def get_statistics(self) -> Dict[str, int]:
+        return {
+            "id_cache_hits": sum(id_cache.get_hit_count() for id_cache in self._id_caches),
+            "id_cache_misses": sum(id_cache.get_miss_count() for id_cache in self._id_caches)
+        }
+
     @_mysql_async_exception_handling_context
+    @_mysql_async_transaction_retrying_context
     async def announce_start_urls(self, validated_absolute_start_urls: Sequence[URLContainer]) -> None:
         assert (self._state == self.__class__._ModuleState.OPERATIONAL)
         assert (len(validated_absolute_start_urls) > 0)
@@ -226,52 +339,73 @@ class MySQLDatabaseModule(DatabaseModuleIface):
             success_flag_carrier.set(True)  # If all the previous code succeeds... (i.e. it does not raise an exception)
 
     @_mysql_async_exception_handling_context
-    async def get_url_to_crawl(self) -> CrawledURLHandleIface:
+    @_mysql_async_transaction_retrying_context
+    async def get_urls_to_crawl(self, max_url_count: int) -> Sequence[CrawledURLHandleIface]:
         assert (self._state == self.__class__._ModuleState.OPERATIONAL)
         assert (self._active_crawler_id is not None)
+        assert (max_url_count > 0)
+
+        self._raise_lease_heartbeat_exception_if_any()
 
+        # The links are obtained using a single procedure call (instead of calling the link-getting functions and fetching
+        #  the URL for each link separately), so the number of round-trips and lock acquisitions per link is minimized
         async with self._safe_mysql_cursor() as (cursor, success_flag_carrier):
-            delayed = True
-            link_id = await self._call_mysql_function(
+            result_rows = await self._call_mysql_procedure_and_fetch_result_rows(
                 cursor=cursor,
-                function_name=Functions.GET_LINK_TO_CRAWL_FROM_DELAYED_LINKS,
-                args=(self._active_crawler_id,),
-                result_filter=self._none_or_int_result_filter
+                procedure_name=Procedures.GET_LINKS_TO_CRAWL,
+                args=(self._active_crawler_id, max_url_count)
             )
-            if link_id is None:
-                delayed = False
-                link_id = await self._call_mysql_function(
-                    cursor=cursor,
-                    function_name=Functions.GET_LINK_TO_CRAWL_FROM_LINKS,
-                    args=(self._active_crawler_id,),
-                    result_filter=self._none_or_int_result_filter
-                )
-                if link_id is None:
-                    raise MySQLNoMoreLinksToCrawlExc()
+            if len(result_rows) == 0:
+                raise MySQLNoMoreLinksToCrawlExc()
 
-            link_url = await self._run_select_query_and_fetch_result(
-                cursor=cursor,
-                query=SelectQueries.GET_URL_BY_LINK_ID,
-                args=(link_id,),
-                result_filter=str
-            )
+            try:
+                url_handles = [
+                    _MySQLCrawledURLHandle(
+                        link_id=int(link_id),
+                        url_in_container=URLContainer(validated=False, certainly_absolute=True, url=str(link_url)),
+                        delayed=bool(delayed),
+                        redirected=False
+                    ) for link_id, link_url, delayed in result_rows
+                ]
+            except Exception:
+                raise MySQLResultFetchFailureExc(Procedures.GET_LINKS_TO_CRAWL)
 
             success_flag_carrier.set(True)  # If all the previous code succeeds... (i.e. it does not raise an exception)
 
-        return _MySQLCrawledURLHandle(
-            link_id=link_id,
-            url_in_container=URLContainer(validated=False, certainly_absolute=True, url=link_url),
-            delayed=delayed,
-            redirected=False
-        )
+        assert (len(url_handles) <= max_url_count)
+        return url_handles
+
+    @_mysql_async_exception_handling_context
+    @_mysql_async_transaction_retrying_context
+    async def release_urls_to_crawl(self, unused_urls: Sequence[CrawledURLHandleIface]) -> None:
+        assert (self._state == self.__class__._ModuleState.OPERATIONAL)
+        for url in unused_urls:
+            assert (isinstance(url, _MySQLCrawledURLHandle) and (not url.is_redirected()))
+
+        self._raise_lease_heartbeat_exception_if_any()
+
+        if len(unused_urls) == 0:
+            return
+
+        async with self._safe_mysql_cursor() as (cursor, success_flag_carrier):
+            for unused_url in unused_urls:
+                await self._call_mysql_procedure(
+                    cursor=cursor,
+                    procedure_name=Procedures.RELEASE_LINK_TO_CRAWL,
+                    args=(unused_url.get_link_id(), unused_url.was_delayed())
+                )
+            success_flag_carrier.set(True)  # If all the previous code succeeds... (i.e. it does not raise an exception)
 
     @_mysql_async_exception_handling_context
+    @_mysql_async_transaction_retrying_context
     async def announce_redirected_url(self, original_url: CrawledURLHandleIface, validated_absolute_redirected_url: URLContainer) -> CrawledURLHandleIface:
         assert (self._state == self.__class__._ModuleState.OPERATIONAL)
         assert (self._active_crawler_id is not None)
         assert (isinstance(original_url, _MySQLCrawledURLHandle) and (not original_url.is_redirected()))
         assert (validated_absolute_redirected_url.is_validated() and validated_absolute_redirected_url.is_certainly_absolute())
 
+        self._raise_lease_heartbeat_exception_if_any()
+
         redirected_url = validated_absolute_redirected_url.get_url()
         assert (original_url.get_url_in_container().get_url() != redirected_url)
 
@@ -314,22 +448,48 @@ class MySQLDatabaseModule(DatabaseModuleIface):
         )
 
     @_mysql_async_exception_handling_context
-    async def finish_crawling_with_delay(self, original_url: CrawledURLHandleIface, delay_seconds: int) -> None:
+    @_mysql_async_transaction_retrying_context
+    async def finish_crawling(self, crawling_results: Sequence[CrawlingResultBase]) -> None:
         assert (self._state == self.__class__._ModuleState.OPERATIONAL)
-        assert (isinstance(original_url, _MySQLCrawledURLHandle) and (not original_url.is_redirected()))
-        assert (delay_seconds > 0)
+        assert (len(crawling_results) > 0)
+
+        self._raise_lease_heartbeat_exception_if_any()
+
+        # The IDs obtained during the transaction are put into the ID caches only after it has been committed
+        staged_ids = {id_cache: dict() for id_cache in self._id_caches}
 
+        # All the results are stored in a single transaction (i.e. they are "group-committed")
         async with self._safe_mysql_cursor() as (cursor, success_flag_carrier):
-            await self._call_mysql_procedure(
-                cursor=cursor,
-                procedure_name=Procedures.FINISH_CRAWLING_WITH_DELAY,
-                args=(original_url.get_link_id(), delay_seconds)
-            )
+            for crawling_result in crawling_results:
+                if isinstance(crawling_result, CrawlingDelayResult):
+                    await self._store_crawling_delay_result(cursor, crawling_result)
+                elif isinstance(crawling_result, CrawlingErrorResult):
+                    await self._store_crawling_error_result(cursor, crawling_result)
+                elif isinstance(crawling_result, CrawlingSuccessResult):
+                    await self._store_crawling_success_result(cursor, crawling_result, staged_ids)
+                else:
+                    raise AssertionError(f"Invalid crawling result: {repr(crawling_result)}")
             success_flag_carrier.set(True)  # If all the previous code succeeds... (i.e. it does not raise an exception)
 
-    @_mysql_async_exception_handling_context
-    async def finish_crawling_with_error(self, original_url: CrawledURLHandleIface, redirected_url: Optional[CrawledURLHandleIface], error_reason: CrawlingErrorReason) -> None:
-        assert (self._state == self.__class__._ModuleState.OPERATIONAL)
+        for id_cache, ids in staged_ids.items():
+            id_cache.store_ids(ids)
+
+    async def _store_crawling_delay_result(self, cursor: aiomysql.Cursor, crawling_result: CrawlingDelayResult) -> None:
+        original_url = crawling_result.get_original_url()
+        delay_seconds = crawling_result.get_delay_seconds()
+        assert (isinstance(original_url, _MySQLCrawledURLHandle) and (not original_url.is_redirected()))
+        assert (delay_seconds > 0)
+
+        await self._call_mysql_procedure(
+            cursor=cursor,
+            procedure_name=Procedures.FINISH_CRAWLING_WITH_DELAY,
+            args=(original_url.get_link_id(), delay_seconds)
+        )
+
+    async def _store_crawling_error_result(self, cursor: aiomysql.Cursor, crawling_result: CrawlingErrorResult) -> None:
+        original_url = crawling_result.get_original_url()
+        redirected_url = crawling_result.get_redirected_url()
+        error_reason = crawling_result.get_error_reason()
         assert (isinstance(original_url, _MySQLCrawledURLHandle) and (not original_url.is_redirected()))
         if redirected_url is not None:
             assert (isinstance(redirected_url, _MySQLCrawledURLHandle) and redirected_url.is_redirected())
@@ -340,18 +500,17 @@ class MySQLDatabaseModule(DatabaseModuleIface):
             erroneous_link_ids.append(redirected_url.get_link_id())
         error_reason_mysql_enum_value = EnumValues.get_link_crawling_error_reason(error_reason),
 
-        async with self._safe_mysql_cursor() as (cursor, success_flag_carrier):
-            for erroneous_link_id in erroneous_link_ids:
-                await self._call_mysql_procedure(
-                    cursor=cursor,
-                    procedure_name=Procedures.FINISH_CRAWLING_WITH_ERROR,
-                    args=(erroneous_link_id, error_reason_mysql_enum_value)
-                )
-            success_flag_carrier.set(True)  # If all the previous code succeeds... (i.e. it does not raise an exception)
+        for erroneous_link_id in erroneous_link_ids:
+            await self._call_mysql_procedure(
+                cursor=cursor,
+                procedure_name=Procedures.FINISH_CRAWLING_WITH_ERROR,
+                args=(erroneous_link_id, error_reason_mysql_enum_value)
+            )
 
-    @_mysql_async_exception_handling_context
-    async def finish_crawling_with_success(self, original_url: CrawledURLHandleIface, redirected_url: Optional[CrawledURLHandleIface], validated_document: DocumentContainer) -> None:
-        assert (self._state == self.__class__._ModuleState.OPERATIONAL)
+    async def _store_crawling_success_result(self, cursor: aiomysql.Cursor, crawling_result: CrawlingSuccessResult, staged_ids: Dict[_MySQLIDCache, Dict[str, int]]) -> None:
+        original_url = crawling_result.get_original_url()
+        redirected_url = crawling_result.get_redirected_url()
+        validated_document = crawling_result.get_validated_document()
         assert (isinstance(original_url, _MySQLCrawledURLHandle) and (not original_url.is_redirected()))
         if redirected_url is not None:
             assert (isinstance(redirected_url, _MySQLCrawledURLHandle) and redirected_url.is_redirected())
@@ -369,39 +528,100 @@ class MySQLDatabaseModule(DatabaseModuleIface):
         original_link_id = original_url.get_link_id()
         final_link_id = (redirected_url.get_link_id() if (redirected_url is not None) else original_link_id)
 
-        async with self._safe_mysql_cursor() as (cursor, success_flag_carrier):
-            document_id = await self._call_mysql_function(
-                cursor=cursor,
-                function_name=Functions.FINISH_CRAWLING_WITH_SUCCESS,
-                args=(original_link_id, final_link_id, validated_document.get_file_type(), validated_document.get_language(), validated_document.get_author(), validated_document.get_title(), validated_document.get_description()),
-                result_filter=int
-            )
-            for keyword in validated_document.get_keywords():
-                await self._call_mysql_procedure(
-                    cursor=cursor,
-                    procedure_name=Procedures.ADD_KEYWORD_TO_DOCUMENT,
-                    args=(document_id, keyword)
-                )
-            for content_snippet in validated_document.get_content_snippets():
-                snippet_type_mysql_enum_value = EnumValues.get_content_snippet_type(content_snippet.get_snippet_type()),
-                await self._call_mysql_procedure(
-                    cursor=cursor,
-                    procedure_name=Procedures.ADD_CONTENT_SNIPPET_TO_DOCUMENT,
-                    args=(document_id, snippet_type_mysql_enum_value, content_snippet.get_snippet_text())
-                )
-            for link in validated_document.get_links():
-                await self._call_mysql_procedure(
-                    cursor=cursor,
-                    procedure_name=Procedures.ADD_LINK_TO_DOCUMENT,
-                    args=(document_id, link.get_href_url().get_url(), link.get_link_text())
-                )
-            for image in validated_document.get_images():
-                await self._call_mysql_procedure(
-                    cursor=cursor,
-                    procedure_name=Procedures.ADD_IMAGE_TO_DOCUMENT,
-                    args=(document_id, image.get_src_url().get_url(), image.get_alt_text(), image.get_title_text())
-                )
-            success_flag_carrier.set(True)  # If all the previous code succeeds... (i.e. it does not raise an exception)
+        filetype_id = await self._resolve_id_using_mysql_function(cursor, self._filetype_id_cache, staged_ids, Functions.GET_FILETYPE_ID, validated_document.get_file_type())
+        language_id = await self._resolve_id_using_mysql_function(cursor, self._language_id_cache, staged_ids, Functions.GET_LANGUAGE_ID, validated_document.get_language())
+        author_id = await self._resolve_id_using_mysql_function(cursor, self._author_id_cache, staged_ids, Functions.GET_AUTHOR_ID, validated_document.get_author())
+
+        document_id = await self._call_mysql_function(
+            cursor=cursor,
+            function_name=Functions.FINISH_CRAWLING_WITH_SUCCESS_USING_IDS,
+            args=(original_link_id, final_link_id, filetype_id, language_id, author_id, validated_document.get_title(), validated_document.get_description()),
+            result_filter=int
+        )
+
+        # Each collection is inserted using a constant number of statements, regardless of the size of the document (the
+        #  values whose IDs are cached are not looked up at all)
+        keywords = validated_document.get_keywords()
+        keyword_ids = await self._resolve_ids_using_bulk_queries(cursor=cursor, id_cache=self._keyword_id_cache, staged_ids=staged_ids, values=keywords, add_missing_query=BulkInsertQueries.ADD_MISSING_KEYWORDS, get_ids_query=BulkInsertQueries.GET_KEYWORD_IDS, row_query=BulkInsertQueries.KEYWORD_ROW)
+        keyword_rows = [(keyword_ids[keyword],) for keyword in keywords if (keyword in keyword_ids)]
+        await self._run_bulk_insert_query(cursor=cursor, query=BulkInsertQueries.ADD_KEYWORDS_TO_DOCUMENT, row_query=BulkInsertQueries.KEYWORD_ID_ROW, rows=keyword_rows, leading_args=(document_id,))
+
+        content_snippet_rows = [
+            (EnumValues.get_content_snippet_type(content_snippet.get_snippet_type()), content_snippet.get_snippet_text())
+            for content_snippet in validated_document.get_content_snippets()
+        ]
+        await self._run_bulk_insert_query(cursor=cursor, query=BulkInsertQueries.ADD_CONTENT_SNIPPETS_TO_DOCUMENT, row_query=BulkInsertQueries.CONTENT_SNIPPET_ROW, rows=content_snippet_rows, leading_args=(document_id,))
+
+        links = validated_document.get_links()
+        link_ids = await self._resolve_ids_using_bulk_queries(cursor=cursor, id_cache=self._link_id_cache, staged_ids=staged_ids, values=[link.get_href_url().get_url() for link in links], add_missing_query=BulkInsertQueries.ADD_MISSING_LINKS, get_ids_query=BulkInsertQueries.GET_LINK_IDS, row_query=BulkInsertQueries.LINK_URL_ROW)
+        link_rows = [(link_ids[link.get_href_url().get_url()], link.get_link_text()) for link in links if (link.get_href_url().get_url() in link_ids)]
+        await self._run_bulk_insert_query(cursor=cursor, query=BulkInsertQueries.ADD_LINKS_TO_DOCUMENT, row_query=BulkInsertQueries.LINK_ID_ROW, rows=link_rows, leading_args=(document_id,))
+
+        images = validated_document.get_images()
+        image_ids = await self._resolve_ids_using_bulk_queries(cursor=cursor, id_cache=self._image_id_cache, staged_ids=staged_ids, values=[image.get_src_url().get_url() for image in images], add_missing_query=BulkInsertQueries.ADD_MISSING_IMAGES, get_ids_query=BulkInsertQueries.GET_IMAGE_IDS, row_query=BulkInsertQueries.IMAGE_URL_ROW)
+        image_rows = [(image_ids[image.get_src_url().get_url()], image.get_alt_text(), image.get_title_text()) for image in images if (image.get_src_url().get_url() in image_ids)]
+        await self._run_bulk_insert_query(cursor=cursor, query=BulkInsertQueries.ADD_IMAGES_TO_DOCUMENT, row_query=BulkInsertQueries.IMAGE_ID_ROW, rows=image_rows, leading_args=(document_id,))
+
+    def _get_known_id(self, id_cache: _MySQLIDCache, staged_ids: Dict[_MySQLIDCache, Dict[str, int]], value: str) -> Optional[int]:
+        # The IDs obtained earlier in the current transaction are checked first, as they are not in the cache yet
+        staged_id = staged_ids[id_cache].get(value)
+        if staged_id is not None:
+            return staged_id
+
+        return id_cache.get_id(value)
+
+    async def _resolve_id_using_mysql_function(self, cursor: aiomysql.Cursor, id_cache: _MySQLIDCache, staged_ids: Dict[_MySQLIDCache, Dict[str, int]], function_name: str, value: str) -> int:
+        id_ = self._get_known_id(id_cache, staged_ids, value)
+        if id_ is None:
+            id_ = await self._call_mysql_function(cursor=cursor, function_name=function_name, args=(value,), result_filter=int)
+            staged_ids[id_cache][value] = id_
+
+        return id_
+
+    async def _resolve_ids_using_bulk_queries(self, cursor: aiomysql.Cursor, id_cache: _MySQLIDCache, staged_ids: Dict[_MySQLIDCache, Dict[str, int]], values: Sequence[str], add_missing_query: str, get_ids_query: str, row_query: str) -> Dict[str, int]:
+        # A value is missing from the returned dictionary only if its ID cannot be obtained (i.e. if the hash of a URL
+        #  collides with the hash of another URL)
+        resolved_ids = dict()
+        unresolved_value_rows = []
+        for value in dict.fromkeys(values):  # Removes duplicates while preserving order
+            id_ = self._get_known_id(id_cache, staged_ids, value)
+            if id_ is None:
+                unresolved_value_rows.append((value,))
+            else:
+                resolved_ids[value] = id_
+
+        if len(unresolved_value_rows) == 0:
+            return resolved_ids
+
+        await self._run_bulk_insert_query(cursor=cursor, query=add_missing_query, row_query=row_query, rows=unresolved_value_rows, leading_args=())
+        result_rows = await self._run_bulk_select_query_and_fetch_result_rows(cursor=cursor, query=get_ids_query, row_query=row_query, rows=unresolved_value_rows)
+
+        try:
+            obtained_ids = {str(value): int(id_) for value, id_ in result_rows}
+        except Exception:
+            raise MySQLResultFetchFailureExc(get_ids_query)
+
+        staged_ids[id_cache].update(obtained_ids)
+        resolved_ids.update(obtained_ids)
+        return resolved_ids
+
+    async def _run_bulk_insert_query(self, cursor: aiomysql.Cursor, query: str, row_query: str, rows: Sequence[Tuple[Any, ...]], leading_args: Tuple[Any, ...]) -> None:
+        if len(rows) == 0:
+            return
+
+        await cursor.execute(
+            query=query.format(rows=" UNION ALL ".join([row_query] * len(rows))),
+            args=(leading_args + tuple(itertools.chain.from_iterable(rows)))
+        )
+
+    async def _run_bulk_select_query_and_fetch_result_rows(self, cursor: aiomysql.Cursor, query: str, row_query: str, rows: Sequence[Tuple[Any, ...]]) -> Sequence[Tuple[Any, ...]]:
+        assert (len(rows) > 0)
+
+        await cursor.execute(
+            query=query.format(rows=" UNION ALL ".join([row_query] * len(rows))),
+            args=tuple(itertools.chain.from_iterable(rows))
+        )
+        return await cursor.fetchall()
 
     async def _call_mysql_procedure(self, cursor: aiomysql.Cursor, procedure_name: str, args: Tuple[Any, ...]) -> None:
         assert (len(procedure_name) > 0)
@@ -411,6 +631,18 @@ class MySQLDatabaseModule(DatabaseModuleIface):
             args=args
         )
 
+    async def _call_mysql_procedure_and_fetch_result_rows(self, cursor: aiomysql.Cursor, procedure_name: str, args: Tuple[Any, ...]) -> Sequence[Tuple[Any, ...]]:
+        assert (len(procedure_name) > 0)
+
+        await cursor.execute(
+            query=f"CALL `{procedure_name}`({self._generate_query_args_placeholders(len(args))});",
+            args=args
+        )
+
+        # Only the first result set is returned; the remaining ones (e.g. the status of the CALL statement) are discarded
+        #  by the cursor when the next query is executed
+        return await cursor.fetchall()
+
     async def _call_mysql_function(self, cursor: aiomysql.Cursor, function_name: str, args: Tuple[Any, ...], result_filter: Callable[[Any], Any]) -> Any:
         assert (len(function_name) > 0)
 
@@ -461,7 +693,8 @@ class MySQLDatabaseModule(DatabaseModuleIface):
 
                 try:
                     await cursor.execute("SET autocommit = 0;")
-                    await self._acquire_mysql_lock(cursor)
+                    if self._use_global_lock:
+                        await self._acquire_mysql_lock(cursor)
                     await cursor.execute("START TRANSACTION;")
 
                     yield cursor, success_flag_carrier
@@ -471,10 +704,11 @@ class MySQLDatabaseModule(DatabaseModuleIface):
                     except Exception as e:
                         pending_exception = e
 
-                    try:
-                        await self._release_mysql_lock(cursor)
-                    except Exception as e:
-                        pending_exception = e
+                    if self._use_global_lock:
+                        try:
+                            await self._release_mysql_lock(cursor)
+                        except Exception as e:
+                            pending_exception = e
 
                 # This "prioritizes" exceptions raised in the 'try' block over exceptions raised in the 'finally' block
                 #  (Exceptions from the 'finally' block are re-raised only if no exceptions were raised in the 'try' block)
@@ -483,7 +717,8 @@ class MySQLDatabaseModule(DatabaseModuleIface):
 
     async def _acquire_mysql_lock(self, cursor: aiomysql.Cursor) -> None:
         # This lock, among other things, ensures that more workers cannot get the same URL for crawling, which is
-        #  absolutely essential for this program!
+        #  absolutely essential for this program! (If the lock is not used, row locks taken by the database routines
+        #  ensure this instead.)
 
         # https://dev.mysql.com/doc/refman/8.0/en/locking-functions.html#function_get-lock
         get_lock_return_value = await self._call_mysql_function(
@@ -21,8 +21,10 @@
 
 
 from datalidator.blueprints.extras.ObjectModel import ObjectModel
+from datalidator.blueprints.extras.OptionalItem import OptionalItem
 from datalidator.blueprints.impl.StringBlueprint import StringBlueprint
 from datalidator.blueprints.impl.IntegerBlueprint import IntegerBlueprint
+from datalidator.blueprints.impl.BooleanBlueprint import BooleanBlueprint
 from datalidator.filters.impl.StringStripFilter import StringStripFilter
 from datalidator.filters.impl.StringLowercaseFilter import StringLowercaseFilter
 from datalidator.validators.impl.SequenceIsNotEmptyValidator import SequenceIsNotEmptyValidator
@@ -54,3 +56,25 @@ class _MySQLDatabaseModuleConfigModel(ObjectModel):
     connection_pool_size = IntegerBlueprint(
         validators=(NumberMinimumValueValidator(1),)
     )
+    use_global_lock = OptionalItem(
+        wrapped_blueprint=BooleanBlueprint(),
+        default_value=True
+    )
+    id_cache_size = OptionalItem(
+        wrapped_blueprint=IntegerBlueprint(
+            validators=(NumberMinimumValueValidator(0),)
+        ),
+        default_value=8192
+    )
+    lease_heartbeat_interval = OptionalItem(
+        wrapped_blueprint=IntegerBlueprint(
+            validators=(NumberMinimumValueValidator(1),)
+        ),
+        default_value=30
+    )
+    lease_timeout = OptionalItem(
+        wrapped_blueprint=IntegerBlueprint(
+            validators=(NumberMinimumValueValidator(1),)
+        ),
+        default_value=300
+    )
@@ -0,0 +1,67 @@
+#!/bin/false
+
+# Copyright (c) 2022 Vít Labuda. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without modification, are permitted provided that the
+# following conditions are met:
+#  1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following
+#     disclaimer.
+#  2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the
+#     following disclaimer in the documentation and/or other materials provided with the distribution.
+#  3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote
+#     products derived from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES,
+# INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+from typing import Final, Optional, Dict
+import collections
+
+
+class _MySQLIDCache:
+    # A bounded LRU cache mapping values (URLs, keywords, filetypes etc.) to the IDs of the database rows containing them.
+    # Since the rows are never deleted nor changed, a cached ID cannot become stale. However, IDs obtained in a
+    #  transaction must not be stored into the cache before the transaction is committed, as they would not be valid if
+    #  it was rolled back.
+
+    def __init__(self, max_size: int):
+        assert (max_size >= 0)
+
+        self._cached_ids: Final[collections.OrderedDict[str, int]] = collections.OrderedDict()
+        self._max_size: Final[int] = max_size
+        self._hit_count: int = 0
+        self._miss_count: int = 0
+
+    def get_id(self, value: str) -> Optional[int]:
+        try:
+            id_ = self._cached_ids[value]
+        except KeyError:
+            self._miss_count += 1
+            return None
+
+        self._cached_ids.move_to_end(value)
+        self._hit_count += 1
+        return id_
+
+    def store_ids(self, ids: Dict[str, int]) -> None:
+        if self._max_size == 0:
+            return
+
+        for value, id_ in ids.items():
+            self._cached_ids[value] = id_
+            self._cached_ids.move_to_end(value)
+
+        while len(self._cached_ids) > self._max_size:
+            self._cached_ids.popitem(last=False)
+
+    def get_hit_count(self) -> int:
+        return self._hit_count
+
+    def get_miss_count(self) -> int:
+        return self._miss_count
@@ -0,0 +1,35 @@
+#!/bin/false
+
+# Copyright (c) 2022 Vít Labuda. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without modification, are permitted provided that the
+# following conditions are met:
+#  1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following
+#     disclaimer.
+#  2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the
+#     following disclaimer in the documentation and/or other materials provided with the distribution.
+#  3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote
+#     products derived from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES,
+# INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+from datalidator.validators.DefaultValidatorImplBase import DefaultValidatorImplBase
+from spideriment_ng.modules.databases.mysql._MySQLDatabaseModuleConfigModel import _MySQLDatabaseModuleConfigModel
+
+
+class _MySQLLeaseOptionsValidator(DefaultValidatorImplBase[_MySQLDatabaseModuleConfigModel]):
+    # If the lease timeout was not longer than the heartbeat interval, the leases of running crawlers would be reclaimed
+    #  by the other crawlers before they could be renewed
+
+    __slots__ = ()
+
+    def _validate(self, data: _MySQLDatabaseModuleConfigModel) -> None:
+        if data.lease_timeout <= data.lease_heartbeat_interval:
+            raise self._generate_data_validation_failed_exc(f"The lease timeout ({data.lease_timeout}) must be longer than the lease heartbeat interval ({data.lease_heartbeat_interval})!")
@@ -0,0 +1,107 @@
+#!/bin/false
+
+# Copyright (c) 2022 Vít Labuda. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without modification, are permitted provided that the
+# following conditions are met:
+#  1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following
+#     disclaimer.
+#  2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the
+#     following disclaimer in the documentation and/or other materials provided with the distribution.
+#  3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote
+#     products derived from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES,
+# INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+from typing import final, Final
+from spideriment_ng.helpers.UninstantiableClassMixin import UninstantiableClassMixin
+from spideriment_ng.modules.databases.mysql._constants.Database import Database  # noqa
+
+
+@final
+class BulkInsertQueries(UninstantiableClassMixin):
+    # The '{rows}' placeholder in the queries is replaced by the corresponding row query repeated for each inserted row
+    #  and joined using 'UNION ALL', so a whole collection is inserted using a single statement.
+    # The IDs of the inserted values (keywords, URLs) are obtained using the 'GET_*_IDS' queries, so they can be cached
+    #  and the values which have already been seen do not have to be looked up again.
+    # The string values which are compared to table columns must have the same collation as the columns.
+    # URLs are looked up using their (indexed) hashes; the URLs themselves are compared as well, so a URL whose hash
+    #  collides with another URL's hash is never paired with the other URL's ID (it is skipped instead).
+
+    KEYWORD_ROW: Final[str] = f"SELECT %s COLLATE `{Database.COLLATION}` AS `tmp_keyword_text`"
+
+    ADD_MISSING_KEYWORDS: Final[str] = """
+        INSERT INTO `keywords` (`keyword_text`)
+        SELECT `tmp_keywords`.`tmp_keyword_text` FROM ({rows}) `tmp_keywords`
+        WHERE NOT EXISTS(SELECT 1 FROM `keywords` WHERE `keywords`.`keyword_text` = `tmp_keywords`.`tmp_keyword_text` LIMIT 1)
+        ON DUPLICATE KEY UPDATE `keywords`.`keyword_id` = `keywords`.`keyword_id`;
+    """
+
+    GET_KEYWORD_IDS: Final[str] = """
+        SELECT `tmp_keywords`.`tmp_keyword_text`, `keywords`.`keyword_id` FROM ({rows}) `tmp_keywords`
+        INNER JOIN `keywords` ON `keywords`.`keyword_text` = `tmp_keywords`.`tmp_keyword_text`;
+    """
+
+    KEYWORD_ID_ROW: Final[str] = "SELECT %s AS `tmp_keyword_id`"
+
+    ADD_KEYWORDS_TO_DOCUMENT: Final[str] = """
+        INSERT INTO `document_keyword_pairs` (`document_keyword_pair_document_id`, `document_keyword_pair_keyword_id`)
+        SELECT %s, `tmp_keywords`.`tmp_keyword_id` FROM ({rows}) `tmp_keywords`;
+    """
+
+    CONTENT_SNIPPET_ROW: Final[str] = "SELECT %s AS `tmp_content_snippet_type`, %s AS `tmp_content_snippet_text`"
+
+    ADD_CONTENT_SNIPPETS_TO_DOCUMENT: Final[str] = """
+        INSERT INTO `content_snippets` (`content_snippet_document_id`, `content_snippet_type`, `content_snippet_text`)
+        SELECT %s, `tmp_content_snippets`.`tmp_content_snippet_type`, `tmp_content_snippets`.`tmp_content_snippet_text` FROM ({rows}) `tmp_content_snippets`;
+    """
+
+    LINK_URL_ROW: Final[str] = f"SELECT %s COLLATE `{Database.COLLATION}` AS `tmp_link_href_url`"
+
+    # New links are put into the crawl frontier by a trigger
+    ADD_MISSING_LINKS: Final[str] = """
+        INSERT INTO `links` (`link_href_url`)
+        SELECT `tmp_links`.`tmp_link_href_url` FROM ({rows}) `tmp_links`
+        WHERE NOT EXISTS(SELECT 1 FROM `links` WHERE `links`.`link_href_url_hash` = UNHEX(MD5(`tmp_links`.`tmp_link_href_url`)) LIMIT 1)
+        ON DUPLICATE KEY UPDATE `links`.`link_id` = `links`.`link_id`;
+    """
+
+    GET_LINK_IDS: Final[str] = """
+        SELECT `tmp_links`.`tmp_link_href_url`, `links`.`link_id` FROM ({rows}) `tmp_links`
+        INNER JOIN `links` ON `links`.`link_href_url_hash` = UNHEX(MD5(`tmp_links`.`tmp_link_href_url`)) AND `links`.`link_href_url` = `tmp_links`.`tmp_link_href_url`;
+    """
+
+    LINK_ID_ROW: Final[str] = "SELECT %s AS `tmp_link_id`, %s AS `tmp_link_text`"
+
+    ADD_LINKS_TO_DOCUMENT: Final[str] = """
+        INSERT INTO `document_link_pairs` (`document_link_pair_document_id`, `document_link_pair_link_id`, `document_link_pair_link_text`)
+        SELECT %s, `tmp_links`.`tmp_link_id`, `tmp_links`.`tmp_link_text` FROM ({rows}) `tmp_links`;
+    """
+
+    IMAGE_URL_ROW: Final[str] = f"SELECT %s COLLATE `{Database.COLLATION}` AS `tmp_image_src_url`"
+
+    ADD_MISSING_IMAGES: Final[str] = """
+        INSERT INTO `images` (`image_src_url`)
+        SELECT `tmp_images`.`tmp_image_src_url` FROM ({rows}) `tmp_images`
+        WHERE NOT EXISTS(SELECT 1 FROM `images` WHERE `images`.`image_src_url_hash` = UNHEX(MD5(`tmp_images`.`tmp_image_src_url`)) LIMIT 1)
+        ON DUPLICATE KEY UPDATE `images`.`image_id` = `images`.`image_id`;
+    """
+
+    GET_IMAGE_IDS: Final[str] = """
+        SELECT `tmp_images`.`tmp_image_src_url`, `images`.`image_id` FROM ({rows}) `tmp_images`
+        INNER JOIN `images` ON `images`.`image_src_url_hash` = UNHEX(MD5(`tmp_images`.`tmp_image_src_url`)) AND `images`.`image_src_url` = `tmp_images`.`tmp_image_src_url`;
+    """
+
+    IMAGE_ID_ROW: Final[str] = "SELECT %s AS `tmp_image_id`, %s AS `tmp_image_alt_text`, %s AS `tmp_image_title_text`"
+
+    ADD_IMAGES_TO_DOCUMENT: Final[str] = """
+        INSERT INTO `document_image_pairs` (`document_image_pair_document_id`, `document_image_pair_image_id`, `document_image_pair_image_alt_text`, `document_image_pair_image_title_text`)
+        SELECT %s, `tmp_images`.`tmp_image_id`, `tmp_images`.`tmp_image_alt_text`, `tmp_images`.`tmp_image_title_text` FROM ({rows}) `tmp_images`;
+    """
@@ -20,7 +20,7 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 
-from typing import final, Final
+from typing import final, Final, Tuple
 from spideriment_ng.helpers.UninstantiableClassMixin import UninstantiableClassMixin
 
 
@@ -30,3 +30,8 @@ class Database(UninstantiableClassMixin):
     COLLATION: Final[str] = "utf8mb4_general_ci"
 
     LOCK_NAME: Final[str] = "spideriment_ng.mysql_database_module.MYSQL_DB_LOCK"
+
+    # If a transaction fails due to one of these errors, it has been rolled back and can be retried:
+    #  1205 = ER_LOCK_WAIT_TIMEOUT, 1213 = ER_LOCK_DEADLOCK
+    RETRIABLE_TRANSACTION_ERROR_CODES: Final[Tuple[int, ...]] = (1205, 1213)
+    MAX_TRANSACTION_ATTEMPTS: Final[int] = 5
@@ -31,7 +31,11 @@ class Functions(UninstantiableClassMixin):
     GET_LINK_TO_CRAWL_FROM_LINKS: Final[str] = "sng_fn__get_link_to_crawl_from_links"
     HANDLE_REDIRECTED_URL_IN_DELAYED_LINKS: Final[str] = "sng_fn__handle_redirected_url_in_delayed_links"
     HANDLE_REDIRECTED_URL_IN_LINKS: Final[str] = "sng_fn__handle_redirected_url_in_links"
-    FINISH_CRAWLING_WITH_SUCCESS: Final[str] = "sng_fn__finish_crawling_with_success"
+    FINISH_CRAWLING_WITH_SUCCESS_USING_IDS: Final[str] = "sng_fn__finish_crawling_with_success_using_ids"
+    GET_FILETYPE_ID: Final[str] = "sng_fn__get_filetype_id"
+    GET_LANGUAGE_ID: Final[str] = "sng_fn__get_language_id"
+    GET_AUTHOR_ID: Final[str] = "sng_fn__get_author_id"
+    SEND_ACTIVE_CRAWLER_HEARTBEAT: Final[str] = "sng_fn__send_active_crawler_heartbeat"
 
 
 # Generated with:
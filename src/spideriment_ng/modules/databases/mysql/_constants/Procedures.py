@@ -33,10 +33,10 @@ class Procedures(UninstantiableClassMixin):
     REMOVE_LINK_FROM_LINK_CRAWLING_DELAYS: Final[str] = "sng_proc__remove_link_from_link_crawling_delays"
     FINISH_CRAWLING_WITH_DELAY: Final[str] = "sng_proc__finish_crawling_with_delay"
     FINISH_CRAWLING_WITH_ERROR: Final[str] = "sng_proc__finish_crawling_with_error"
-    ADD_CONTENT_SNIPPET_TO_DOCUMENT: Final[str] = "sng_proc__add_content_snippet_to_document"
-    ADD_KEYWORD_TO_DOCUMENT: Final[str] = "sng_proc__add_keyword_to_document"
-    ADD_LINK_TO_DOCUMENT: Final[str] = "sng_proc__add_link_to_document"
-    ADD_IMAGE_TO_DOCUMENT: Final[str] = "sng_proc__add_image_to_document"
+    REMOVE_LINK_FROM_CRAWL_FRONTIER_LINKS: Final[str] = "sng_proc__remove_link_from_crawl_frontier_links"
+    GET_LINKS_TO_CRAWL: Final[str] = "sng_proc__get_links_to_crawl"
+    RELEASE_LINK_TO_CRAWL: Final[str] = "sng_proc__release_link_to_crawl"
+    RECLAIM_EXPIRED_LEASES: Final[str] = "sng_proc__reclaim_expired_leases"
 
 
 # Generated with:
@@ -1,6 +1,9 @@
 CREATE TABLE IF NOT EXISTS `links` (
     `link_id` BIGINT UNSIGNED NOT NULL AUTO_INCREMENT,
     `link_href_url` VARCHAR(1024) NOT NULL,
+    `link_href_url_hash` BINARY(16) AS (UNHEX(MD5(`link_href_url`))) STORED NOT NULL,
+    `link_crawl_state` ENUM('new', 'leased', 'delayed', 'errored', 'done') NOT NULL DEFAULT 'new',
     PRIMARY KEY(`link_id`),
-    UNIQUE KEY(`link_href_url`)
+    UNIQUE KEY(`link_href_url_hash`),
+    INDEX(`link_crawl_state`)
 ) CHARACTER SET utf8mb4 COLLATE utf8mb4_general_ci
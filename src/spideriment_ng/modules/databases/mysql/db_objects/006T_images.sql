@@ -1,6 +1,7 @@
 CREATE TABLE IF NOT EXISTS `images` (
     `image_id` BIGINT UNSIGNED NOT NULL AUTO_INCREMENT,
     `image_src_url` VARCHAR(1024) NOT NULL,
+    `image_src_url_hash` BINARY(16) AS (UNHEX(MD5(`image_src_url`))) STORED NOT NULL,
     PRIMARY KEY(`image_id`),
-    UNIQUE KEY(`image_src_url`)
+    UNIQUE KEY(`image_src_url_hash`)
 ) CHARACTER SET utf8mb4 COLLATE utf8mb4_general_ci
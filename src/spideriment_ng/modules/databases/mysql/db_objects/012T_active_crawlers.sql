@@ -4,5 +4,7 @@ CREATE TABLE IF NOT EXISTS `active_crawlers` (
     `active_crawler_program_name` VARCHAR(32) NOT NULL,
     `active_crawler_program_version` VARCHAR(32) NOT NULL,
     `active_crawler_active_since` DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
-    PRIMARY KEY(`active_crawler_id`)
+    `active_crawler_last_heartbeat_at` DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY(`active_crawler_id`),
+    INDEX(`active_crawler_last_heartbeat_at`)
 ) CHARACTER SET utf8mb4 COLLATE utf8mb4_general_ci
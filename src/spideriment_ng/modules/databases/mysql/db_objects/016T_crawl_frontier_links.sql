@@ -0,0 +1,9 @@
+CREATE TABLE IF NOT EXISTS `crawl_frontier_links` (
+    `crawl_frontier_link_id` BIGINT UNSIGNED NOT NULL AUTO_INCREMENT,
+    `crawl_frontier_link_link_id` BIGINT UNSIGNED NOT NULL,
+    `crawl_frontier_link_random_key` INT UNSIGNED NOT NULL,
+    PRIMARY KEY(`crawl_frontier_link_id`),
+    UNIQUE KEY(`crawl_frontier_link_link_id`),
+    INDEX(`crawl_frontier_link_random_key`),
+    CONSTRAINT `fk_crawl_frontier_link_link` FOREIGN KEY (`crawl_frontier_link_link_id`) REFERENCES `links`(`link_id`) ON UPDATE RESTRICT ON DELETE RESTRICT
+) CHARACTER SET utf8mb4 COLLATE utf8mb4_general_ci
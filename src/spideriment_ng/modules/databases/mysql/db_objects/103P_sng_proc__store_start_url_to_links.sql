@@ -8,7 +8,8 @@ BEGIN
         SIGNAL SQLSTATE '45000' SET MESSAGE_TEXT = 'The input parameters of this procedure/function must not be NULL!';
     END IF;
 
-    IF NOT EXISTS(SELECT 1 FROM `links` WHERE `links`.`link_href_url` = `param_start_url` LIMIT 1) THEN
-        INSERT INTO `links` (`link_href_url`) VALUES (`param_start_url`);
-    END IF;
+    -- The start URLs are announced by all worker processes at the same time, so concurrently inserted duplicates must not
+    --  cause an error
+    INSERT INTO `links` (`link_href_url`) VALUES (`param_start_url`)
+        ON DUPLICATE KEY UPDATE `link_id` = `link_id`;
 END
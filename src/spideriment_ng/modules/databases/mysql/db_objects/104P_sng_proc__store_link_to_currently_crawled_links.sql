@@ -11,4 +11,6 @@ BEGIN
 
     INSERT INTO `currently_crawled_links` (`currently_crawled_link_active_crawler_id`, `currently_crawled_link_link_id`)
         VALUES (`param_crawler_id`, `param_link_id`);
+
+    UPDATE `links` SET `links`.`link_crawl_state` = 'leased' WHERE `links`.`link_id` = `param_link_id`;
 END
@@ -11,10 +11,13 @@ BEGIN
         SIGNAL SQLSTATE '45000' SET MESSAGE_TEXT = 'The input parameters of this procedure/function must not be NULL!';
     END IF;
 
-    -- Get a link to crawl from the delayed links table, if a link whose delay has expired is there
+    -- Get a link to crawl from the delayed links table, if a link whose delay has expired is there (the link whose delay
+    --  expired first is picked using the index on the expiration time, so the whole table does not have to be scanned)
     SELECT `link_crawling_delays`.`link_crawling_delay_link_id` INTO `var_link_to_crawl_id` FROM `link_crawling_delays`
-        WHERE DATE_ADD(`link_crawling_delays`.`link_crawling_delay_delayed_since`, INTERVAL `link_crawling_delays`.`link_crawling_delay_delayed_for` SECOND) < CURRENT_TIMESTAMP
-        LIMIT 1;
+        WHERE `link_crawling_delays`.`link_crawling_delay_delayed_until` < CURRENT_TIMESTAMP
+        ORDER BY `link_crawling_delays`.`link_crawling_delay_delayed_until`
+        LIMIT 1
+        FOR UPDATE SKIP LOCKED;
     IF `var_link_to_crawl_id` IS NOT NULL THEN
         CALL `sng_proc__remove_link_from_link_crawling_delays`(`var_link_to_crawl_id`);
         CALL `sng_proc__store_link_to_currently_crawled_links`(`param_crawler_id`, `var_link_to_crawl_id`);
@@ -11,38 +11,22 @@ BEGIN
         SIGNAL SQLSTATE '45000' SET MESSAGE_TEXT = 'The input parameters of this procedure/function must not be NULL!';
     END IF;
 
-    -- Get a link to crawl from the links table - links which have already been crawled/are currently crawled are not selected
+    -- Get a link to crawl from the crawl frontier - it contains exactly the links which have never been crawled and are
+    --  not being crawled at the moment (links are added to it by a trigger when they are inserted into the links table,
+    --  and removed from it when they are picked for crawling)
 
-    -- OPTIMIZATION: Select a small amount of random links from the huge links table and apply the WHERE conditions on it -->
-    --  on a links table with 500 000 rows, this takes about 0.1 seconds; however, this query might incorrectly assume
-    --  that there are no more links to crawl if all of the randomly selected links have been already crawled (the probability
-    --  of this happening is EXTREMELY SMALL, but it is possible)
-    SELECT `tmp_links`.`link_id` INTO `var_link_to_crawl_id`
-        FROM (
-            SELECT `links`.`link_id` AS `link_id` FROM `links`
-            ORDER BY RAND()
-            LIMIT 100
-        ) `tmp_links`
-        WHERE NOT EXISTS(SELECT 1 FROM `documents` WHERE `documents`.`document_original_link_id` = `tmp_links`.`link_id` OR `documents`.`document_final_link_id` = `tmp_links`.`link_id` LIMIT 1)
-        AND NOT EXISTS(SELECT 1 FROM `currently_crawled_links` WHERE `currently_crawled_links`.`currently_crawled_link_link_id` = `tmp_links`.`link_id` LIMIT 1)
-        AND NOT EXISTS(SELECT 1 FROM `link_crawling_delays` WHERE `link_crawling_delays`.`link_crawling_delay_link_id` = `tmp_links`.`link_id` LIMIT 1)
-        AND NOT EXISTS(SELECT 1 FROM `link_crawling_errors` WHERE `link_crawling_errors`.`link_crawling_error_link_id` = `tmp_links`.`link_id` LIMIT 1)
-        LIMIT 1;
-    IF `var_link_to_crawl_id` IS NOT NULL THEN
-        CALL `sng_proc__store_link_to_currently_crawled_links`(`param_crawler_id`, `var_link_to_crawl_id`);
-        RETURN `var_link_to_crawl_id`;
-    END IF;
-
-    -- If the above query fails (which it might), resort to using this WAY SLOWER query, which, however, always returns
-    --  a "correct" result --> on a links table with 500 000 rows, this takes about 22 seconds!
-    -- PS: An attempt was made to optimize this query using LEFT OUTER JOIN, but it proved to be even slower.
-    SELECT `links`.`link_id` INTO `var_link_to_crawl_id` FROM `links`
-        WHERE NOT EXISTS(SELECT 1 FROM `documents` WHERE `documents`.`document_original_link_id` = `links`.`link_id` OR `documents`.`document_final_link_id` = `links`.`link_id` LIMIT 1)
-        AND NOT EXISTS(SELECT 1 FROM `currently_crawled_links` WHERE `currently_crawled_links`.`currently_crawled_link_link_id` = `links`.`link_id` LIMIT 1)
-        AND NOT EXISTS(SELECT 1 FROM `link_crawling_delays` WHERE `link_crawling_delays`.`link_crawling_delay_link_id` = `links`.`link_id` LIMIT 1)
-        AND NOT EXISTS(SELECT 1 FROM `link_crawling_errors` WHERE `link_crawling_errors`.`link_crawling_error_link_id` = `links`.`link_id` LIMIT 1)
-        LIMIT 1;
+    -- OPTIMIZATION: The frontier's random keys are assigned on insertion and indexed, so popping the link with the lowest
+    --  key is an index seek which yields the links in a random order, regardless of the size of the links table (the
+    --  previous approach, which sampled the links table using ORDER BY RAND() and then probed 4 other tables for each
+    --  sampled link, took about 0.1 seconds on a table with 500 000 rows, or even 22 seconds if the sample was unlucky)
+    -- Links which are being picked by other transactions at the same time are skipped instead of waited for, so multiple
+    --  crawlers can pick links concurrently even if the global lock is not used
+    SELECT `crawl_frontier_links`.`crawl_frontier_link_link_id` INTO `var_link_to_crawl_id` FROM `crawl_frontier_links`
+        ORDER BY `crawl_frontier_links`.`crawl_frontier_link_random_key`
+        LIMIT 1
+        FOR UPDATE SKIP LOCKED;
     IF `var_link_to_crawl_id` IS NOT NULL THEN
+        CALL `sng_proc__remove_link_from_crawl_frontier_links`(`var_link_to_crawl_id`);
         CALL `sng_proc__store_link_to_currently_crawled_links`(`param_crawler_id`, `var_link_to_crawl_id`);
         RETURN `var_link_to_crawl_id`;
     END IF;
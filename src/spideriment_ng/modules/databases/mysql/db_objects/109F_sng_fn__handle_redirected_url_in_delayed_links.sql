@@ -6,18 +6,31 @@ CREATE FUNCTION IF NOT EXISTS `sng_fn__handle_redirected_url_in_delayed_links`
 RETURNS BIGINT UNSIGNED
 NOT DETERMINISTIC SQL SECURITY INVOKER
 BEGIN
+    DECLARE `var_link_id` BIGINT UNSIGNED DEFAULT NULL;
+    DECLARE `var_link_crawl_state` VARCHAR(16) DEFAULT NULL;
     DECLARE `var_redirected_url_link_id` BIGINT UNSIGNED DEFAULT NULL;
 
     IF `param_crawler_id` IS NULL OR `param_redirected_url` IS NULL THEN
         SIGNAL SQLSTATE '45000' SET MESSAGE_TEXT = 'The input parameters of this procedure/function must not be NULL!';
     END IF;
 
-    -- If the redirected URL is part of an delayed link whose delay has already expired, select it and return it
-    SELECT `link_crawling_delays`.`link_crawling_delay_link_id` INTO `var_redirected_url_link_id` FROM `link_crawling_delays`
-        INNER JOIN `links` ON `link_crawling_delays`.`link_crawling_delay_link_id` = `links`.`link_id`
-        WHERE `links`.`link_href_url` = `param_redirected_url`
-        AND DATE_ADD(`link_crawling_delays`.`link_crawling_delay_delayed_since`, INTERVAL `link_crawling_delays`.`link_crawling_delay_delayed_for` SECOND) < CURRENT_TIMESTAMP
+    -- Only links in the 'delayed' state can be found in the delayed links table, so the other links do not have to be
+    --  looked up there
+    SELECT `links`.`link_id`, `links`.`link_crawl_state` INTO `var_link_id`, `var_link_crawl_state` FROM `links`
+        WHERE `links`.`link_href_url_hash` = UNHEX(MD5(`param_redirected_url`))
+        AND `links`.`link_href_url` = `param_redirected_url`
         LIMIT 1;
+    IF `var_link_id` IS NULL OR `var_link_crawl_state` != 'delayed' THEN
+        RETURN NULL;
+    END IF;
+
+    -- If the redirected URL is part of an delayed link whose delay has already expired, select it and return it (only the
+    --  delay row is locked, and if it is locked by another transaction, the link is being taken by it)
+    SELECT `link_crawling_delays`.`link_crawling_delay_link_id` INTO `var_redirected_url_link_id` FROM `link_crawling_delays`
+        WHERE `link_crawling_delays`.`link_crawling_delay_link_id` = `var_link_id`
+        AND `link_crawling_delays`.`link_crawling_delay_delayed_until` < CURRENT_TIMESTAMP
+        LIMIT 1
+        FOR UPDATE SKIP LOCKED;
     IF `var_redirected_url_link_id` IS NOT NULL THEN
         CALL `sng_proc__remove_link_from_link_crawling_delays`(`var_redirected_url_link_id`);
         CALL `sng_proc__store_link_to_currently_crawled_links`(`param_crawler_id`, `var_redirected_url_link_id`);
@@ -7,32 +7,43 @@ RETURNS BIGINT UNSIGNED
 NOT DETERMINISTIC SQL SECURITY INVOKER
 BEGIN
     DECLARE `var_redirected_url_link_id` BIGINT UNSIGNED DEFAULT NULL;
+    DECLARE `var_link_crawl_state` VARCHAR(16) DEFAULT NULL;
 
     IF `param_crawler_id` IS NULL OR `param_redirected_url` IS NULL THEN
         SIGNAL SQLSTATE '45000' SET MESSAGE_TEXT = 'The input parameters of this procedure/function must not be NULL!';
     END IF;
 
-    -- Check if the redirected URL is part of a link already present in the links table
+    -- Get the ID of the link with the redirected URL (add it, if it is not present in the database)
     SELECT `links`.`link_id` INTO `var_redirected_url_link_id` FROM `links`
-        WHERE `links`.`link_href_url` = `param_redirected_url`
+        WHERE `links`.`link_href_url_hash` = UNHEX(MD5(`param_redirected_url`))
+        AND `links`.`link_href_url` = `param_redirected_url`
         LIMIT 1;
-    IF `var_redirected_url_link_id` IS NOT NULL THEN
-        -- If so, check if it can be crawled - if so, return it; otherwise return NULL
-        IF NOT EXISTS(SELECT 1 FROM `documents` WHERE `documents`.`document_original_link_id` = `var_redirected_url_link_id` OR `documents`.`document_final_link_id` = `var_redirected_url_link_id` LIMIT 1)
-           AND NOT EXISTS(SELECT 1 FROM `currently_crawled_links` WHERE `currently_crawled_links`.`currently_crawled_link_link_id` = `var_redirected_url_link_id` LIMIT 1)
-           AND NOT EXISTS(SELECT 1 FROM `link_crawling_delays` WHERE `link_crawling_delays`.`link_crawling_delay_link_id` = `var_redirected_url_link_id` LIMIT 1)
-           AND NOT EXISTS(SELECT 1 FROM `link_crawling_errors` WHERE `link_crawling_errors`.`link_crawling_error_link_id` = `var_redirected_url_link_id` LIMIT 1)
-        THEN
-            CALL `sng_proc__store_link_to_currently_crawled_links`(`param_crawler_id`, `var_redirected_url_link_id`);
-            RETURN `var_redirected_url_link_id`;
+    IF `var_redirected_url_link_id` IS NULL THEN
+        -- The link might be inserted by another transaction at the same time, so the link's ID is re-selected; if it is
+        --  still not found, the URL's hash collides with the hash of another URL, and the URL cannot be crawled
+        INSERT INTO `links` (`link_href_url`) VALUES (`param_redirected_url`)
+            ON DUPLICATE KEY UPDATE `link_id` = `link_id`;
+        SELECT `links`.`link_id` INTO `var_redirected_url_link_id` FROM `links`
+            WHERE `links`.`link_href_url_hash` = UNHEX(MD5(`param_redirected_url`))
+            AND `links`.`link_href_url` = `param_redirected_url`
+            LIMIT 1;
+        IF `var_redirected_url_link_id` IS NULL THEN
+            RETURN NULL;
         END IF;
+    END IF;
 
+    -- The link can be crawled only if it has never been crawled and is not being crawled at the moment, i.e. if it is in
+    --  the 'new' state (a newly added link is put into the crawl frontier by a trigger) - the link's row is locked, so
+    --  it cannot be claimed by other transactions at the same time (if it is being claimed by one, it is skipped)
+    SELECT `links`.`link_crawl_state` INTO `var_link_crawl_state` FROM `links`
+        WHERE `links`.`link_id` = `var_redirected_url_link_id`
+        LIMIT 1
+        FOR UPDATE SKIP LOCKED;
+    IF `var_link_crawl_state` IS NULL OR `var_link_crawl_state` != 'new' THEN
         RETURN NULL;
     END IF;
 
-    -- Otherwise, add a new link with the redirected URL to the links table and return it
-    INSERT INTO `links` (`link_href_url`) VALUES (`param_redirected_url`);
-    SELECT LAST_INSERT_ID() INTO `var_redirected_url_link_id`;
+    CALL `sng_proc__remove_link_from_crawl_frontier_links`(`var_redirected_url_link_id`);
     CALL `sng_proc__store_link_to_currently_crawled_links`(`param_crawler_id`, `var_redirected_url_link_id`);
     RETURN `var_redirected_url_link_id`;
 END
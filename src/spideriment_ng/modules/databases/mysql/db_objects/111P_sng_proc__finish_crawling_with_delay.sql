@@ -11,6 +11,8 @@ BEGIN
 
     CALL `sng_proc__remove_link_from_currently_crawled_links`(`param_link_id`);
 
-    INSERT INTO `link_crawling_delays` (`link_crawling_delay_link_id`, `link_crawling_delay_delayed_for`)
-        VALUES (`param_link_id`, `param_delayed_for`);
+    INSERT INTO `link_crawling_delays` (`link_crawling_delay_link_id`, `link_crawling_delay_delayed_for`, `link_crawling_delay_delayed_until`)
+        VALUES (`param_link_id`, `param_delayed_for`, DATE_ADD(CURRENT_TIMESTAMP, INTERVAL `param_delayed_for` SECOND));
+
+    UPDATE `links` SET `links`.`link_crawl_state` = 'delayed' WHERE `links`.`link_id` = `param_link_id`;
 END
@@ -35,4 +35,6 @@ BEGIN
 
     INSERT INTO `link_crawling_errors` (`link_crawling_error_link_id`, `link_crawling_error_reason`)
         VALUES (`param_link_id`, `param_error_reason`);
+
+    UPDATE `links` SET `links`.`link_crawl_state` = 'errored' WHERE `links`.`link_id` = `param_link_id`;
 END
@@ -0,0 +1,39 @@
+CREATE FUNCTION IF NOT EXISTS `sng_fn__finish_crawling_with_success_using_ids`
+(
+    `param_original_link_id` BIGINT UNSIGNED,
+    `param_final_link_id` BIGINT UNSIGNED,
+    `param_filetype_id` BIGINT UNSIGNED,
+    `param_language_id` BIGINT UNSIGNED,
+    `param_author_id` BIGINT UNSIGNED,
+    `param_title` TINYTEXT,
+    `param_description` TEXT
+)
+RETURNS BIGINT UNSIGNED
+NOT DETERMINISTIC SQL SECURITY INVOKER
+BEGIN
+    IF `param_original_link_id` IS NULL
+        OR `param_final_link_id` IS NULL
+        OR `param_filetype_id` IS NULL
+        OR `param_language_id` IS NULL
+        OR `param_author_id` IS NULL
+        OR `param_title` IS NULL
+        OR `param_description` IS NULL
+    THEN
+        SIGNAL SQLSTATE '45000' SET MESSAGE_TEXT = 'The input parameters of this procedure/function must not be NULL!';
+    END IF;
+
+    -- If the original link and the final link are the same, do not remove it "twice" (--> would result in an error)
+    IF `param_original_link_id` = `param_final_link_id` THEN
+        CALL `sng_proc__remove_link_from_currently_crawled_links`(`param_original_link_id`);
+    ELSE
+        CALL `sng_proc__remove_link_from_currently_crawled_links`(`param_original_link_id`);
+        CALL `sng_proc__remove_link_from_currently_crawled_links`(`param_final_link_id`);
+    END IF;
+
+    UPDATE `links` SET `links`.`link_crawl_state` = 'done'
+        WHERE `links`.`link_id` = `param_original_link_id` OR `links`.`link_id` = `param_final_link_id`;
+
+    INSERT INTO `documents` (`document_original_link_id`, `document_final_link_id`, `document_filetype_id`, `document_language_id`, `document_author_id`, `document_title`, `document_description`)
+        VALUES (`param_original_link_id`, `param_final_link_id`, `param_filetype_id`, `param_language_id`, `param_author_id`, `param_title`, `param_description`);
+    RETURN LAST_INSERT_ID();
+END
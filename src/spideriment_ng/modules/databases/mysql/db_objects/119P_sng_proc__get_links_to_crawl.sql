@@ -0,0 +1,48 @@
+CREATE PROCEDURE IF NOT EXISTS `sng_proc__get_links_to_crawl`
+(
+    IN `param_crawler_id` BIGINT UNSIGNED,
+    IN `param_max_link_count` INT UNSIGNED
+)
+NOT DETERMINISTIC SQL SECURITY INVOKER
+BEGIN
+    DECLARE `var_link_to_crawl_id` BIGINT UNSIGNED DEFAULT NULL;
+    DECLARE `var_link_to_crawl_delayed` BOOLEAN DEFAULT NULL;
+    DECLARE `var_link_count` INT UNSIGNED DEFAULT 0;
+
+    IF `param_crawler_id` IS NULL OR `param_max_link_count` IS NULL THEN
+        SIGNAL SQLSTATE '45000' SET MESSAGE_TEXT = 'The input parameters of this procedure/function must not be NULL!';
+    END IF;
+
+    -- The links are collected in a temporary table, so they can be returned to the client as a single result set (creating
+    --  and dropping temporary tables does not cause an implicit commit)
+    DROP TEMPORARY TABLE IF EXISTS `tmp_links_to_crawl`;
+    CREATE TEMPORARY TABLE `tmp_links_to_crawl` (
+        `tmp_link_to_crawl_link_id` BIGINT UNSIGNED NOT NULL,
+        `tmp_link_to_crawl_delayed` BOOLEAN NOT NULL,
+        PRIMARY KEY(`tmp_link_to_crawl_link_id`)
+    ) ENGINE = MEMORY;
+
+    -- Links whose delay has expired are preferred over links which have not been crawled yet, in the same way as when
+    --  getting links one by one
+    `link_loop`: WHILE `var_link_count` < `param_max_link_count` DO
+        SET `var_link_to_crawl_delayed` = TRUE;
+        SET `var_link_to_crawl_id` = `sng_fn__get_link_to_crawl_from_delayed_links`(`param_crawler_id`);
+        IF `var_link_to_crawl_id` IS NULL THEN
+            SET `var_link_to_crawl_delayed` = FALSE;
+            SET `var_link_to_crawl_id` = `sng_fn__get_link_to_crawl_from_links`(`param_crawler_id`);
+            IF `var_link_to_crawl_id` IS NULL THEN
+                LEAVE `link_loop`;
+            END IF;
+        END IF;
+
+        INSERT INTO `tmp_links_to_crawl` (`tmp_link_to_crawl_link_id`, `tmp_link_to_crawl_delayed`)
+            VALUES (`var_link_to_crawl_id`, `var_link_to_crawl_delayed`);
+        SET `var_link_count` = `var_link_count` + 1;
+    END WHILE `link_loop`;
+
+    SELECT `tmp_links_to_crawl`.`tmp_link_to_crawl_link_id`, `links`.`link_href_url`, `tmp_links_to_crawl`.`tmp_link_to_crawl_delayed`
+        FROM `tmp_links_to_crawl`
+        INNER JOIN `links` ON `links`.`link_id` = `tmp_links_to_crawl`.`tmp_link_to_crawl_link_id`;
+
+    DROP TEMPORARY TABLE `tmp_links_to_crawl`;
+END
@@ -0,0 +1,25 @@
+CREATE PROCEDURE IF NOT EXISTS `sng_proc__release_link_to_crawl`
+(
+    IN `param_link_id` BIGINT UNSIGNED,
+    IN `param_delayed` BOOLEAN
+)
+NOT DETERMINISTIC SQL SECURITY INVOKER
+BEGIN
+    IF `param_link_id` IS NULL OR `param_delayed` IS NULL THEN
+        SIGNAL SQLSTATE '45000' SET MESSAGE_TEXT = 'The input parameters of this procedure/function must not be NULL!';
+    END IF;
+
+    CALL `sng_proc__remove_link_from_currently_crawled_links`(`param_link_id`);
+
+    -- The link is put back where it was obtained from - a delayed link's delay had already expired, so it does not need
+    --  to be delayed any further
+    IF `param_delayed` THEN
+        INSERT INTO `link_crawling_delays` (`link_crawling_delay_link_id`, `link_crawling_delay_delayed_for`, `link_crawling_delay_delayed_until`)
+            VALUES (`param_link_id`, 0, CURRENT_TIMESTAMP);
+        UPDATE `links` SET `links`.`link_crawl_state` = 'delayed' WHERE `links`.`link_id` = `param_link_id`;
+    ELSE
+        INSERT INTO `crawl_frontier_links` (`crawl_frontier_link_link_id`, `crawl_frontier_link_random_key`)
+            VALUES (`param_link_id`, FLOOR(RAND() * 4294967296));
+        UPDATE `links` SET `links`.`link_crawl_state` = 'new' WHERE `links`.`link_id` = `param_link_id`;
+    END IF;
+END
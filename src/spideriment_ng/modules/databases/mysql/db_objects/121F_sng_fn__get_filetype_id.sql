@@ -0,0 +1,25 @@
+CREATE FUNCTION IF NOT EXISTS `sng_fn__get_filetype_id`
+(
+    `param_filetype_name` VARCHAR(32)
+)
+RETURNS BIGINT UNSIGNED
+NOT DETERMINISTIC SQL SECURITY INVOKER
+BEGIN
+    DECLARE `var_filetype_id` BIGINT UNSIGNED DEFAULT NULL;
+
+    IF `param_filetype_name` IS NULL THEN
+        SIGNAL SQLSTATE '45000' SET MESSAGE_TEXT = 'The input parameters of this procedure/function must not be NULL!';
+    END IF;
+
+    -- Get the ID of the supplied filetype (add it, if it is not present in the database)
+    SELECT `filetypes`.`filetype_id` INTO `var_filetype_id` FROM `filetypes`
+        WHERE `filetypes`.`filetype_name` = `param_filetype_name`
+        LIMIT 1;
+    IF `var_filetype_id` IS NULL THEN
+        INSERT INTO `filetypes` (`filetype_name`) VALUES (`param_filetype_name`)
+            ON DUPLICATE KEY UPDATE `filetype_id` = LAST_INSERT_ID(`filetype_id`);
+        SELECT LAST_INSERT_ID() INTO `var_filetype_id`;
+    END IF;
+
+    RETURN `var_filetype_id`;
+END
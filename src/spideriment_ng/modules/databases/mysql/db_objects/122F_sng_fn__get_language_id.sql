@@ -0,0 +1,25 @@
+CREATE FUNCTION IF NOT EXISTS `sng_fn__get_language_id`
+(
+    `param_language_code` VARCHAR(32)
+)
+RETURNS BIGINT UNSIGNED
+NOT DETERMINISTIC SQL SECURITY INVOKER
+BEGIN
+    DECLARE `var_language_id` BIGINT UNSIGNED DEFAULT NULL;
+
+    IF `param_language_code` IS NULL THEN
+        SIGNAL SQLSTATE '45000' SET MESSAGE_TEXT = 'The input parameters of this procedure/function must not be NULL!';
+    END IF;
+
+    -- Get the ID of the supplied language (add it, if it is not present in the database)
+    SELECT `languages`.`language_id` INTO `var_language_id` FROM `languages`
+        WHERE `languages`.`language_code` = `param_language_code`
+        LIMIT 1;
+    IF `var_language_id` IS NULL THEN
+        INSERT INTO `languages` (`language_code`) VALUES (`param_language_code`)
+            ON DUPLICATE KEY UPDATE `language_id` = LAST_INSERT_ID(`language_id`);
+        SELECT LAST_INSERT_ID() INTO `var_language_id`;
+    END IF;
+
+    RETURN `var_language_id`;
+END
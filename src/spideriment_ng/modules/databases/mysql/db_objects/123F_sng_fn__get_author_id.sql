@@ -0,0 +1,25 @@
+CREATE FUNCTION IF NOT EXISTS `sng_fn__get_author_id`
+(
+    `param_author_name` VARCHAR(128)
+)
+RETURNS BIGINT UNSIGNED
+NOT DETERMINISTIC SQL SECURITY INVOKER
+BEGIN
+    DECLARE `var_author_id` BIGINT UNSIGNED DEFAULT NULL;
+
+    IF `param_author_name` IS NULL THEN
+        SIGNAL SQLSTATE '45000' SET MESSAGE_TEXT = 'The input parameters of this procedure/function must not be NULL!';
+    END IF;
+
+    -- Get the ID of the supplied author (add it, if it is not present in the database)
+    SELECT `authors`.`author_id` INTO `var_author_id` FROM `authors`
+        WHERE `authors`.`author_name` = `param_author_name`
+        LIMIT 1;
+    IF `var_author_id` IS NULL THEN
+        INSERT INTO `authors` (`author_name`) VALUES (`param_author_name`)
+            ON DUPLICATE KEY UPDATE `author_id` = LAST_INSERT_ID(`author_id`);
+        SELECT LAST_INSERT_ID() INTO `var_author_id`;
+    END IF;
+
+    RETURN `var_author_id`;
+END
@@ -0,0 +1,18 @@
+CREATE FUNCTION IF NOT EXISTS `sng_fn__send_active_crawler_heartbeat`
+(
+    `param_crawler_id` BIGINT UNSIGNED
+)
+RETURNS BOOLEAN
+NOT DETERMINISTIC SQL SECURITY INVOKER
+BEGIN
+    IF `param_crawler_id` IS NULL THEN
+        SIGNAL SQLSTATE '45000' SET MESSAGE_TEXT = 'The input parameters of this procedure/function must not be NULL!';
+    END IF;
+
+    UPDATE `active_crawlers` SET `active_crawlers`.`active_crawler_last_heartbeat_at` = CURRENT_TIMESTAMP
+        WHERE `active_crawlers`.`active_crawler_id` = `param_crawler_id`;
+
+    -- ROW_COUNT() does not count rows whose values have not changed (which happens if two heartbeats are sent within the
+    --  same second), so the crawler's presence is checked separately; if it is not present, its leases have expired
+    RETURN EXISTS(SELECT 1 FROM `active_crawlers` WHERE `active_crawlers`.`active_crawler_id` = `param_crawler_id` LIMIT 1);
+END
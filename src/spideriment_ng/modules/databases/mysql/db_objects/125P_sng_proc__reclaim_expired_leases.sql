@@ -0,0 +1,42 @@
+CREATE PROCEDURE IF NOT EXISTS `sng_proc__reclaim_expired_leases`
+(
+    IN `param_lease_timeout` INT UNSIGNED
+)
+NOT DETERMINISTIC SQL SECURITY INVOKER
+BEGIN
+    DECLARE `var_expired_before` DATETIME DEFAULT NULL;
+    DECLARE `var_expired_crawler_count` BIGINT UNSIGNED DEFAULT 0;
+
+    IF `param_lease_timeout` IS NULL THEN
+        SIGNAL SQLSTATE '45000' SET MESSAGE_TEXT = 'The input parameters of this procedure/function must not be NULL!';
+    END IF;
+
+    SET `var_expired_before` = DATE_SUB(CURRENT_TIMESTAMP, INTERVAL `param_lease_timeout` SECOND);
+
+    -- Crawlers which have not sent a heartbeat in time are considered dead (e.g. their process has been killed). Since
+    --  they are looked up using the index on the heartbeat time, the check is cheap in the usual case when there are
+    --  none; they are locked, so they cannot be reclaimed by more transactions at the same time.
+    SELECT COUNT(*) INTO `var_expired_crawler_count` FROM `active_crawlers`
+        WHERE `active_crawlers`.`active_crawler_last_heartbeat_at` < `var_expired_before`
+        FOR UPDATE;
+
+    IF `var_expired_crawler_count` > 0 THEN
+        -- The links leased by the dead crawlers are returned to the crawl frontier, and the crawlers are unregistered
+        INSERT INTO `crawl_frontier_links` (`crawl_frontier_link_link_id`, `crawl_frontier_link_random_key`)
+            SELECT `currently_crawled_links`.`currently_crawled_link_link_id`, FLOOR(RAND() * 4294967296) FROM `currently_crawled_links`
+            INNER JOIN `active_crawlers` ON `active_crawlers`.`active_crawler_id` = `currently_crawled_links`.`currently_crawled_link_active_crawler_id`
+            WHERE `active_crawlers`.`active_crawler_last_heartbeat_at` < `var_expired_before`;
+
+        UPDATE `links`
+            INNER JOIN `currently_crawled_links` ON `currently_crawled_links`.`currently_crawled_link_link_id` = `links`.`link_id`
+            INNER JOIN `active_crawlers` ON `active_crawlers`.`active_crawler_id` = `currently_crawled_links`.`currently_crawled_link_active_crawler_id`
+            SET `links`.`link_crawl_state` = 'new'
+            WHERE `active_crawlers`.`active_crawler_last_heartbeat_at` < `var_expired_before`;
+
+        DELETE `currently_crawled_links` FROM `currently_crawled_links`
+            INNER JOIN `active_crawlers` ON `active_crawlers`.`active_crawler_id` = `currently_crawled_links`.`currently_crawled_link_active_crawler_id`
+            WHERE `active_crawlers`.`active_crawler_last_heartbeat_at` < `var_expired_before`;
+
+        DELETE FROM `active_crawlers` WHERE `active_crawlers`.`active_crawler_last_heartbeat_at` < `var_expired_before`;
+    END IF;
+END
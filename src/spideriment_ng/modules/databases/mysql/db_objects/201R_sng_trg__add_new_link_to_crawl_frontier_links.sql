@@ -0,0 +1,8 @@
+CREATE TRIGGER IF NOT EXISTS `sng_trg__add_new_link_to_crawl_frontier_links`
+AFTER INSERT ON `links` FOR EACH ROW
+BEGIN
+    -- Every newly discovered link is crawlable, so it is put into the crawl frontier straight away; the random key
+    --  makes the links get picked from the frontier in a random order (see 'sng_fn__get_link_to_crawl_from_links')
+    INSERT INTO `crawl_frontier_links` (`crawl_frontier_link_link_id`, `crawl_frontier_link_random_key`)
+        VALUES (NEW.`link_id`, FLOOR(RAND() * 4294967296));
+END
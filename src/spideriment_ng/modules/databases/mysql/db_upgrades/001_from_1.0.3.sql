@@ -0,0 +1,73 @@
+-- Upgrades a database created by Spideriment-NG 1.0.3 (or older) to the current schema. The database objects are created
+--  using 'CREATE ... IF NOT EXISTS' when a crawler starts, so new columns and indexes are never added to existing tables
+--  and the changed routines are never replaced - this has to be done manually by running this script.
+-- All crawlers using the database must be stopped while the script is running. The dropped routines and triggers are
+--  recreated by the first crawler which is started afterwards.
+
+DROP FUNCTION IF EXISTS `sng_fn__register_active_crawler`;
+DROP PROCEDURE IF EXISTS `sng_proc__unregister_active_crawler`;
+DROP PROCEDURE IF EXISTS `sng_proc__store_start_url_to_links`;
+DROP PROCEDURE IF EXISTS `sng_proc__store_link_to_currently_crawled_links`;
+DROP PROCEDURE IF EXISTS `sng_proc__remove_link_from_currently_crawled_links`;
+DROP PROCEDURE IF EXISTS `sng_proc__remove_link_from_link_crawling_delays`;
+DROP FUNCTION IF EXISTS `sng_fn__get_link_to_crawl_from_delayed_links`;
+DROP FUNCTION IF EXISTS `sng_fn__get_link_to_crawl_from_links`;
+DROP FUNCTION IF EXISTS `sng_fn__handle_redirected_url_in_delayed_links`;
+DROP FUNCTION IF EXISTS `sng_fn__handle_redirected_url_in_links`;
+DROP PROCEDURE IF EXISTS `sng_proc__finish_crawling_with_delay`;
+DROP PROCEDURE IF EXISTS `sng_proc__finish_crawling_with_error`;
+DROP FUNCTION IF EXISTS `sng_fn__finish_crawling_with_success`;
+DROP PROCEDURE IF EXISTS `sng_proc__add_content_snippet_to_document`;
+DROP PROCEDURE IF EXISTS `sng_proc__add_keyword_to_document`;
+DROP PROCEDURE IF EXISTS `sng_proc__add_link_to_document`;
+DROP PROCEDURE IF EXISTS `sng_proc__add_image_to_document`;
+
+-- The links leased by crawlers which have been killed were never returned to the database by the previous versions
+DELETE FROM `currently_crawled_links`;
+DELETE FROM `active_crawlers`;
+
+-- URLs are uniquely indexed by their (byte-exact) MD5 hashes; see CHANGES
+ALTER TABLE `links`
+    ADD COLUMN `link_href_url_hash` BINARY(16) AS (UNHEX(MD5(`link_href_url`))) STORED NOT NULL AFTER `link_href_url`,
+    ADD COLUMN `link_crawl_state` ENUM('new', 'leased', 'delayed', 'errored', 'done') NOT NULL DEFAULT 'new' AFTER `link_href_url_hash`,
+    DROP INDEX `link_href_url`,
+    ADD UNIQUE KEY(`link_href_url_hash`),
+    ADD INDEX(`link_crawl_state`);
+
+ALTER TABLE `images`
+    ADD COLUMN `image_src_url_hash` BINARY(16) AS (UNHEX(MD5(`image_src_url`))) STORED NOT NULL AFTER `image_src_url`,
+    DROP INDEX `image_src_url`,
+    ADD UNIQUE KEY(`image_src_url_hash`);
+
+ALTER TABLE `active_crawlers`
+    ADD COLUMN `active_crawler_last_heartbeat_at` DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP AFTER `active_crawler_active_since`,
+    ADD INDEX(`active_crawler_last_heartbeat_at`);
+
+ALTER TABLE `link_crawling_delays`
+    ADD COLUMN `link_crawling_delay_delayed_until` DATETIME NULL AFTER `link_crawling_delay_delayed_for`;
+UPDATE `link_crawling_delays`
+    SET `link_crawling_delay_delayed_until` = DATE_ADD(`link_crawling_delay_delayed_since`, INTERVAL `link_crawling_delay_delayed_for` SECOND);
+ALTER TABLE `link_crawling_delays`
+    MODIFY COLUMN `link_crawling_delay_delayed_until` DATETIME NOT NULL,
+    ADD INDEX(`link_crawling_delay_delayed_until`);
+
+-- The crawl state of each link is derived from the tables which used to be probed when picking links to crawl
+UPDATE `links` SET `links`.`link_crawl_state` = 'delayed'
+    WHERE EXISTS(SELECT 1 FROM `link_crawling_delays` WHERE `link_crawling_delays`.`link_crawling_delay_link_id` = `links`.`link_id`);
+UPDATE `links` SET `links`.`link_crawl_state` = 'errored'
+    WHERE EXISTS(SELECT 1 FROM `link_crawling_errors` WHERE `link_crawling_errors`.`link_crawling_error_link_id` = `links`.`link_id`);
+UPDATE `links` SET `links`.`link_crawl_state` = 'done'
+    WHERE EXISTS(SELECT 1 FROM `documents` WHERE `documents`.`document_original_link_id` = `links`.`link_id` OR `documents`.`document_final_link_id` = `links`.`link_id`);
+
+-- The links which have never been crawled form the crawl frontier (the same definition as in 'db_objects')
+CREATE TABLE IF NOT EXISTS `crawl_frontier_links` (
+    `crawl_frontier_link_id` BIGINT UNSIGNED NOT NULL AUTO_INCREMENT,
+    `crawl_frontier_link_link_id` BIGINT UNSIGNED NOT NULL,
+    `crawl_frontier_link_random_key` INT UNSIGNED NOT NULL,
+    PRIMARY KEY(`crawl_frontier_link_id`),
+    UNIQUE KEY(`crawl_frontier_link_link_id`),
+    INDEX(`crawl_frontier_link_random_key`),
+    CONSTRAINT `fk_crawl_frontier_link_link` FOREIGN KEY (`crawl_frontier_link_link_id`) REFERENCES `links`(`link_id`) ON UPDATE RESTRICT ON DELETE RESTRICT
+) CHARACTER SET utf8mb4 COLLATE utf8mb4_general_ci;
+INSERT INTO `crawl_frontier_links` (`crawl_frontier_link_link_id`, `crawl_frontier_link_random_key`)
+    SELECT `links`.`link_id`, FLOOR(RAND() * 4294967296) FROM `links` WHERE `links`.`link_crawl_state` = 'new';
@@ -0,0 +1,463 @@
+#!/bin/false
+
+# Copyright (c) 2022 Vít Labuda. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without modification, are permitted provided that the
+# following conditions are met:
+#  1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following
+#     disclaimer.
+#  2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the
+#     following disclaimer in the documentation and/or other materials provided with the distribution.
+#  3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote
+#     products derived from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES,
+# INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+from __future__ import annotations
+from typing import Final, Optional, Sequence, Tuple, Any, Callable
+import enum
+import functools
+import contextlib
+import os
+import os.path
+import glob
+import time
+import sqlite3
+from datalidator.blueprints.impl.ObjectBlueprint import ObjectBlueprint
+from spideriment_ng.SpiderimentConstants import SpiderimentConstants
+from spideriment_ng.helpers.containers.document.URLContainer import URLContainer
+from spideriment_ng.helpers.sqlite.SQLiteDatabaseThread import SQLiteDatabaseThread
+from spideriment_ng.modules.ModuleInfo import ModuleInfo
+from spideriment_ng.modules.ModuleType import ModuleType
+from spideriment_ng.modules.databases.CrawledURLHandleIface import CrawledURLHandleIface
+from spideriment_ng.modules.databases.DatabaseModuleIface import DatabaseModuleIface
+from spideriment_ng.modules.databases.crawlingresults.CrawlingResultBase import CrawlingResultBase
+from spideriment_ng.modules.databases.crawlingresults.CrawlingDelayResult import CrawlingDelayResult
+from spideriment_ng.modules.databases.crawlingresults.CrawlingErrorResult import CrawlingErrorResult
+from spideriment_ng.modules.databases.crawlingresults.CrawlingSuccessResult import CrawlingSuccessResult
+from spideriment_ng.modules.databases.sqlite._SQLiteDatabaseModuleConfigModel import _SQLiteDatabaseModuleConfigModel
+from spideriment_ng.modules.databases.sqlite._SQLiteCrawledURLHandle import _SQLiteCrawledURLHandle
+from spideriment_ng.modules.databases.sqlite._constants.EnumValues import EnumValues  # noqa
+from spideriment_ng.modules.databases.sqlite._constants.LinkCrawlStates import LinkCrawlStates  # noqa
+from spideriment_ng.modules.databases.sqlite._constants.Queries import Queries  # noqa
+from spideriment_ng.modules.databases.sqlite.exc.SQLiteDatabaseModuleBaseExc import SQLiteDatabaseModuleBaseExc
+from spideriment_ng.modules.databases.sqlite.exc.SQLiteOpeningFailureExc import SQLiteOpeningFailureExc
+from spideriment_ng.modules.databases.sqlite.exc.SQLiteClosingFailureExc import SQLiteClosingFailureExc
+from spideriment_ng.modules.databases.sqlite.exc.SQLiteQueryFailureExc import SQLiteQueryFailureExc
+from spideriment_ng.modules.databases.sqlite.exc.SQLiteNoMoreLinksToCrawlExc import SQLiteNoMoreLinksToCrawlExc
+from spideriment_ng.modules.databases.sqlite.exc.SQLiteUnacceptableRedirectedURLExc import SQLiteUnacceptableRedirectedURLExc
+from spideriment_ng.modules.databases.sqlite.exc.SQLiteLinkNotLeasedExc import SQLiteLinkNotLeasedExc
+from spideriment_ng.modules.databases.sqlite.exc.SQLiteCrawlerNotRegisteredExc import SQLiteCrawlerNotRegisteredExc
+
+
+# Decorator
+def _sqlite_async_exception_handling_context(func: Callable) -> Callable:
+    @functools.wraps(func)
+    async def _async_exception_handling_wrapper_function(self, *args, **kwargs) -> Any:
+        try:
+            return await func(self, *args, **kwargs)
+        except (SQLiteDatabaseModuleBaseExc, AssertionError) as e:
+            raise e
+        except sqlite3.Error as f:
+            raise SQLiteQueryFailureExc(self._database_file_path, os.getcwd(), str(f))
+
+    return _async_exception_handling_wrapper_function
+
+
+class SQLiteDatabaseModule(DatabaseModuleIface):
+    class _ModuleState(enum.Enum):
+        UNPREPARED = 10
+        OPERATIONAL = 20
+        CLEANED_UP = 30
+        BROKEN = 40
+
+    _MODULE_INFO: Final[ModuleInfo] = ModuleInfo(
+        type_=ModuleType.DATABASE,
+        name="sqlite",
+        configuration_blueprint=ObjectBlueprint(_SQLiteDatabaseModuleConfigModel)
+    )
+
+    # NOTE: This module behaves in the same way as the 'mysql' module (see the note there), but it stores the data in a
+    #  single SQLite database file, which is shared by all worker processes of the program. The database is operated in
+    #  the WAL mode, so readers do not block the writer, and each write operation is carried out in a single transaction
+    #  (crawling results are written in batches), so the processes do not have to wait for each other too often.
+    # All the database operations of a worker process are carried out in its own database thread (see
+    #  'SQLiteDatabaseThread').
+    # Crawlers (i.e. worker processes) send a heartbeat to the database whenever they obtain URLs to crawl or store
+    #  crawling results. The links leased by crawlers which have not sent a heartbeat for a long time (e.g. because
+    #  their process has been killed) are returned to the crawl frontier.
+
+    @classmethod
+    def get_module_info(cls) -> ModuleInfo:
+        return cls._MODULE_INFO
+
+    def __init__(self, database_thread: SQLiteDatabaseThread, database_file_path: str, lease_timeout: int, instance_name: str):
+        self._database_thread: Final[SQLiteDatabaseThread] = database_thread
+        self._database_connection: Final[sqlite3.Connection] = database_thread.get_database_connection()  # Only for use in the database thread!
+        self._database_file_path: Final[str] = database_file_path
+        self._lease_timeout: Final[int] = lease_timeout
+        self._instance_name: Final[str] = instance_name
+        self._state: SQLiteDatabaseModule._ModuleState = self.__class__._ModuleState.UNPREPARED
+        self._active_crawler_id: Optional[int] = None
+        self._active_crawler_reclaimed: bool = False  # = True if another crawler has reclaimed this crawler's leases
+
+    @classmethod
+    async def create_instance(cls, module_options: _SQLiteDatabaseModuleConfigModel, instance_name: str) -> SQLiteDatabaseModule:
+        database_file_path = module_options.database_file_path
+
+        try:
+            database_thread = await SQLiteDatabaseThread.open(database_file_path, module_options.busy_timeout, ("PRAGMA foreign_keys = ON;",))
+        except sqlite3.Error as e:
+            raise SQLiteOpeningFailureExc(database_file_path, os.getcwd(), str(e))
+
+        module_instance = cls(database_thread, database_file_path, module_options.lease_timeout, instance_name)
+        await module_instance._prepare_database_on_client_connection()
+
+        return module_instance
+
+    async def destroy_instance(self) -> None:
+        assert (self._state == self.__class__._ModuleState.OPERATIONAL)
+
+        pending_exception = None
+
+        try:
+            await self._cleanup_database_on_client_disconnection()
+        finally:
+            try:
+                await self._database_thread.close()
+            except Exception as e:
+                pending_exception = e
+
+        # This "prioritizes" exceptions raised in the 'try' block over exceptions raised in the 'finally' block
+        #  (Exceptions from the 'finally' block are re-raised only if no exceptions were raised in the 'try' block)
+        if isinstance(pending_exception, AssertionError):
+            raise pending_exception
+        if pending_exception is not None:
+            raise SQLiteClosingFailureExc(self._database_file_path, os.getcwd(), str(pending_exception))
+
+    @_sqlite_async_exception_handling_context
+    async def _prepare_database_on_client_connection(self) -> None:
+        assert (self._state == self.__class__._ModuleState.UNPREPARED)
+
+        try:
+            await self._database_thread.run(self._create_database_objects)
+            await self._database_thread.run(self._register_active_crawler)
+        except Exception as e:
+            self._state = self.__class__._ModuleState.BROKEN
+            raise e
+        else:
+            self._state = self.__class__._ModuleState.OPERATIONAL
+
+    def _create_database_objects(self) -> None:
+        db_object_files_glob = os.path.join(os.path.dirname(os.path.realpath(__file__)), "db_objects/*.sql")
+
+        create_scripts = []
+        for filepath in sorted(glob.glob(db_object_files_glob)):
+            with open(filepath) as file:
+                create_scripts.append(file.read())
+
+        assert (len(create_scripts) > 0)
+
+        for create_script in create_scripts:
+            self._database_connection.executescript(create_script)
+
+    def _register_active_crawler(self) -> None:
+        assert (self._active_crawler_id is None)
+
+        with self._database_transaction() as cursor:
+            cursor.execute(Queries.REGISTER_ACTIVE_CRAWLER, (self._instance_name, "Spideriment-NG", SpiderimentConstants.PROGRAM_VERSION, self._get_current_timestamp()))
+            self._active_crawler_id = cursor.lastrowid
+
+    @_sqlite_async_exception_handling_context
+    async def _cleanup_database_on_client_disconnection(self) -> None:
+        assert (self._state == self.__class__._ModuleState.OPERATIONAL)
+
+        try:
+            await self._database_thread.run(self._unregister_active_crawler)
+        except Exception as e:
+            self._state = self.__class__._ModuleState.BROKEN
+            raise e
+        else:
+            self._state = self.__class__._ModuleState.CLEANED_UP
+
+    def _unregister_active_crawler(self) -> None:
+        assert (self._active_crawler_id is not None)
+
+        # A crawler whose leases have expired has already been unregistered by the crawler which reclaimed them (and its
+        #  ID might have been reused by a newly registered crawler since then)
+        if not self._active_crawler_reclaimed:
+            with self._database_transaction() as cursor:
+                cursor.execute(Queries.RELEASE_LINKS_LEASED_BY_ACTIVE_CRAWLER, (self._active_crawler_id,))
+                cursor.execute(Queries.UNREGISTER_ACTIVE_CRAWLER, (self._active_crawler_id,))
+                if cursor.rowcount != 1:
+                    raise SQLiteCrawlerNotRegisteredExc(self._active_crawler_id)
+
+        self._active_crawler_id = None
+
+    @_sqlite_async_exception_handling_context
+    async def announce_start_urls(self, validated_absolute_start_urls: Sequence[URLContainer]) -> None:
+        assert (self._state == self.__class__._ModuleState.OPERATIONAL)
+        assert (len(validated_absolute_start_urls) > 0)
+        for url in validated_absolute_start_urls:
+            assert (url.is_validated() and url.is_certainly_absolute())
+
+        await self._database_thread.run(self._announce_start_urls_in_database_thread, validated_absolute_start_urls)
+
+    def _announce_start_urls_in_database_thread(self, validated_absolute_start_urls: Sequence[URLContainer]) -> None:
+        with self._database_transaction() as cursor:
+            cursor.executemany(Queries.ADD_LINK, [(start_url_container.get_url(),) for start_url_container in validated_absolute_start_urls])
+
+    @_sqlite_async_exception_handling_context
+    async def get_urls_to_crawl(self, max_url_count: int) -> Sequence[CrawledURLHandleIface]:
+        assert (self._state == self.__class__._ModuleState.OPERATIONAL)
+        assert (self._active_crawler_id is not None)
+        assert (max_url_count > 0)
+
+        url_handles = await self._database_thread.run(self._get_urls_to_crawl_in_database_thread, max_url_count)
+        if len(url_handles) == 0:
+            raise SQLiteNoMoreLinksToCrawlExc()
+
+        assert (len(url_handles) <= max_url_count)
+        return url_handles
+
+    def _get_urls_to_crawl_in_database_thread(self, max_url_count: int) -> Sequence[_SQLiteCrawledURLHandle]:
+        current_timestamp = self._get_current_timestamp()
+
+        with self._database_transaction() as cursor:
+            self._send_heartbeat_and_reclaim_expired_leases(cursor, current_timestamp)
+
+            # Links whose delay has expired are preferred over links which have not been crawled yet
+            delayed_link_rows = cursor.execute(Queries.GET_DELAYED_LINKS_TO_CRAWL, (current_timestamp, max_url_count)).fetchall()
+            new_link_rows = []
+            if len(delayed_link_rows) < max_url_count:
+                new_link_rows = cursor.execute(Queries.GET_NEW_LINKS_TO_CRAWL, (max_url_count - len(delayed_link_rows),)).fetchall()
+
+            url_handles = [
+                _SQLiteCrawledURLHandle(
+                    link_id=int(link_id),
+                    url_in_container=URLContainer(validated=False, certainly_absolute=True, url=str(link_url)),
+                    delayed=delayed,
+                    redirected=False
+                ) for link_rows, delayed in ((delayed_link_rows, True), (new_link_rows, False)) for link_id, link_url in link_rows
+            ]
+
+            cursor.executemany(Queries.LEASE_LINK, [(self._active_crawler_id, url_handle.get_link_id()) for url_handle in url_handles])
+
+        return url_handles
+
+    @_sqlite_async_exception_handling_context
+    async def release_urls_to_crawl(self, unused_urls: Sequence[CrawledURLHandleIface]) -> None:
+        assert (self._state == self.__class__._ModuleState.OPERATIONAL)
+        for url in unused_urls:
+            assert (isinstance(url, _SQLiteCrawledURLHandle) and (not url.is_redirected()))
+
+        if len(unused_urls) == 0:
+            return
+
+        await self._database_thread.run(self._release_urls_to_crawl_in_database_thread, unused_urls)
+
+    def _release_urls_to_crawl_in_database_thread(self, unused_urls: Sequence[_SQLiteCrawledURLHandle]) -> None:
+        current_timestamp = self._get_current_timestamp()
+
+        with self._database_transaction() as cursor:
+            for unused_url in unused_urls:
+                # The link is put back where it was obtained from - a delayed link's delay had already expired, so it
+                #  does not need to be delayed any further
+                if unused_url.was_delayed():
+                    self._end_link_lease(cursor, unused_url.get_link_id(), LinkCrawlStates.DELAYED, 0, current_timestamp)
+                else:
+                    self._end_link_lease(cursor, unused_url.get_link_id(), LinkCrawlStates.NEW, None, None)
+
+    @_sqlite_async_exception_handling_context
+    async def announce_redirected_url(self, original_url: CrawledURLHandleIface, validated_absolute_redirected_url: URLContainer) -> CrawledURLHandleIface:
+        assert (self._state == self.__class__._ModuleState.OPERATIONAL)
+        assert (self._active_crawler_id is not None)
+        assert (isinstance(original_url, _SQLiteCrawledURLHandle) and (not original_url.is_redirected()))
+        assert (validated_absolute_redirected_url.is_validated() and validated_absolute_redirected_url.is_certainly_absolute())
+
+        redirected_url = validated_absolute_redirected_url.get_url()
+        assert (original_url.get_url_in_container().get_url() != redirected_url)
+
+        link_id, delayed = await self._database_thread.run(self._lease_redirected_url_in_database_thread, redirected_url)
+
+        return _SQLiteCrawledURLHandle(
+            link_id=link_id,
+            url_in_container=URLContainer(validated=False, certainly_absolute=True, url=redirected_url),
+            delayed=delayed,
+            redirected=True
+        )
+
+    def _lease_redirected_url_in_database_thread(self, redirected_url: str) -> Tuple[int, bool]:
+        current_timestamp = self._get_current_timestamp()
+
+        with self._database_transaction() as cursor:
+            cursor.execute(Queries.ADD_LINK, (redirected_url,))
+            link_row = cursor.execute(Queries.GET_LINK_STATE_BY_URL, (redirected_url,)).fetchone()
+            if link_row is None:
+                raise SQLiteUnacceptableRedirectedURLExc(redirected_url)
+
+            link_id, link_crawl_state, link_delayed_until = link_row
+
+            # The link can be crawled only if it has never been crawled and is not being crawled at the moment, or if it
+            #  is delayed and its delay has already expired
+            if link_crawl_state == LinkCrawlStates.NEW:
+                delayed = False
+            elif (link_crawl_state == LinkCrawlStates.DELAYED) and (link_delayed_until <= current_timestamp):
+                delayed = True
+            else:
+                raise SQLiteUnacceptableRedirectedURLExc(redirected_url)
+
+            cursor.execute(Queries.LEASE_LINK, (self._active_crawler_id, link_id))
+
+        return int(link_id), delayed
+
+    @_sqlite_async_exception_handling_context
+    async def finish_crawling(self, crawling_results: Sequence[CrawlingResultBase]) -> None:
+        assert (self._state == self.__class__._ModuleState.OPERATIONAL)
+        assert (len(crawling_results) > 0)
+
+        await self._database_thread.run(self._finish_crawling_in_database_thread, crawling_results)
+
+    def _finish_crawling_in_database_thread(self, crawling_results: Sequence[CrawlingResultBase]) -> None:
+        current_timestamp = self._get_current_timestamp()
+
+        # All the results are stored in a single transaction (i.e. they are "group-committed")
+        with self._database_transaction() as cursor:
+            self._send_heartbeat_and_reclaim_expired_leases(cursor, current_timestamp)
+
+            for crawling_result in crawling_results:
+                if isinstance(crawling_result, CrawlingDelayResult):
+                    self._store_crawling_delay_result(cursor, crawling_result, current_timestamp)
+                elif isinstance(crawling_result, CrawlingErrorResult):
+                    self._store_crawling_error_result(cursor, crawling_result)
+                elif isinstance(crawling_result, CrawlingSuccessResult):
+                    self._store_crawling_success_result(cursor, crawling_result)
+                else:
+                    raise AssertionError(f"Invalid crawling result: {repr(crawling_result)}")
+
+    def _store_crawling_delay_result(self, cursor: sqlite3.Cursor, crawling_result: CrawlingDelayResult, current_timestamp: int) -> None:
+        original_url = crawling_result.get_original_url()
+        delay_seconds = crawling_result.get_delay_seconds()
+        assert (isinstance(original_url, _SQLiteCrawledURLHandle) and (not original_url.is_redirected()))
+        assert (delay_seconds > 0)
+
+        self._end_link_lease(cursor, original_url.get_link_id(), LinkCrawlStates.DELAYED, delay_seconds, (current_timestamp + delay_seconds))
+
+    def _store_crawling_error_result(self, cursor: sqlite3.Cursor, crawling_result: CrawlingErrorResult) -> None:
+        original_url = crawling_result.get_original_url()
+        redirected_url = crawling_result.get_redirected_url()
+        error_reason = crawling_result.get_error_reason()
+        assert (isinstance(original_url, _SQLiteCrawledURLHandle) and (not original_url.is_redirected()))
+        if redirected_url is not None:
+            assert (isinstance(redirected_url, _SQLiteCrawledURLHandle) and redirected_url.is_redirected())
+            assert (original_url.get_link_id() != redirected_url.get_link_id())
+
+        erroneous_link_ids = [original_url.get_link_id()]
+        if redirected_url is not None:
+            erroneous_link_ids.append(redirected_url.get_link_id())
+        error_reason_sqlite_value = EnumValues.get_link_crawling_error_reason(error_reason)
+
+        for erroneous_link_id in erroneous_link_ids:
+            self._end_link_lease(cursor, erroneous_link_id, LinkCrawlStates.ERRORED, None, None)
+            cursor.execute(Queries.ADD_LINK_CRAWLING_ERROR, (erroneous_link_id, error_reason_sqlite_value))
+
+    def _store_crawling_success_result(self, cursor: sqlite3.Cursor, crawling_result: CrawlingSuccessResult) -> None:
+        original_url = crawling_result.get_original_url()
+        redirected_url = crawling_result.get_redirected_url()
+        validated_document = crawling_result.get_validated_document()
+        assert (isinstance(original_url, _SQLiteCrawledURLHandle) and (not original_url.is_redirected()))
+        if redirected_url is not None:
+            assert (isinstance(redirected_url, _SQLiteCrawledURLHandle) and redirected_url.is_redirected())
+            assert (original_url.get_link_id() != redirected_url.get_link_id())
+        assert validated_document.is_validated()
+        for content_snippet in validated_document.get_content_snippets():
+            assert content_snippet.is_validated()
+        for link in validated_document.get_links():
+            assert link.is_validated()
+            assert link.get_href_url().is_validated()
+        for image in validated_document.get_images():
+            assert image.is_validated()
+            assert image.get_src_url().is_validated()
+
+        original_link_id = original_url.get_link_id()
+        final_link_id = (redirected_url.get_link_id() if (redirected_url is not None) else original_link_id)
+
+        self._end_link_lease(cursor, original_link_id, LinkCrawlStates.DONE, None, None)
+        if final_link_id != original_link_id:
+            self._end_link_lease(cursor, final_link_id, LinkCrawlStates.DONE, None, None)
+
+        filetype_id = self._get_or_add_value_id(cursor, Queries.ADD_FILETYPE, Queries.GET_FILETYPE_ID, validated_document.get_file_type())
+        language_id = self._get_or_add_value_id(cursor, Queries.ADD_LANGUAGE, Queries.GET_LANGUAGE_ID, validated_document.get_language())
+        author_id = self._get_or_add_value_id(cursor, Queries.ADD_AUTHOR, Queries.GET_AUTHOR_ID, validated_document.get_author())
+
+        cursor.execute(Queries.ADD_DOCUMENT, (original_link_id, final_link_id, filetype_id, language_id, author_id, validated_document.get_title(), validated_document.get_description()))
+        document_id = cursor.lastrowid
+
+        # The collections are inserted in batches; SQLite does not need to parse the statements for each row again
+        keywords = validated_document.get_keywords()
+        cursor.executemany(Queries.ADD_KEYWORD, [(keyword,) for keyword in keywords])
+        cursor.executemany(Queries.ADD_KEYWORD_TO_DOCUMENT, [(document_id, keyword) for keyword in keywords])
+
+        cursor.executemany(Queries.ADD_CONTENT_SNIPPET_TO_DOCUMENT, [
+            (document_id, EnumValues.get_content_snippet_type(content_snippet.get_snippet_type()), content_snippet.get_snippet_text())
+            for content_snippet in validated_document.get_content_snippets()
+        ])
+
+        links = validated_document.get_links()
+        cursor.executemany(Queries.ADD_LINK, [(link.get_href_url().get_url(),) for link in links])
+        cursor.executemany(Queries.ADD_LINK_TO_DOCUMENT, [(document_id, link.get_link_text(), link.get_href_url().get_url()) for link in links])
+
+        images = validated_document.get_images()
+        cursor.executemany(Queries.ADD_IMAGE, [(image.get_src_url().get_url(),) for image in images])
+        cursor.executemany(Queries.ADD_IMAGE_TO_DOCUMENT, [(document_id, image.get_alt_text(), image.get_title_text(), image.get_src_url().get_url()) for image in images])
+
+    def _get_or_add_value_id(self, cursor: sqlite3.Cursor, add_query: str, get_id_query: str, value: str) -> int:
+        cursor.execute(add_query, (value,))
+        id_row = cursor.execute(get_id_query, (value,)).fetchone()
+        if id_row is None:
+            raise SQLiteQueryFailureExc(self._database_file_path, os.getcwd(), f"The ID of {repr(value)} could not be obtained!")
+
+        return int(id_row[0])
+
+    def _end_link_lease(self, cursor: sqlite3.Cursor, link_id: int, new_link_crawl_state: str, delayed_for: Optional[int], delayed_until: Optional[int]) -> None:
+        assert (new_link_crawl_state != LinkCrawlStates.LEASED)
+
+        cursor.execute(Queries.END_LINK_LEASE, (new_link_crawl_state, delayed_for, delayed_until, link_id, self._active_crawler_id))
+        if cursor.rowcount != 1:
+            raise SQLiteLinkNotLeasedExc(link_id)
+
+    def _send_heartbeat_and_reclaim_expired_leases(self, cursor: sqlite3.Cursor, current_timestamp: int) -> None:
+        cursor.execute(Queries.SEND_ACTIVE_CRAWLER_HEARTBEAT, (current_timestamp, self._active_crawler_id))
+        if cursor.rowcount != 1:
+            self._active_crawler_reclaimed = True
+            raise SQLiteCrawlerNotRegisteredExc(self._active_crawler_id)
+
+        expired_before = (current_timestamp - self._lease_timeout)
+        cursor.execute(Queries.RECLAIM_EXPIRED_LEASES, (expired_before,))
+        cursor.execute(Queries.REMOVE_EXPIRED_ACTIVE_CRAWLERS, (expired_before,))
+
+    @contextlib.contextmanager
+    def _database_transaction(self) -> sqlite3.Cursor:
+        # 'BEGIN IMMEDIATE' acquires the database's write lock straight away (waiting up to the busy timeout for other
+        #  processes to release it), so a transaction can never fail when upgrading from a read to a write lock
+        cursor = self._database_connection.cursor()
+        try:
+            cursor.execute("BEGIN IMMEDIATE;")
+            try:
+                yield cursor
+            except BaseException as e:
+                cursor.execute("ROLLBACK;")
+                raise e
+            cursor.execute("COMMIT;")
+        finally:
+            cursor.close()
+
+    def _get_current_timestamp(self) -> int:
+        return int(time.time())
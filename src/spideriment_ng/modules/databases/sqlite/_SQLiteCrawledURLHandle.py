@@ -0,0 +1,45 @@
+#!/bin/false
+
+# Copyright (c) 2022 Vít Labuda. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without modification, are permitted provided that the
+# following conditions are met:
+#  1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following
+#     disclaimer.
+#  2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the
+#     following disclaimer in the documentation and/or other materials provided with the distribution.
+#  3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote
+#     products derived from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES,
+# INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+from typing import Final
+from spideriment_ng.helpers.containers.document.URLContainer import URLContainer
+from spideriment_ng.modules.databases.CrawledURLHandleIface import CrawledURLHandleIface
+
+
+class _SQLiteCrawledURLHandle(CrawledURLHandleIface):
+    def __init__(self, link_id: int, url_in_container: URLContainer, delayed: bool, redirected: bool):
+        self._link_id: Final[int] = link_id
+        self._url_in_container: Final[URLContainer] = url_in_container
+        self._delayed: Final[bool] = delayed
+        self._redirected: Final[bool] = redirected
+
+    def get_link_id(self) -> int:
+        return self._link_id
+
+    def get_url_in_container(self) -> URLContainer:
+        return self._url_in_container
+
+    def was_delayed(self) -> bool:
+        return self._delayed
+
+    def is_redirected(self) -> bool:
+        return self._redirected
@@ -0,0 +1,140 @@
+#!/bin/false
+
+# Copyright (c) 2022 Vít Labuda. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without modification, are permitted provided that the
+# following conditions are met:
+#  1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following
+#     disclaimer.
+#  2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the
+#     following disclaimer in the documentation and/or other materials provided with the distribution.
+#  3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote
+#     products derived from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES,
+# INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+from typing import final, Final
+from spideriment_ng.helpers.UninstantiableClassMixin import UninstantiableClassMixin
+
+
+@final
+class Queries(UninstantiableClassMixin):
+    # Timestamps are stored as UNIX timestamps (integers) and supplied by the program, so they can be compared easily.
+
+    REGISTER_ACTIVE_CRAWLER: Final[str] = """
+        INSERT INTO `active_crawlers` (`active_crawler_instance_name`, `active_crawler_program_name`, `active_crawler_program_version`, `active_crawler_last_heartbeat_at`)
+        VALUES (?, ?, ?, ?);
+    """
+
+    UNREGISTER_ACTIVE_CRAWLER: Final[str] = """
+        DELETE FROM `active_crawlers` WHERE `active_crawlers`.`active_crawler_id` = ?;
+    """
+
+    SEND_ACTIVE_CRAWLER_HEARTBEAT: Final[str] = """
+        UPDATE `active_crawlers` SET `active_crawler_last_heartbeat_at` = ?
+        WHERE `active_crawlers`.`active_crawler_id` = ?;
+    """
+
+    # The links leased by crawlers which have not sent a heartbeat in time (e.g. because their process has been killed)
+    #  are returned to the crawl frontier, and the crawlers are unregistered afterwards
+    RECLAIM_EXPIRED_LEASES: Final[str] = """
+        UPDATE `links` SET `link_crawl_state` = 'new', `link_leased_by_active_crawler_id` = NULL
+        WHERE `links`.`link_crawl_state` = 'leased' AND `links`.`link_leased_by_active_crawler_id` IN (
+            SELECT `active_crawlers`.`active_crawler_id` FROM `active_crawlers` WHERE `active_crawlers`.`active_crawler_last_heartbeat_at` < ?
+        );
+    """
+
+    REMOVE_EXPIRED_ACTIVE_CRAWLERS: Final[str] = """
+        DELETE FROM `active_crawlers` WHERE `active_crawlers`.`active_crawler_last_heartbeat_at` < ?;
+    """
+
+    # The links still leased by a crawler which is being unregistered (e.g. because their crawling results could not be
+    #  stored) are returned to the crawl frontier, as they would otherwise prevent the crawler from being unregistered
+    RELEASE_LINKS_LEASED_BY_ACTIVE_CRAWLER: Final[str] = """
+        UPDATE `links` SET `link_crawl_state` = 'new', `link_leased_by_active_crawler_id` = NULL
+        WHERE `links`.`link_crawl_state` = 'leased' AND `links`.`link_leased_by_active_crawler_id` = ?;
+    """
+
+    # Both of the following queries are answered using partial indexes (see the definition of the links table)
+    GET_DELAYED_LINKS_TO_CRAWL: Final[str] = """
+        SELECT `links`.`link_id`, `links`.`link_href_url` FROM `links`
+        WHERE `links`.`link_crawl_state` = 'delayed' AND `links`.`link_delayed_until` <= ?
+        ORDER BY `links`.`link_delayed_until`
+        LIMIT ?;
+    """
+
+    GET_NEW_LINKS_TO_CRAWL: Final[str] = """
+        SELECT `links`.`link_id`, `links`.`link_href_url` FROM `links`
+        WHERE `links`.`link_crawl_state` = 'new'
+        ORDER BY `links`.`link_random_key`
+        LIMIT ?;
+    """
+
+    GET_LINK_STATE_BY_URL: Final[str] = """
+        SELECT `links`.`link_id`, `links`.`link_crawl_state`, `links`.`link_delayed_until` FROM `links`
+        WHERE `links`.`link_href_url` = ?;
+    """
+
+    LEASE_LINK: Final[str] = """
+        UPDATE `links` SET `link_crawl_state` = 'leased', `link_leased_by_active_crawler_id` = ?, `link_delayed_for` = NULL, `link_delayed_until` = NULL
+        WHERE `links`.`link_id` = ?;
+    """
+
+    # Only links leased by the crawler ending the lease are affected
+    END_LINK_LEASE: Final[str] = """
+        UPDATE `links` SET `link_crawl_state` = ?, `link_leased_by_active_crawler_id` = NULL, `link_delayed_for` = ?, `link_delayed_until` = ?
+        WHERE `links`.`link_id` = ? AND `links`.`link_crawl_state` = 'leased' AND `links`.`link_leased_by_active_crawler_id` = ?;
+    """
+
+    ADD_LINK_CRAWLING_ERROR: Final[str] = """
+        INSERT INTO `link_crawling_errors` (`link_crawling_error_link_id`, `link_crawling_error_reason`)
+        VALUES (?, ?);
+    """
+
+    ADD_FILETYPE: Final[str] = "INSERT OR IGNORE INTO `filetypes` (`filetype_name`) VALUES (?);"
+    GET_FILETYPE_ID: Final[str] = "SELECT `filetypes`.`filetype_id` FROM `filetypes` WHERE `filetypes`.`filetype_name` = ?;"
+
+    ADD_LANGUAGE: Final[str] = "INSERT OR IGNORE INTO `languages` (`language_code`) VALUES (?);"
+    GET_LANGUAGE_ID: Final[str] = "SELECT `languages`.`language_id` FROM `languages` WHERE `languages`.`language_code` = ?;"
+
+    ADD_AUTHOR: Final[str] = "INSERT OR IGNORE INTO `authors` (`author_name`) VALUES (?);"
+    GET_AUTHOR_ID: Final[str] = "SELECT `authors`.`author_id` FROM `authors` WHERE `authors`.`author_name` = ?;"
+
+    ADD_DOCUMENT: Final[str] = """
+        INSERT INTO `documents` (`document_original_link_id`, `document_final_link_id`, `document_filetype_id`, `document_language_id`, `document_author_id`, `document_title`, `document_description`)
+        VALUES (?, ?, ?, ?, ?, ?, ?);
+    """
+
+    ADD_KEYWORD: Final[str] = "INSERT OR IGNORE INTO `keywords` (`keyword_text`) VALUES (?);"
+
+    ADD_KEYWORD_TO_DOCUMENT: Final[str] = """
+        INSERT INTO `document_keyword_pairs` (`document_keyword_pair_document_id`, `document_keyword_pair_keyword_id`)
+        SELECT ?, `keywords`.`keyword_id` FROM `keywords` WHERE `keywords`.`keyword_text` = ?;
+    """
+
+    ADD_CONTENT_SNIPPET_TO_DOCUMENT: Final[str] = """
+        INSERT INTO `content_snippets` (`content_snippet_document_id`, `content_snippet_type`, `content_snippet_text`)
+        VALUES (?, ?, ?);
+    """
+
+    # New links are put into the crawl frontier automatically (thanks to the default values of the links table's columns)
+    ADD_LINK: Final[str] = "INSERT OR IGNORE INTO `links` (`link_href_url`) VALUES (?);"
+
+    ADD_LINK_TO_DOCUMENT: Final[str] = """
+        INSERT INTO `document_link_pairs` (`document_link_pair_document_id`, `document_link_pair_link_id`, `document_link_pair_link_text`)
+        SELECT ?, `links`.`link_id`, ? FROM `links` WHERE `links`.`link_href_url` = ?;
+    """
+
+    ADD_IMAGE: Final[str] = "INSERT OR IGNORE INTO `images` (`image_src_url`) VALUES (?);"
+
+    ADD_IMAGE_TO_DOCUMENT: Final[str] = """
+        INSERT INTO `document_image_pairs` (`document_image_pair_document_id`, `document_image_pair_image_id`, `document_image_pair_image_alt_text`, `document_image_pair_image_title_text`)
+        SELECT ?, `images`.`image_id`, ?, ? FROM `images` WHERE `images`.`image_src_url` = ?;
+    """
@@ -0,0 +1,4 @@
+CREATE TABLE IF NOT EXISTS `filetypes` (
+    `filetype_id` INTEGER NOT NULL PRIMARY KEY,
+    `filetype_name` TEXT NOT NULL UNIQUE
+);
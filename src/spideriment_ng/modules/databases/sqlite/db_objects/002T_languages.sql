@@ -0,0 +1,4 @@
+CREATE TABLE IF NOT EXISTS `languages` (
+    `language_id` INTEGER NOT NULL PRIMARY KEY,
+    `language_code` TEXT NOT NULL UNIQUE
+);
@@ -0,0 +1,4 @@
+CREATE TABLE IF NOT EXISTS `authors` (
+    `author_id` INTEGER NOT NULL PRIMARY KEY,
+    `author_name` TEXT NOT NULL UNIQUE
+);
@@ -0,0 +1,4 @@
+CREATE TABLE IF NOT EXISTS `keywords` (
+    `keyword_id` INTEGER NOT NULL PRIMARY KEY,
+    `keyword_text` TEXT NOT NULL UNIQUE
+);
@@ -0,0 +1,10 @@
+CREATE TABLE IF NOT EXISTS `active_crawlers` (
+    `active_crawler_id` INTEGER NOT NULL PRIMARY KEY,
+    `active_crawler_instance_name` TEXT NOT NULL,
+    `active_crawler_program_name` TEXT NOT NULL,
+    `active_crawler_program_version` TEXT NOT NULL,
+    `active_crawler_active_since` TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    `active_crawler_last_heartbeat_at` INTEGER NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS `idx_active_crawler_last_heartbeat_at` ON `active_crawlers`(`active_crawler_last_heartbeat_at`);
@@ -0,0 +1,16 @@
+-- Unlike in the 'mysql' module, the crawl state of a link (including its lease and delay) is stored directly in the
+--  links table. The crawl frontier, the delayed links and the leased links are indexed using partial indexes, so each of
+--  the indexes contains only the links in the corresponding state.
+CREATE TABLE IF NOT EXISTS `links` (
+    `link_id` INTEGER NOT NULL PRIMARY KEY,
+    `link_href_url` TEXT NOT NULL UNIQUE,
+    `link_crawl_state` TEXT NOT NULL DEFAULT 'new' CHECK(`link_crawl_state` IN ('new', 'leased', 'delayed', 'errored', 'done')),
+    `link_random_key` INTEGER NOT NULL DEFAULT (RANDOM()),
+    `link_leased_by_active_crawler_id` INTEGER NULL REFERENCES `active_crawlers`(`active_crawler_id`) ON UPDATE RESTRICT ON DELETE RESTRICT,
+    `link_delayed_for` INTEGER NULL,
+    `link_delayed_until` INTEGER NULL
+);
+
+CREATE INDEX IF NOT EXISTS `idx_link_crawl_frontier` ON `links`(`link_random_key`) WHERE `link_crawl_state` = 'new';
+CREATE INDEX IF NOT EXISTS `idx_link_delayed_until` ON `links`(`link_delayed_until`) WHERE `link_crawl_state` = 'delayed';
+CREATE INDEX IF NOT EXISTS `idx_link_leased_by_active_crawler_id` ON `links`(`link_leased_by_active_crawler_id`) WHERE `link_crawl_state` = 'leased';
@@ -0,0 +1,4 @@
+CREATE TABLE IF NOT EXISTS `images` (
+    `image_id` INTEGER NOT NULL PRIMARY KEY,
+    `image_src_url` TEXT NOT NULL UNIQUE
+);
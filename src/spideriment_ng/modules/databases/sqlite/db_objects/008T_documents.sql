@@ -0,0 +1,15 @@
+CREATE TABLE IF NOT EXISTS `documents` (
+    `document_id` INTEGER NOT NULL PRIMARY KEY,
+    `document_original_link_id` INTEGER NOT NULL UNIQUE REFERENCES `links`(`link_id`) ON UPDATE RESTRICT ON DELETE RESTRICT,
+    `document_final_link_id` INTEGER NOT NULL UNIQUE REFERENCES `links`(`link_id`) ON UPDATE RESTRICT ON DELETE RESTRICT,
+    `document_filetype_id` INTEGER NOT NULL REFERENCES `filetypes`(`filetype_id`) ON UPDATE RESTRICT ON DELETE RESTRICT,
+    `document_language_id` INTEGER NOT NULL REFERENCES `languages`(`language_id`) ON UPDATE RESTRICT ON DELETE RESTRICT,
+    `document_author_id` INTEGER NOT NULL REFERENCES `authors`(`author_id`) ON UPDATE RESTRICT ON DELETE RESTRICT,
+    `document_title` TEXT NOT NULL,
+    `document_description` TEXT NOT NULL,
+    `document_crawled_at` TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS `idx_document_filetype_id` ON `documents`(`document_filetype_id`);
+CREATE INDEX IF NOT EXISTS `idx_document_language_id` ON `documents`(`document_language_id`);
+CREATE INDEX IF NOT EXISTS `idx_document_author_id` ON `documents`(`document_author_id`);
@@ -0,0 +1,20 @@
+CREATE TABLE IF NOT EXISTS `content_snippets` (
+    `content_snippet_id` INTEGER NOT NULL PRIMARY KEY,
+    `content_snippet_document_id` INTEGER NOT NULL REFERENCES `documents`(`document_id`) ON UPDATE RESTRICT ON DELETE RESTRICT,
+    `content_snippet_type` TEXT NOT NULL CHECK(`content_snippet_type` IN (
+        'heading_1',
+        'heading_2',
+        'heading_3',
+        'heading_4',
+        'heading_5',
+        'emphasized_text',
+        'regular_text',
+        'list_item_text',
+        'uncategorized_text',
+        'fallback_text'
+    )),
+    `content_snippet_text` TEXT NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS `idx_content_snippet_document_id` ON `content_snippets`(`content_snippet_document_id`);
+CREATE INDEX IF NOT EXISTS `idx_content_snippet_type` ON `content_snippets`(`content_snippet_type`);
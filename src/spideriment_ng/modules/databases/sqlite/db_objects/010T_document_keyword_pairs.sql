@@ -0,0 +1,8 @@
+CREATE TABLE IF NOT EXISTS `document_keyword_pairs` (
+    `document_keyword_pair_id` INTEGER NOT NULL PRIMARY KEY,
+    `document_keyword_pair_document_id` INTEGER NOT NULL REFERENCES `documents`(`document_id`) ON UPDATE RESTRICT ON DELETE RESTRICT,
+    `document_keyword_pair_keyword_id` INTEGER NOT NULL REFERENCES `keywords`(`keyword_id`) ON UPDATE RESTRICT ON DELETE RESTRICT
+);
+
+CREATE INDEX IF NOT EXISTS `idx_document_keyword_pair_document_id` ON `document_keyword_pairs`(`document_keyword_pair_document_id`);
+CREATE INDEX IF NOT EXISTS `idx_document_keyword_pair_keyword_id` ON `document_keyword_pairs`(`document_keyword_pair_keyword_id`);
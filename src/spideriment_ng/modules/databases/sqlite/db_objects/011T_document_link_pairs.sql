@@ -0,0 +1,9 @@
+CREATE TABLE IF NOT EXISTS `document_link_pairs` (
+    `document_link_pair_id` INTEGER NOT NULL PRIMARY KEY,
+    `document_link_pair_document_id` INTEGER NOT NULL REFERENCES `documents`(`document_id`) ON UPDATE RESTRICT ON DELETE RESTRICT,
+    `document_link_pair_link_id` INTEGER NOT NULL REFERENCES `links`(`link_id`) ON UPDATE RESTRICT ON DELETE RESTRICT,
+    `document_link_pair_link_text` TEXT NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS `idx_document_link_pair_document_id` ON `document_link_pairs`(`document_link_pair_document_id`);
+CREATE INDEX IF NOT EXISTS `idx_document_link_pair_link_id` ON `document_link_pairs`(`document_link_pair_link_id`);
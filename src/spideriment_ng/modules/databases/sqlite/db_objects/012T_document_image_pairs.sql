@@ -0,0 +1,10 @@
+CREATE TABLE IF NOT EXISTS `document_image_pairs` (
+    `document_image_pair_id` INTEGER NOT NULL PRIMARY KEY,
+    `document_image_pair_document_id` INTEGER NOT NULL REFERENCES `documents`(`document_id`) ON UPDATE RESTRICT ON DELETE RESTRICT,
+    `document_image_pair_image_id` INTEGER NOT NULL REFERENCES `images`(`image_id`) ON UPDATE RESTRICT ON DELETE RESTRICT,
+    `document_image_pair_image_alt_text` TEXT NOT NULL,
+    `document_image_pair_image_title_text` TEXT NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS `idx_document_image_pair_document_id` ON `document_image_pairs`(`document_image_pair_document_id`);
+CREATE INDEX IF NOT EXISTS `idx_document_image_pair_image_id` ON `document_image_pairs`(`document_image_pair_image_id`);
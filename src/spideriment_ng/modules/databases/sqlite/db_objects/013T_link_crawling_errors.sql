@@ -0,0 +1,28 @@
+CREATE TABLE IF NOT EXISTS `link_crawling_errors` (
+    `link_crawling_error_id` INTEGER NOT NULL PRIMARY KEY,
+    `link_crawling_error_link_id` INTEGER NOT NULL UNIQUE REFERENCES `links`(`link_id`) ON UPDATE RESTRICT ON DELETE RESTRICT,
+    `link_crawling_error_reason` TEXT NOT NULL CHECK(`link_crawling_error_reason` IN (
+        'fetch_connection_error',
+        'fetch_not_found',
+        'fetch_forbidden',
+        'fetch_server_error',
+        'fetch_too_many_redirects',
+        'fetch_uncategorized_error',
+        'robots_forbidden',
+        'robots_delay_too_long',
+        'robots_uncategorized_error',
+        'parse_unsupported_type',
+        'parse_cut_off_content',
+        'parse_invalid_format',
+        'parse_invalid_content',
+        'parse_forbidden',
+        'parse_uncategorized_error',
+        'validation_url_problem',
+        'validation_document_problem',
+        'validation_uncategorized_error',
+        'final_url_not_crawlable',
+        'uncategorized_error',
+        'unknown_error'
+    )),
+    `link_crawling_error_occurred_at` TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
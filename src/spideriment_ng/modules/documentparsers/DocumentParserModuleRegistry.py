@@ -24,11 +24,13 @@ from typing import Final, Tuple, Sequence, Type
 from spideriment_ng.modules._ModuleRegistryDefaultBase import _ModuleRegistryDefaultBase
 from spideriment_ng.modules.documentparsers.DocumentParserModuleIface import DocumentParserModuleIface
 from spideriment_ng.modules.documentparsers.html.HTMLDocumentParserModule import HTMLDocumentParserModule
+from spideriment_ng.modules.documentparsers.lxmlhtml.LXMLHTMLDocumentParserModule import LXMLHTMLDocumentParserModule
 
 
 class DocumentParserModuleRegistry(_ModuleRegistryDefaultBase):
     _DOCUMENT_PARSER_MODULES: Final[Tuple[Type[DocumentParserModuleIface], ...]] = (
         HTMLDocumentParserModule,
+        LXMLHTMLDocumentParserModule,
     )
 
     @classmethod
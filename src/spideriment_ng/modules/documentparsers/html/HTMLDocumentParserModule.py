@@ -21,10 +21,16 @@
 
 
 from __future__ import annotations
-from typing import Final, Any, Tuple, Optional, Sequence
+from typing import Final, Tuple, Optional, Sequence, Dict, Type
 import re
+import urllib.parse
 import bs4
+from datalidator.blueprints.impl.ObjectBlueprint import ObjectBlueprint
 from spideriment_ng.helpers.decoding.DecodingHelper import DecodingHelper
+from spideriment_ng.helpers.decoding.EncodingDetectorIface import EncodingDetectorIface
+from spideriment_ng.helpers.decoding.ChardetEncodingDetector import ChardetEncodingDetector
+from spideriment_ng.helpers.decoding.CharsetNormalizerEncodingDetector import CharsetNormalizerEncodingDetector
+from spideriment_ng.helpers.decoding.HTMLEncodingSniffingHelper import HTMLEncodingSniffingHelper
 from spideriment_ng.helpers.decoding.exc.DecodingHelperBaseExc import DecodingHelperBaseExc
 from spideriment_ng.helpers.containers.FetchedFileContainer import FetchedFileContainer
 from spideriment_ng.helpers.containers.document.DocumentContainer import DocumentContainer
@@ -36,25 +42,28 @@ from spideriment_ng.helpers.containers.document.ContentSnippetType import Conten
 from spideriment_ng.modules.ModuleInfo import ModuleInfo
 from spideriment_ng.modules.ModuleType import ModuleType
 from spideriment_ng.modules.documentparsers.DocumentParserModuleIface import DocumentParserModuleIface
+from spideriment_ng.modules.documentparsers.html._HTMLDocumentParserModuleConfigModel import _HTMLDocumentParserModuleConfigModel
+from spideriment_ng.modules.documentparsers.html._HTMLTreeIndex import _HTMLTreeIndex
 from spideriment_ng.modules.documentparsers.html.exc.MIMETypeNotAcceptableForHTMLExc import MIMETypeNotAcceptableForHTMLExc
 from spideriment_ng.modules.documentparsers.html.exc.FailedToDecodeHTMLDataExc import FailedToDecodeHTMLDataExc
 from spideriment_ng.modules.documentparsers.html.exc.CrawlingForbiddenByRobotsTagExc import CrawlingForbiddenByRobotsTagExc
 
 
 class HTMLDocumentParserModule(DocumentParserModuleIface):
-    class _InternalExc(Exception):
-        pass
-
     _MODULE_INFO: Final[ModuleInfo] = ModuleInfo(
         type_=ModuleType.DOCUMENT_PARSER,
         name="html",
-        configuration_blueprint=None  # This module does not have any configuration options
+        configuration_blueprint=ObjectBlueprint(_HTMLDocumentParserModuleConfigModel)
     )
 
     _FILE_TYPE: Final[str] = "html"
     _BEAUTIFULSOUP_PARSER_LIBRARY: Final[str] = "html.parser"
     _ACCEPTABLE_MIME_TYPES: Final[Tuple[str, ...]] = ("text/html",)
     _FALLBACK_ENCODING: Final[str] = "utf-8"
+    _ENCODING_DETECTORS: Final[Dict[str, Type[EncodingDetectorIface]]] = {  # The names are validated by the configuration model
+        "chardet": ChardetEncodingDetector,
+        "charset_normalizer": CharsetNormalizerEncodingDetector,
+    }
 
     _USELESS_HTML_TAGS: Final[Tuple[str, ...]] = ("style", "script")
     _TITLE_TAGS: Final[Tuple[str, ...]] = ("title", "h1", "h2", "h3")  # Beware of the sequence's order!
@@ -70,6 +79,10 @@ class HTMLDocumentParserModule(DocumentParserModuleIface):
     )
 
     _ROBOTS_TAG_FORBIDS_CRAWLING_REGEX: Final[re.Pattern] = re.compile(r'^.*(noindex|nofollow|none|noarchive).*$', flags=re.IGNORECASE)
+    _ROBOTS_META_NAME_REGEX: Final[re.Pattern] = re.compile(r'^robots$', flags=re.IGNORECASE)
+    _DESCRIPTION_META_NAME_REGEX: Final[re.Pattern] = re.compile(r'^description$', flags=re.IGNORECASE)
+    _KEYWORDS_META_NAME_REGEX: Final[re.Pattern] = re.compile(r'^keywords$', flags=re.IGNORECASE)
+    _AUTHOR_META_NAME_REGEX: Final[re.Pattern] = re.compile(r'^author$', flags=re.IGNORECASE)
 
     _DEFAULT_TITLE: Final[str] = ""
     _DEFAULT_DESCRIPTION: Final[str] = ""
@@ -86,13 +99,14 @@ class HTMLDocumentParserModule(DocumentParserModuleIface):
     def get_module_info(cls) -> ModuleInfo:
         return cls._MODULE_INFO
 
-    def __init__(self):
-        self._decoding_helper: Final[DecodingHelper] = DecodingHelper()
+    def __init__(self, encoding_detector: EncodingDetectorIface):
+        self._decoding_helper: Final[DecodingHelper] = DecodingHelper(encoding_detector)
+        self._encoding_sniffing_helper: Final[HTMLEncodingSniffingHelper] = HTMLEncodingSniffingHelper()
         self._operational: bool = True
 
     @classmethod
-    async def create_instance(cls, module_options: Any, instance_name: str) -> HTMLDocumentParserModule:
-        return cls()
+    async def create_instance(cls, module_options: _HTMLDocumentParserModuleConfigModel, instance_name: str) -> HTMLDocumentParserModule:
+        return cls(cls._ENCODING_DETECTORS[module_options.encoding_detector]())
 
     async def destroy_instance(self) -> None:
         assert self._operational
@@ -103,15 +117,28 @@ class HTMLDocumentParserModule(DocumentParserModuleIface):
 
         self._check_mime_type(fetched_file.get_hinted_mime_type())
 
-        string_data = self._decode_binary_data_to_string(fetched_file.get_data(), fetched_file.get_hinted_encoding())
+        string_data = self._decode_binary_data_to_string(fetched_file.get_data(), fetched_file.get_hinted_encoding(), self._get_encoding_detection_cache_key(fetched_file.get_fetched_url()))
         return self._parse_html_document(string_data)
 
+    def _get_encoding_detection_cache_key(self, fetched_url: URLContainer) -> Optional[str]:
+        # Documents from the same host usually use the same encoding
+        try:
+            return urllib.parse.urlsplit(fetched_url.get_url()).hostname  # None if not present
+        except ValueError:
+            return None
+
     def _check_mime_type(self, mime_type: str) -> None:
         mime_type = mime_type.strip().lower()
         if mime_type not in self.__class__._ACCEPTABLE_MIME_TYPES:
             raise MIMETypeNotAcceptableForHTMLExc(mime_type)
 
-    def _decode_binary_data_to_string(self, data: bytes, hinted_encoding: Optional[str]) -> str:
+    def _decode_binary_data_to_string(self, data: bytes, hinted_encoding: Optional[str], encoding_detection_cache_key: Optional[str]) -> str:
+        # Byte order mark (takes precedence over the HTTP header, as per the HTML standard)
+        try:
+            return self._decoding_helper.validate_encoding_and_try_decoding_data_using_it(data, self._encoding_sniffing_helper.sniff_encoding_from_bom(data))
+        except DecodingHelperBaseExc:
+            pass
+
         # HTTP header
         if hinted_encoding is not None:
             try:
@@ -119,22 +146,16 @@ class HTMLDocumentParserModule(DocumentParserModuleIface):
             except DecodingHelperBaseExc:
                 pass
 
-        # HTML meta-charset & http-equiv
-        temp_decoded_html = bs4.BeautifulSoup(self._decoding_helper.try_decoding_data_using_encoding(data, "ascii", ignore_errors=True), self.__class__._BEAUTIFULSOUP_PARSER_LIBRARY)
-
-        try:
-            return self._decoding_helper.validate_encoding_and_try_decoding_data_using_it(data, self._get_meta_charset_from_html(temp_decoded_html))
-        except (self.__class__._InternalExc, DecodingHelperBaseExc):
-            pass
-
+        # HTML meta-charset & http-equiv (found by prescanning the beginning of the binary data, so the document does
+        #  not have to be parsed twice)
         try:
-            return self._decoding_helper.validate_encoding_and_try_decoding_data_using_it(data, self._get_http_equiv_charset_from_html(temp_decoded_html))
-        except (self.__class__._InternalExc, DecodingHelperBaseExc):
+            return self._decoding_helper.validate_encoding_and_try_decoding_data_using_it(data, self._encoding_sniffing_helper.prescan_for_encoding(data))
+        except DecodingHelperBaseExc:
             pass
 
         # Automatic detection
         try:
-            return self._decoding_helper.try_detecting_encoding_and_try_decoding_data_using_it(data)
+            return self._decoding_helper.try_detecting_encoding_and_try_decoding_data_using_it(data, encoding_detection_cache_key)
         except DecodingHelperBaseExc:
             pass
 
@@ -144,36 +165,10 @@ class HTMLDocumentParserModule(DocumentParserModuleIface):
         except DecodingHelperBaseExc:
             raise FailedToDecodeHTMLDataExc()
 
-    def _get_meta_charset_from_html(self, html: bs4.BeautifulSoup) -> str:
-        charset_elem = html.find("meta", {"charset": True})
-        if charset_elem is None:
-            raise self.__class__._InternalExc("Could not find a <meta charset> element!")
-
-        encoding = charset_elem.get("charset", None)
-        if encoding is None:
-            raise self.__class__._InternalExc("Could not extract the 'charset' attribute from the found <meta charset> element!")
-
-        return encoding.strip()
-
-    def _get_http_equiv_charset_from_html(self, html: bs4.BeautifulSoup) -> str:
-        http_equiv_elem = html.find("meta", {"http-equiv": re.compile(r'^Content-Type$', flags=re.IGNORECASE), "content": True})
-        if http_equiv_elem is None:
-            raise self.__class__._InternalExc("Could not find a <meta http-equiv='Content-Type'> element!")
-
-        content = http_equiv_elem.get("content", None)
-        if content is None:
-            raise self.__class__._InternalExc("Could not extract the 'content' attribute from the found <meta http-equiv='Content-Type'> element!")
-
-        regex_match = re.match(r'^text/html;\s*charset=(.+)$', content.strip(), flags=re.IGNORECASE)
-        if regex_match is None:
-            raise self.__class__._InternalExc("Could not extract the charset information from the found <meta http-equiv='Content-Type'> element!")
-
-        return regex_match.group(1).strip()
-
     def _parse_html_document(self, html_string: str) -> DocumentContainer:
-        html = bs4.BeautifulSoup(html_string, self.__class__._BEAUTIFULSOUP_PARSER_LIBRARY)
+        # The document's tree is walked only once; all the information is then extracted from the built index
+        html = _HTMLTreeIndex(bs4.BeautifulSoup(html_string, self.__class__._BEAUTIFULSOUP_PARSER_LIBRARY), self.__class__._USELESS_HTML_TAGS)
 
-        self._remove_useless_tags_from_html(html)
         self._check_robots_meta_tag(html)
 
         return DocumentContainer(
@@ -189,63 +184,59 @@ class HTMLDocumentParserModule(DocumentParserModuleIface):
             images=self._extract_images_from_html(html)
         )
 
-    def _remove_useless_tags_from_html(self, html: bs4.BeautifulSoup) -> None:
-        for elem in html.find_all(self.__class__._USELESS_HTML_TAGS):
-            elem.decompose()
-
-    def _check_robots_meta_tag(self, html: bs4.BeautifulSoup) -> None:
-        robots = self._extract_attribute_from_element(html.find("meta", {"name": re.compile(r'^robots$', flags=re.IGNORECASE), "content": True}), "content")
+    def _check_robots_meta_tag(self, html: _HTMLTreeIndex) -> None:
+        robots = self._extract_attribute_from_element(self._find_meta_element_by_name(html, self.__class__._ROBOTS_META_NAME_REGEX), "content")
         if robots is not None:
             if self.__class__._ROBOTS_TAG_FORBIDS_CRAWLING_REGEX.search(robots):
                 raise CrawlingForbiddenByRobotsTagExc()
 
-    def _extract_title_from_html(self, html: bs4.BeautifulSoup) -> str:
+    def _extract_title_from_html(self, html: _HTMLTreeIndex) -> str:
         for tag in self.__class__._TITLE_TAGS:
-            title = self._extract_text_from_element(html.find(tag))
+            title = self._extract_text_from_element(html, html.find_first(tag))
             if title is not None:
                 return title
 
         return self.__class__._DEFAULT_TITLE
 
-    def _extract_description_from_html(self, html: bs4.BeautifulSoup) -> str:
+    def _extract_description_from_html(self, html: _HTMLTreeIndex) -> str:
         # <meta name='description'>
-        description = self._extract_attribute_from_element(html.find("meta", {"name": re.compile(r'^description$', flags=re.IGNORECASE), "content": True}), "content")
+        description = self._extract_attribute_from_element(self._find_meta_element_by_name(html, self.__class__._DESCRIPTION_META_NAME_REGEX), "content")
         if description is not None:
             return description
 
         # Fallback - <p>
-        description = self._extract_text_from_element(html.find("p"))
+        description = self._extract_text_from_element(html, html.find_first("p"))
         if description is not None:
             return description
 
         return self.__class__._DEFAULT_DESCRIPTION
 
-    def _extract_keywords_from_html(self, html: bs4.BeautifulSoup) -> Sequence[str]:
-        keywords = self._extract_attribute_from_element(html.find("meta", {"name": re.compile(r'^keywords$', flags=re.IGNORECASE), "content": True}), "content")
+    def _extract_keywords_from_html(self, html: _HTMLTreeIndex) -> Sequence[str]:
+        keywords = self._extract_attribute_from_element(self._find_meta_element_by_name(html, self.__class__._KEYWORDS_META_NAME_REGEX), "content")
         if keywords is not None:
             return list(filter(None, map(lambda item: item.strip(), keywords.split(","))))
 
         return self.__class__._DEFAULT_KEYWORDS
 
-    def _extract_language_from_html(self, html: bs4.BeautifulSoup) -> str:
-        language = self._extract_attribute_from_element(html.find("html", {"lang": True}), "lang")
+    def _extract_language_from_html(self, html: _HTMLTreeIndex) -> str:
+        language = self._extract_attribute_from_element(html.find_first_with_attributes("html", ("lang",)), "lang")
         if language is not None:
             return language
 
         return self.__class__._DEFAULT_LANGUAGE
 
-    def _extract_author_from_html(self, html: bs4.BeautifulSoup) -> str:
-        author = self._extract_attribute_from_element(html.find("meta", {"name": re.compile(r'^author$', flags=re.IGNORECASE), "content": True}), "content")
+    def _extract_author_from_html(self, html: _HTMLTreeIndex) -> str:
+        author = self._extract_attribute_from_element(self._find_meta_element_by_name(html, self.__class__._AUTHOR_META_NAME_REGEX), "content")
         if author is not None:
             return author
 
         return self.__class__._DEFAULT_AUTHOR
 
-    def _extract_content_snippets_from_html(self, html: bs4.BeautifulSoup) -> Sequence[ContentSnippetContainer]:
+    def _extract_content_snippets_from_html(self, html: _HTMLTreeIndex) -> Sequence[ContentSnippetContainer]:
         snippets = []
         for snippet_type, tags in self.__class__._CONTENT_SNIPPET_TAGS:
             for elem in html.find_all(tags):
-                snippet_text = self._extract_text_from_element(elem)
+                snippet_text = self._extract_text_from_element(html, elem)
                 if snippet_text is not None:
                     snippets.append(ContentSnippetContainer(
                         validated=False,
@@ -255,7 +246,7 @@ class HTMLDocumentParserModule(DocumentParserModuleIface):
 
         # Fallback
         if len(snippets) == 0:
-            fallback_text = self._extract_text_from_element(html)
+            fallback_text = self._extract_text_from_element(html, html.get_root())
             if fallback_text is not None:
                 snippets.append(ContentSnippetContainer(
                     validated=False,
@@ -267,25 +258,26 @@ class HTMLDocumentParserModule(DocumentParserModuleIface):
             return self.__class__._DEFAULT_CONTENT_SNIPPETS
         return snippets
 
-    def _extract_links_from_html(self, html: bs4.BeautifulSoup) -> Sequence[LinkContainer]:
+    def _extract_links_from_html(self, html: _HTMLTreeIndex) -> Sequence[LinkContainer]:
         links = []
-        for elem in html.find_all("a", {"href": True}):
+        for elem in html.find_all(("a",)):
             link_href = self._extract_attribute_from_element(elem, "href")
-            link_text = self._extract_text_from_element(elem)
-            if (link_href is not None) and (link_text is not None):
-                links.append(LinkContainer(
-                    validated=False,
-                    href_url=URLContainer(validated=False, certainly_absolute=False, url=link_href),
-                    link_text=link_text
-                ))
+            if link_href is not None:
+                link_text = self._extract_text_from_element(html, elem)
+                if link_text is not None:
+                    links.append(LinkContainer(
+                        validated=False,
+                        href_url=URLContainer(validated=False, certainly_absolute=False, url=link_href),
+                        link_text=link_text
+                    ))
 
         if len(links) == 0:
             return self.__class__._DEFAULT_LINKS
         return links
 
-    def _extract_images_from_html(self, html: bs4.BeautifulSoup) -> Sequence[ImageContainer]:
+    def _extract_images_from_html(self, html: _HTMLTreeIndex) -> Sequence[ImageContainer]:
         images = []
-        for elem in html.find_all("img", {"src": True}):
+        for elem in html.find_all(("img",)):
             img_src = self._extract_attribute_from_element(elem, "src")
             if img_src is not None:
                 img_alt = self._extract_attribute_from_element(elem, "alt")
@@ -305,9 +297,17 @@ class HTMLDocumentParserModule(DocumentParserModuleIface):
             return self.__class__._DEFAULT_IMAGES
         return images
 
-    def _extract_text_from_element(self, elem: Optional[bs4.Tag]) -> Optional[str]:
+    def _find_meta_element_by_name(self, html: _HTMLTreeIndex, name_regex: re.Pattern) -> Optional[bs4.Tag]:
+        for elem in html.find_all(("meta",)):
+            name = elem.get("name", None)
+            if (name is not None) and (elem.get("content", None) is not None) and name_regex.search(name):
+                return elem
+
+        return None
+
+    def _extract_text_from_element(self, html: _HTMLTreeIndex, elem: Optional[bs4.Tag]) -> Optional[str]:
         if elem is not None:
-            text = elem.get_text().strip()
+            text = html.get_text(elem).strip()
             if text:
                 return text
 
@@ -0,0 +1,99 @@
+#!/bin/false
+
+# Copyright (c) 2022 Vít Labuda. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without modification, are permitted provided that the
+# following conditions are met:
+#  1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following
+#     disclaimer.
+#  2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the
+#     following disclaimer in the documentation and/or other materials provided with the distribution.
+#  3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote
+#     products derived from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES,
+# INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+from typing import Final, Optional, Sequence, List, Dict, Tuple, Iterator
+import heapq
+import bs4
+
+
+class _HTMLTreeIndex:
+    # Walks a parsed HTML document's tree only once and records all its elements (indexed by their tag names and kept
+    #  in document order) and all its strings, so that the information needed by the parser module can be looked up
+    #  without searching the tree over and over again. Each element's text is a slice of the recorded strings, so
+    #  getting it does not walk the element's subtree either.
+    # The subtrees of skipped elements are left out of the index completely, as if the elements had been removed from
+    #  the tree beforehand.
+
+    def __init__(self, html: bs4.BeautifulSoup, skipped_tags: Sequence[str]):
+        self._root: Final[bs4.BeautifulSoup] = html
+        self._strings: Final[List[bs4.NavigableString]] = []
+        self._elements_by_tag: Final[Dict[str, List[Tuple[int, bs4.Tag]]]] = {}  # tag name -> [(document position, element)]
+        self._string_ranges: Final[Dict[int, Tuple[int, int]]] = {}  # id(element) -> (first string index, last string index + 1)
+
+        self._index_tree(frozenset(skipped_tags))
+
+    def _index_tree(self, skipped_tags: frozenset) -> None:
+        # An explicit stack is used instead of recursion, as the documents may be very deeply nested
+        element_count = 0
+        stack: List[Tuple[bs4.Tag, Iterator[bs4.PageElement], int]] = [(self._root, iter(self._root.contents), 0)]
+        while stack:
+            elem, children, first_string_index = stack[-1]
+            for child in children:
+                if isinstance(child, bs4.Tag):
+                    if child.name in skipped_tags:
+                        continue
+
+                    self._elements_by_tag.setdefault(child.name, []).append((element_count, child))
+                    element_count += 1
+                    stack.append((child, iter(child.contents), len(self._strings)))
+                    break
+
+                if isinstance(child, bs4.NavigableString):
+                    self._strings.append(child)
+            else:
+                stack.pop()
+                self._string_ranges[id(elem)] = (first_string_index, len(self._strings))
+
+    def get_root(self) -> bs4.BeautifulSoup:
+        return self._root
+
+    def find_first(self, tag: str) -> Optional[bs4.Tag]:
+        elements = self._elements_by_tag.get(tag, None)
+        if elements:
+            return elements[0][1]
+
+        return None
+
+    def find_first_with_attributes(self, tag: str, attr_names: Sequence[str]) -> Optional[bs4.Tag]:
+        # Returns the first element which has all the specified attributes
+        for _, elem in self._elements_by_tag.get(tag, ()):
+            if all(elem.get(attr_name, None) is not None for attr_name in attr_names):
+                return elem
+
+        return None
+
+    def find_all(self, tags: Sequence[str]) -> Sequence[bs4.Tag]:
+        # The elements are returned in document order, even if multiple tags are specified
+        return [elem for _, elem in heapq.merge(*(self._elements_by_tag.get(tag, ()) for tag in tags), key=lambda item: item[0])]
+
+    def get_text(self, elem: bs4.Tag) -> str:
+        # Behaves in the same way as 'elem.get_text()' (i.e. it takes the types of strings the element is interested in
+        #  into account)
+        first_string_index, end_string_index = self._string_ranges[id(elem)]
+        strings = self._strings[first_string_index:end_string_index]
+
+        string_types = elem.interesting_string_types
+        if string_types is None:
+            return "".join(strings)
+        if isinstance(string_types, type):
+            return "".join(string for string in strings if type(string) is string_types)
+        return "".join(string for string in strings if type(string) in string_types)
@@ -0,0 +1,398 @@
+#!/bin/false
+
+# Copyright (c) 2022 Vít Labuda. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without modification, are permitted provided that the
+# following conditions are met:
+#  1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following
+#     disclaimer.
+#  2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the
+#     following disclaimer in the documentation and/or other materials provided with the distribution.
+#  3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote
+#     products derived from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES,
+# INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+from __future__ import annotations
+from typing import Final, Tuple, Optional, Sequence, Dict, Type
+import re
+import urllib.parse
+import lxml.etree
+from datalidator.blueprints.impl.ObjectBlueprint import ObjectBlueprint
+from spideriment_ng.helpers.decoding.DecodingHelper import DecodingHelper
+from spideriment_ng.helpers.decoding.EncodingDetectorIface import EncodingDetectorIface
+from spideriment_ng.helpers.decoding.ChardetEncodingDetector import ChardetEncodingDetector
+from spideriment_ng.helpers.decoding.CharsetNormalizerEncodingDetector import CharsetNormalizerEncodingDetector
+from spideriment_ng.helpers.decoding.HTMLEncodingSniffingHelper import HTMLEncodingSniffingHelper
+from spideriment_ng.helpers.decoding.exc.DecodingHelperBaseExc import DecodingHelperBaseExc
+from spideriment_ng.helpers.containers.FetchedFileContainer import FetchedFileContainer
+from spideriment_ng.helpers.containers.document.DocumentContainer import DocumentContainer
+from spideriment_ng.helpers.containers.document.LinkContainer import LinkContainer
+from spideriment_ng.helpers.containers.document.ImageContainer import ImageContainer
+from spideriment_ng.helpers.containers.document.URLContainer import URLContainer
+from spideriment_ng.helpers.containers.document.ContentSnippetContainer import ContentSnippetContainer
+from spideriment_ng.helpers.containers.document.ContentSnippetType import ContentSnippetType
+from spideriment_ng.modules.ModuleInfo import ModuleInfo
+from spideriment_ng.modules.ModuleType import ModuleType
+from spideriment_ng.modules.documentparsers.DocumentParserModuleIface import DocumentParserModuleIface
+from spideriment_ng.modules.documentparsers.lxmlhtml._LXMLHTMLDocumentParserModuleConfigModel import _LXMLHTMLDocumentParserModuleConfigModel
+from spideriment_ng.modules.documentparsers.html.HTMLDocumentParserModule import HTMLDocumentParserModule
+from spideriment_ng.modules.documentparsers.lxmlhtml.exc.MIMETypeNotAcceptableForHTMLExc import MIMETypeNotAcceptableForHTMLExc
+from spideriment_ng.modules.documentparsers.lxmlhtml.exc.FailedToDecodeHTMLDataExc import FailedToDecodeHTMLDataExc
+from spideriment_ng.modules.documentparsers.lxmlhtml.exc.CrawlingForbiddenByRobotsTagExc import CrawlingForbiddenByRobotsTagExc
+
+
+class LXMLHTMLDocumentParserModule(DocumentParserModuleIface):
+    _MODULE_INFO: Final[ModuleInfo] = ModuleInfo(
+        type_=ModuleType.DOCUMENT_PARSER,
+        name="lxmlhtml",
+        configuration_blueprint=ObjectBlueprint(_LXMLHTMLDocumentParserModuleConfigModel)
+    )
+
+    _FILE_TYPE: Final[str] = "html"
+    _ACCEPTABLE_MIME_TYPES: Final[Tuple[str, ...]] = ("text/html",)
+    _FALLBACK_ENCODING: Final[str] = "utf-8"
+    _ENCODING_DETECTORS: Final[Dict[str, Type[EncodingDetectorIface]]] = {  # The names are validated by the configuration model
+        "chardet": ChardetEncodingDetector,
+        "charset_normalizer": CharsetNormalizerEncodingDetector,
+    }
+    _PARSER_INPUT_ENCODING: Final[str] = "utf-8"
+
+    _USELESS_HTML_TAGS: Final[Tuple[str, ...]] = ("style", "script")
+    _STRING_CONTAINER_TAGS: Final[Tuple[str, ...]] = ("rt", "rp", "template")  # See '_get_text_of_element()'
+    _TITLE_TAGS: Final[Tuple[str, ...]] = ("title", "h1", "h2", "h3")  # Beware of the sequence's order!
+    _CONTENT_SNIPPET_TAGS: Final[Tuple[Tuple[ContentSnippetType, Tuple[str, ...]], ...]] = (  # dict()s may not preserve order (and are mutable)!
+        (ContentSnippetType.HEADING_1,       ("h1",)),
+        (ContentSnippetType.HEADING_2,       ("h2",)),
+        (ContentSnippetType.HEADING_3,       ("h3",)),
+        (ContentSnippetType.HEADING_4,       ("h4",)),
+        (ContentSnippetType.HEADING_5,       ("h5",)),
+        (ContentSnippetType.EMPHASIZED_TEXT, ("strong", "em")),
+        (ContentSnippetType.REGULAR_TEXT,    ("p",)),
+        (ContentSnippetType.LIST_ITEM_TEXT,  ("li",)),
+    )
+
+    _DOCUMENT_END_TAG_REGEX: Final[re.Pattern] = re.compile(r'</(?:html|body)\s*>', flags=re.IGNORECASE)
+    _ROBOTS_TAG_FORBIDS_CRAWLING_REGEX: Final[re.Pattern] = re.compile(r'^.*(noindex|nofollow|none|noarchive).*$', flags=re.IGNORECASE)
+    _ROBOTS_META_NAME_REGEX: Final[re.Pattern] = re.compile(r'^robots$', flags=re.IGNORECASE)
+    _DESCRIPTION_META_NAME_REGEX: Final[re.Pattern] = re.compile(r'^description$', flags=re.IGNORECASE)
+    _KEYWORDS_META_NAME_REGEX: Final[re.Pattern] = re.compile(r'^keywords$', flags=re.IGNORECASE)
+    _AUTHOR_META_NAME_REGEX: Final[re.Pattern] = re.compile(r'^author$', flags=re.IGNORECASE)
+
+    _DEFAULT_TITLE: Final[str] = ""
+    _DEFAULT_DESCRIPTION: Final[str] = ""
+    _DEFAULT_KEYWORDS: Final[Tuple[str, ...]] = tuple()
+    _DEFAULT_LANGUAGE: Final[str] = ""
+    _DEFAULT_AUTHOR: Final[str] = ""
+    _DEFAULT_CONTENT_SNIPPETS: Final[Tuple[ContentSnippetContainer, ...]] = tuple()
+    _DEFAULT_LINKS: Final[Tuple[LinkContainer, ...]] = tuple()
+    _DEFAULT_IMAGES: Final[Tuple[ImageContainer, ...]] = tuple()
+    _DEFAULT_IMAGE_ALT: Final[str] = ""
+    _DEFAULT_IMAGE_TITLE: Final[str] = ""
+
+    # This module extracts the same information from HTML documents as the 'html' module does, but it uses the libxml2
+    #  HTML parser (through the 'lxml' library), which is implemented in C and is therefore many times faster than the
+    #  pure-Python parser used by the 'html' module.
+    # The results of the two modules are not always identical, as the parsers build different trees from the same
+    #  markup - libxml2 follows some of HTML's tree construction rules, while html.parser does not. The known
+    #  differences are caused by optional end tags (e.g. '<p>a <p>b <div>' or '<li>x<li>y'), nested links, unknown
+    #  character references (libxml2 keeps '&bogus;' including the ';'), the contents of the 'textarea', 'iframe', 'xmp'
+    #  and 'plaintext' elements and deeply nested paragraphs. The 'src/compare_html_document_parsers.py' script compares
+    #  the results of the two modules on a corpus of documents.
+    # libxml2 refuses to nest elements more than 2048 levels deep (even with 'huge_tree') and silently drops
+    #  everything after such a depth has been reached, links included - documents like this are handed over to the
+    #  'html' module, whose parser has no such limit. Content following '</body>' or '</html>' would be dropped
+    #  silently too, so these end tags are removed before the document is parsed (the 'html' module keeps such
+    #  content as well).
+
+    @classmethod
+    def get_module_info(cls) -> ModuleInfo:
+        return cls._MODULE_INFO
+
+    def __init__(self, encoding_detector: EncodingDetectorIface):
+        self._decoding_helper: Final[DecodingHelper] = DecodingHelper(encoding_detector)
+        self._encoding_sniffing_helper: Final[HTMLEncodingSniffingHelper] = HTMLEncodingSniffingHelper()
+        self._fallback_document_parser: Final[HTMLDocumentParserModule] = HTMLDocumentParserModule(encoding_detector)  # Used for documents which libxml2 cannot parse whole
+        self._operational: bool = True
+
+    @classmethod
+    async def create_instance(cls, module_options: _LXMLHTMLDocumentParserModuleConfigModel, instance_name: str) -> LXMLHTMLDocumentParserModule:
+        return cls(cls._ENCODING_DETECTORS[module_options.encoding_detector]())
+
+    async def destroy_instance(self) -> None:
+        assert self._operational
+        self._operational = False
+
+        await self._fallback_document_parser.destroy_instance()
+
+    async def parse(self, fetched_file: FetchedFileContainer) -> DocumentContainer:
+        assert self._operational
+
+        self._check_mime_type(fetched_file.get_hinted_mime_type())
+
+        string_data = self._decode_binary_data_to_string(fetched_file.get_data(), fetched_file.get_hinted_encoding(), self._get_encoding_detection_cache_key(fetched_file.get_fetched_url()))
+
+        html = self._build_html_tree(string_data)
+        if html is None:  # libxml2 has not parsed the whole document (see the note above)
+            return await self._fallback_document_parser.parse(fetched_file)
+
+        return self._parse_html_document(html)
+
+    def _get_encoding_detection_cache_key(self, fetched_url: URLContainer) -> Optional[str]:
+        # Documents from the same host usually use the same encoding
+        try:
+            return urllib.parse.urlsplit(fetched_url.get_url()).hostname  # None if not present
+        except ValueError:
+            return None
+
+    def _check_mime_type(self, mime_type: str) -> None:
+        mime_type = mime_type.strip().lower()
+        if mime_type not in self.__class__._ACCEPTABLE_MIME_TYPES:
+            raise MIMETypeNotAcceptableForHTMLExc(mime_type)
+
+    def _decode_binary_data_to_string(self, data: bytes, hinted_encoding: Optional[str], encoding_detection_cache_key: Optional[str]) -> str:
+        # Byte order mark (takes precedence over the HTTP header, as per the HTML standard)
+        try:
+            return self._decoding_helper.validate_encoding_and_try_decoding_data_using_it(data, self._encoding_sniffing_helper.sniff_encoding_from_bom(data))
+        except DecodingHelperBaseExc:
+            pass
+
+        # HTTP header
+        if hinted_encoding is not None:
+            try:
+                return self._decoding_helper.validate_encoding_and_try_decoding_data_using_it(data, hinted_encoding)
+            except DecodingHelperBaseExc:
+                pass
+
+        # HTML meta-charset & http-equiv (found by prescanning the beginning of the binary data, so the document does
+        #  not have to be parsed twice)
+        try:
+            return self._decoding_helper.validate_encoding_and_try_decoding_data_using_it(data, self._encoding_sniffing_helper.prescan_for_encoding(data))
+        except DecodingHelperBaseExc:
+            pass
+
+        # Automatic detection
+        try:
+            return self._decoding_helper.try_detecting_encoding_and_try_decoding_data_using_it(data, encoding_detection_cache_key)
+        except DecodingHelperBaseExc:
+            pass
+
+        # Fallback
+        try:
+            return self._decoding_helper.try_decoding_data_using_encoding(data, self.__class__._FALLBACK_ENCODING, ignore_errors=False)
+        except DecodingHelperBaseExc:
+            raise FailedToDecodeHTMLDataExc()
+
+    def _build_html_tree(self, html_string: str) -> Optional[lxml.etree._Element]:
+        # Returns None if libxml2 has given up on a part of the document.
+        # The string is passed to the parser encoded, as 'lxml' refuses to parse strings containing an XML encoding
+        #  declaration; comments and processing instructions are not needed for anything, so they are dropped straight
+        #  away by the parser. 'huge_tree' raises libxml2's limit on text node size; the nesting depth limit is not
+        #  affected by it, and exceeding it is reported as a fatal error in the parser's error log.
+        html_string = self.__class__._DOCUMENT_END_TAG_REGEX.sub("", html_string)
+
+        html_parser = lxml.etree.HTMLParser(encoding=self.__class__._PARSER_INPUT_ENCODING, remove_comments=True, remove_pis=True, no_network=True, huge_tree=True)
+        html = lxml.etree.fromstring(html_string.encode(self.__class__._PARSER_INPUT_ENCODING, errors="replace"), html_parser)
+        if any((error.level == lxml.etree.ErrorLevels.FATAL) for error in html_parser.error_log):
+            return None
+        if html is None:  # An empty document
+            return lxml.etree.Element("html")
+
+        return html
+
+    def _parse_html_document(self, html: lxml.etree._Element) -> DocumentContainer:
+        self._remove_useless_tags_from_html(html)
+        self._check_robots_meta_tag(html)
+
+        return DocumentContainer(
+            validated=False,
+            file_type=self.__class__._FILE_TYPE,
+            title=self._extract_title_from_html(html),
+            description=self._extract_description_from_html(html),
+            keywords=self._extract_keywords_from_html(html),
+            language=self._extract_language_from_html(html),
+            author=self._extract_author_from_html(html),
+            content_snippets=self._extract_content_snippets_from_html(html),
+            links=self._extract_links_from_html(html),
+            images=self._extract_images_from_html(html)
+        )
+
+    def _remove_useless_tags_from_html(self, html: lxml.etree._Element) -> None:
+        # The text following the removed elements is kept
+        lxml.etree.strip_elements(html, *self.__class__._USELESS_HTML_TAGS, with_tail=False)
+
+    def _check_robots_meta_tag(self, html: lxml.etree._Element) -> None:
+        robots = self._strip_attribute(self._find_first_meta_element_content(html, "name", self.__class__._ROBOTS_META_NAME_REGEX))
+        if robots is not None:
+            if self.__class__._ROBOTS_TAG_FORBIDS_CRAWLING_REGEX.search(robots):
+                raise CrawlingForbiddenByRobotsTagExc()
+
+    def _extract_title_from_html(self, html: lxml.etree._Element) -> str:
+        for tag in self.__class__._TITLE_TAGS:
+            title = self._extract_text_from_element(next(html.iter(tag), None))
+            if title is not None:
+                return title
+
+        return self.__class__._DEFAULT_TITLE
+
+    def _extract_description_from_html(self, html: lxml.etree._Element) -> str:
+        # <meta name='description'>
+        description = self._strip_attribute(self._find_first_meta_element_content(html, "name", self.__class__._DESCRIPTION_META_NAME_REGEX))
+        if description is not None:
+            return description
+
+        # Fallback - <p>
+        description = self._extract_text_from_element(next(html.iter("p"), None))
+        if description is not None:
+            return description
+
+        return self.__class__._DEFAULT_DESCRIPTION
+
+    def _extract_keywords_from_html(self, html: lxml.etree._Element) -> Sequence[str]:
+        keywords = self._strip_attribute(self._find_first_meta_element_content(html, "name", self.__class__._KEYWORDS_META_NAME_REGEX))
+        if keywords is not None:
+            return list(filter(None, map(lambda item: item.strip(), keywords.split(","))))
+
+        return self.__class__._DEFAULT_KEYWORDS
+
+    def _extract_language_from_html(self, html: lxml.etree._Element) -> str:
+        for elem in html.iter("html"):
+            language = elem.get("lang", None)
+            if language is not None:
+                language = self._strip_attribute(language)
+                if language is not None:
+                    return language
+                break
+
+        return self.__class__._DEFAULT_LANGUAGE
+
+    def _extract_author_from_html(self, html: lxml.etree._Element) -> str:
+        author = self._strip_attribute(self._find_first_meta_element_content(html, "name", self.__class__._AUTHOR_META_NAME_REGEX))
+        if author is not None:
+            return author
+
+        return self.__class__._DEFAULT_AUTHOR
+
+    def _extract_content_snippets_from_html(self, html: lxml.etree._Element) -> Sequence[ContentSnippetContainer]:
+        snippets = []
+        for snippet_type, tags in self.__class__._CONTENT_SNIPPET_TAGS:
+            for elem in html.iter(*tags):
+                snippet_text = self._extract_text_from_element(elem)
+                if snippet_text is not None:
+                    snippets.append(ContentSnippetContainer(
+                        validated=False,
+                        snippet_type=snippet_type,
+                        snippet_text=snippet_text
+                    ))
+
+        # Fallback
+        if len(snippets) == 0:
+            fallback_text = self._extract_text_from_element(html)
+            if fallback_text is not None:
+                snippets.append(ContentSnippetContainer(
+                    validated=False,
+                    snippet_type=ContentSnippetType.FALLBACK_TEXT,
+                    snippet_text=fallback_text
+                ))
+
+        if len(snippets) == 0:
+            return self.__class__._DEFAULT_CONTENT_SNIPPETS
+        return snippets
+
+    def _extract_links_from_html(self, html: lxml.etree._Element) -> Sequence[LinkContainer]:
+        links = []
+        for elem in html.iter("a"):
+            link_href = self._strip_attribute(elem.get("href", None))
+            if link_href is not None:
+                link_text = self._extract_text_from_element(elem)
+                if link_text is not None:
+                    links.append(LinkContainer(
+                        validated=False,
+                        href_url=URLContainer(validated=False, certainly_absolute=False, url=link_href),
+                        link_text=link_text
+                    ))
+
+        if len(links) == 0:
+            return self.__class__._DEFAULT_LINKS
+        return links
+
+    def _extract_images_from_html(self, html: lxml.etree._Element) -> Sequence[ImageContainer]:
+        images = []
+        for elem in html.iter("img"):
+            img_src = self._strip_attribute(elem.get("src", None))
+            if img_src is not None:
+                img_alt = self._strip_attribute(elem.get("alt", None))
+                img_title = self._strip_attribute(elem.get("title", None))
+                if img_alt is None:
+                    img_alt = self.__class__._DEFAULT_IMAGE_ALT
+                if img_title is None:
+                    img_title = self.__class__._DEFAULT_IMAGE_TITLE
+                images.append(ImageContainer(
+                    validated=False,
+                    src_url=URLContainer(validated=False, certainly_absolute=False, url=img_src),
+                    alt_text=img_alt,
+                    title_text=img_title
+                ))
+
+        if len(images) == 0:
+            return self.__class__._DEFAULT_IMAGES
+        return images
+
+    def _find_first_meta_element_content(self, html: lxml.etree._Element, attr_name: str, attr_value_regex: re.Pattern) -> Optional[str]:
+        # Returns the 'content' attribute of the first <meta> element which has it and whose 'attr_name' attribute
+        #  matches the regex
+        for elem in html.iter("meta"):
+            attr_value = elem.get(attr_name, None)
+            content = elem.get("content", None)
+            if (attr_value is not None) and (content is not None) and attr_value_regex.search(attr_value):
+                return content
+
+        return None
+
+    def _extract_text_from_element(self, elem: Optional[lxml.etree._Element]) -> Optional[str]:
+        if elem is not None:
+            text = self._get_text_of_element(elem).strip()
+            if text:
+                return text
+
+        return None
+
+    def _get_text_of_element(self, elem: lxml.etree._Element) -> str:
+        # BeautifulSoup (used by the 'html' module) treats strings inside <rt>, <rp> and <template> elements as
+        #  a different kind of strings, which are part of the text of the innermost such element only (and not of its
+        #  ancestors or descendants); this is replicated here, so the results of both modules are the same
+        string_container_tags = self.__class__._STRING_CONTAINER_TAGS
+        if (elem.tag not in string_container_tags) and (next(elem.iter(*string_container_tags), None) is None) and (next(elem.iterancestors(*string_container_tags), None) is None):
+            return "".join(elem.itertext())  # The fast path, used for the vast majority of elements
+
+        wanted_container_tag = (elem.tag if elem.tag in string_container_tags else None)
+        outer_container_elem = next(elem.iterancestors(*string_container_tags), None)
+        container_tag_stack = [(None if outer_container_elem is None else outer_container_elem.tag)]
+
+        text_parts = []
+        for event, node in lxml.etree.iterwalk(elem, events=("start", "end")):
+            if event == "start":
+                container_tag_stack.append(node.tag if node.tag in string_container_tags else container_tag_stack[-1])
+                if node.text and (container_tag_stack[-1] == wanted_container_tag):
+                    text_parts.append(node.text)
+            else:
+                container_tag_stack.pop()
+                if (node is not elem) and node.tail and (container_tag_stack[-1] == wanted_container_tag):
+                    text_parts.append(node.tail)
+
+        return "".join(text_parts)
+
+    def _strip_attribute(self, attribute: Optional[str]) -> Optional[str]:
+        if attribute is not None:
+            attribute = attribute.strip()
+            if attribute:
+                return attribute
+
+        return None
@@ -21,8 +21,9 @@
 
 
 from __future__ import annotations
-from typing import Final, Callable, Awaitable, Dict
+from typing import Final, Optional, Dict, Any
 import re
+import asyncio
 import urllib.parse
 import aiohttp
 import aiohttp_socks
@@ -36,6 +37,7 @@ from spideriment_ng.helpers.containers.document.URLContainer import URLContainer
 from spideriment_ng.modules.fetchers.FetcherModuleIface import FetcherModuleIface
 from spideriment_ng.modules.fetchers.exc.FetcherModuleBaseExc import FetcherModuleBaseExc
 from spideriment_ng.modules.fetchers.internet._InternetFetcherModuleConfigModel import _InternetFetcherModuleConfigModel
+from spideriment_ng.modules.fetchers.internet._CachingDNSResolver import _CachingDNSResolver
 from spideriment_ng.modules.fetchers.internet.exc.InvalidProxyTypeExc import InvalidProxyTypeExc
 from spideriment_ng.modules.fetchers.internet.exc.RedirectedExc import RedirectedExc
 from spideriment_ng.modules.fetchers.internet.exc.ServerErrorOccurredExc import ServerErrorOccurredExc
@@ -51,96 +53,152 @@ class InternetFetcherModule(FetcherModuleIface):
 
     _DOWNLOAD_CHUNK_SIZE: Final[int] = 16384
 
+    # All the fetches of a module instance (i.e. of a worker process) share a single long-lived HTTP session, so idle
+    #  connections are kept alive and reused (which saves TCP & TLS handshakes and DNS lookups), and the number of
+    #  simultaneously open connections is bounded. Cookies are never stored, so each fetch is still independent.
+    # DNS lookups of both the crawled pages and robots.txt files go through the module instance's caching resolver. When
+    #  a SOCKS proxy is used, the resolver is bypassed, as the hostnames are resolved by the proxy (or by the proxy
+    #  client library).
+
     @classmethod
     def get_module_info(cls) -> ModuleInfo:
         return cls._MODULE_INFO
 
-    def __init__(self, user_agent: str, proxy_url: str):
-        self._user_agent: Final[str] = user_agent
-        self._proxy_url: Final[str] = proxy_url
-        self._parsed_proxy_url: Final[urllib.parse.SplitResult] = urllib.parse.urlsplit(proxy_url)
-        self._fetcher_function: Final[Callable[[str, int, aiohttp.ClientTimeout], Awaitable[FetchedFileContainer]]] = self._get_fetcher_function_by_proxy_url(self._parsed_proxy_url)
+    def __init__(self, session: aiohttp.ClientSession, dns_resolver: _CachingDNSResolver, request_proxy_url: Optional[str]):
+        self._session: Final[aiohttp.ClientSession] = session
+        self._dns_resolver: Final[_CachingDNSResolver] = dns_resolver
+        self._request_proxy_url: Final[Optional[str]] = request_proxy_url  # Used only with HTTP proxies
         self._operational: bool = True
 
-    def _get_fetcher_function_by_proxy_url(self, parsed_proxy_url: urllib.parse.SplitResult) -> Callable[[str, int, aiohttp.ClientTimeout], Awaitable[FetchedFileContainer]]:
-        if parsed_proxy_url.scheme == "none":
-            return self._fetch_without_proxy
-
-        if re.match(r'^https?\Z', parsed_proxy_url.scheme):
-            return self._fetch_using_http_proxy
-
-        if re.match(r'^socks[45]h?\Z', parsed_proxy_url.scheme):
-            return self._fetch_using_socks_proxy
-
-        raise InvalidProxyTypeExc(parsed_proxy_url.scheme)
-
     @classmethod
     async def create_instance(cls, module_options: _InternetFetcherModuleConfigModel, instance_name: str) -> InternetFetcherModule:
-        return cls(module_options.user_agent, module_options.proxy)
-
-    async def destroy_instance(self) -> None:
-        assert self._operational
-        self._operational = False
+        parsed_proxy_url = urllib.parse.urlsplit(module_options.proxy)
+        dns_resolver = _CachingDNSResolver(
+            max_size=module_options.dns_cache_size,
+            positive_ttl=module_options.dns_cache_ttl,
+            negative_ttl=module_options.dns_negative_cache_ttl
+        )
+        connector_options = {
+            "limit": module_options.max_connections,
+            "limit_per_host": module_options.max_connections_per_host,
+            "keepalive_timeout": module_options.keepalive_timeout,
+            "enable_cleanup_closed": True  # Closes the connections whose TLS shutdown has not been completed by the server
+        }
 
-    async def fetch(self, validated_absolute_url: URLContainer, max_size: int, timeout: int) -> FetchedFileContainer:
-        assert self._operational
-        assert (validated_absolute_url.is_validated() and validated_absolute_url.is_certainly_absolute())
-        assert (max_size > 0)
-        assert (timeout > 0)
+        if parsed_proxy_url.scheme == "none":
+            connector = aiohttp.TCPConnector(resolver=dns_resolver, use_dns_cache=False, **connector_options)
+            request_proxy_url = None
+        elif re.match(r'^https?\Z', parsed_proxy_url.scheme):
+            connector = aiohttp.TCPConnector(resolver=dns_resolver, use_dns_cache=False, **connector_options)
+            request_proxy_url = module_options.proxy
+        elif re.match(r'^socks[45]h?\Z', parsed_proxy_url.scheme):
+            connector = cls._create_socks_proxy_connector(parsed_proxy_url, connector_options)
+            request_proxy_url = None
+        else:
+            raise InvalidProxyTypeExc(parsed_proxy_url.scheme)
+
+        session = aiohttp.ClientSession(
+            connector=connector,
+            headers=cls._generate_request_headers(module_options.user_agent),
+            cookie_jar=aiohttp.DummyCookieJar(),
+            raise_for_status=False,
+            auto_decompress=True,
+            trust_env=False,
+            trace_configs=[cls._create_trace_config()]
+        )
 
-        url = validated_absolute_url.get_url()
-        try:
-            timeout_object = aiohttp.ClientTimeout(total=timeout)
-            return await self._fetcher_function(url, max_size, timeout_object)
-        except (FetcherModuleBaseExc, AssertionError) as e:
-            raise e
-        except Exception:  # It is not clear what exceptions does 'aiohttp_socks' raise
-            raise ConnectionErrorOccurredExc()
+        return cls(session, dns_resolver, request_proxy_url)
 
-    async def _fetch_without_proxy(self, url: str, max_size: int, timeout_object: aiohttp.ClientTimeout) -> FetchedFileContainer:
-        async with aiohttp.ClientSession(timeout=timeout_object, headers=self._generate_request_headers(), raise_for_status=False, auto_decompress=True, trust_env=False) as session:
-            async with session.get(url, allow_redirects=False) as response:
-                return await self._process_response(response, max_size)
+    @classmethod
+    def _create_trace_config(cls) -> aiohttp.TraceConfig:
+        # The connection is acquired either by creating a new one, or by reusing an idle one from the pool
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_connection_create_end.append(cls._on_connection_acquired)
+        trace_config.on_connection_reuseconn.append(cls._on_connection_acquired)
 
-    async def _fetch_using_http_proxy(self, url: str, max_size: int, timeout_object: aiohttp.ClientTimeout) -> FetchedFileContainer:
-        async with aiohttp.ClientSession(timeout=timeout_object, headers=self._generate_request_headers(), raise_for_status=False, auto_decompress=True, trust_env=False) as session:
-            async with session.get(url, proxy=self._proxy_url, allow_redirects=False) as response:
-                return await self._process_response(response, max_size)
+        return trace_config
 
-    async def _fetch_using_socks_proxy(self, url: str, max_size: int, timeout_object: aiohttp.ClientTimeout) -> FetchedFileContainer:
-        async with aiohttp.ClientSession(connector=self._generate_new_socks_proxy_connector_from_proxy_url(), timeout=timeout_object, headers=self._generate_request_headers(), raise_for_status=False, auto_decompress=True, trust_env=False) as session:
-            async with session.get(url, allow_redirects=False) as response:
-                return await self._process_response(response, max_size)
+    @staticmethod
+    async def _on_connection_acquired(session: aiohttp.ClientSession, trace_config_ctx: Any, params: Any) -> None:  # noqa
+        connection_acquired_event = trace_config_ctx.trace_request_ctx
+        if connection_acquired_event is not None:
+            connection_acquired_event.set()
 
-    def _generate_new_socks_proxy_connector_from_proxy_url(self) -> aiohttp_socks.ProxyConnector:
+    @classmethod
+    def _create_socks_proxy_connector(cls, parsed_proxy_url: urllib.parse.SplitResult, connector_options: Dict[str, Any]) -> aiohttp_socks.ProxyConnector:
         # As of now, 'aiohttp_socks.ProxyConnector.from_url' does not work with 'socks[45]h' URLs, so a custom URL
         #  parsing function is necessary.
 
-        if self._parsed_proxy_url.scheme == "socks4":
+        if parsed_proxy_url.scheme == "socks4":
             proxy_type = aiohttp_socks.ProxyType.SOCKS4
             rdns = False
-        elif self._parsed_proxy_url.scheme == "socks4h":
+        elif parsed_proxy_url.scheme == "socks4h":
             proxy_type = aiohttp_socks.ProxyType.SOCKS4
             rdns = True
-        elif self._parsed_proxy_url.scheme == "socks5":
+        elif parsed_proxy_url.scheme == "socks5":
             proxy_type = aiohttp_socks.ProxyType.SOCKS5
             rdns = False
-        elif self._parsed_proxy_url.scheme == "socks5h":
+        elif parsed_proxy_url.scheme == "socks5h":
             proxy_type = aiohttp_socks.ProxyType.SOCKS5
             rdns = True
         else:
-            raise ThisShouldNeverHappenError(f"An invalid proxy scheme ({repr(self._parsed_proxy_url.scheme)}) was encountered, even though it had been checked before!")
+            raise ThisShouldNeverHappenError(f"An invalid proxy scheme ({repr(parsed_proxy_url.scheme)}) was encountered, even though it had been checked before!")
 
         return aiohttp_socks.ProxyConnector(
             proxy_type=proxy_type,
-            host=self._parsed_proxy_url.hostname,  # None if not present
-            port=self._parsed_proxy_url.port,  # None if not present
-            username=self._parsed_proxy_url.username,  # None if not present
-            password=self._parsed_proxy_url.password,  # None if not present
-            rdns=rdns
+            host=parsed_proxy_url.hostname,  # None if not present
+            port=parsed_proxy_url.port,  # None if not present
+            username=parsed_proxy_url.username,  # None if not present
+            password=parsed_proxy_url.password,  # None if not present
+            rdns=rdns,
+            **connector_options
         )
 
-    async def _process_response(self, response: aiohttp.ClientResponse, max_size: int) -> FetchedFileContainer:
+    async def destroy_instance(self) -> None:
+        assert self._operational
+        self._operational = False
+
+        await self._session.close()
+        await self._dns_resolver.close()
+
+    async def fetch(self, validated_absolute_url: URLContainer, max_size: int, timeout: int) -> FetchedFileContainer:
+        assert self._operational
+        assert (validated_absolute_url.is_validated() and validated_absolute_url.is_certainly_absolute())
+        assert (max_size > 0)
+        assert (timeout > 0)
+
+        try:
+            return await self._fetch_with_deadline(validated_absolute_url, max_size, timeout)
+        except (FetcherModuleBaseExc, AssertionError) as e:
+            raise e
+        except Exception:  # It is not clear what exceptions does 'aiohttp_socks' raise
+            raise ConnectionErrorOccurredExc()
+
+    async def _fetch_with_deadline(self, validated_absolute_url: URLContainer, max_size: int, timeout: int) -> FetchedFileContainer:
+        # The time spent waiting for a free connection in the pool must not count towards the timeout - the pool is shared
+        #  by all the worker tasks of the worker process, so its contention says nothing about the fetched server, and
+        #  the fetch would otherwise fail permanently because of it. Therefore, the timeout limits connecting, and
+        #  everything after the connection has been acquired (sending the request, receiving the response headers and
+        #  downloading the response body) is limited as a whole.
+        connection_acquired_event = asyncio.Event()
+        fetch_task = asyncio.ensure_future(self._fetch_using_session(validated_absolute_url, max_size, timeout, connection_acquired_event))
+        try:
+            connection_acquired_wait_task = asyncio.ensure_future(connection_acquired_event.wait())
+            try:
+                await asyncio.wait((fetch_task, connection_acquired_wait_task), return_when=asyncio.FIRST_COMPLETED)
+            finally:
+                connection_acquired_wait_task.cancel()
+
+            return await asyncio.wait_for(fetch_task, timeout)
+        finally:
+            fetch_task.cancel()  # Does nothing if the task is already done
+
+    async def _fetch_using_session(self, validated_absolute_url: URLContainer, max_size: int, timeout: int, connection_acquired_event: asyncio.Event) -> FetchedFileContainer:
+        timeout_object = aiohttp.ClientTimeout(total=None, connect=None, sock_connect=timeout, sock_read=timeout)
+        async with self._session.get(validated_absolute_url.get_url(), proxy=self._request_proxy_url, timeout=timeout_object, allow_redirects=False, trace_request_ctx=connection_acquired_event) as response:
+            return await self._process_response(validated_absolute_url, response, max_size)
+
+    async def _process_response(self, validated_absolute_url: URLContainer, response: aiohttp.ClientResponse, max_size: int) -> FetchedFileContainer:
         # Handle redirects
         if "Location" in response.headers:
             redirect_url = response.headers["Location"].strip()
@@ -169,13 +227,21 @@ class InternetFetcherModule(FetcherModuleIface):
                 break
 
         return FetchedFileContainer(
+            fetched_url=validated_absolute_url,
             data=bytes(recv_buffer[0:max_size]),
             are_data_cut_off=cut_off,
             hinted_mime_type=mime_type,
             hinted_encoding=encoding
         )
 
-    def _generate_request_headers(self) -> Dict[str, str]:
+    def get_statistics(self) -> Dict[str, int]:
+        return {
+            "dns_cache_hits": self._dns_resolver.get_hit_count(),
+            "dns_cache_misses": self._dns_resolver.get_miss_count()
+        }
+
+    @classmethod
+    def _generate_request_headers(cls, user_agent: str) -> Dict[str, str]:
         return {
-            "User-Agent": self._user_agent.format(program_version=SpiderimentConstants.PROGRAM_VERSION)
+            "User-Agent": user_agent.format(program_version=SpiderimentConstants.PROGRAM_VERSION)
         }
@@ -0,0 +1,137 @@
+#!/bin/false
+
+# Copyright (c) 2022 Vít Labuda. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without modification, are permitted provided that the
+# following conditions are met:
+#  1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following
+#     disclaimer.
+#  2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the
+#     following disclaimer in the documentation and/or other materials provided with the distribution.
+#  3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote
+#     products derived from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES,
+# INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+from __future__ import annotations
+from typing import Final, Optional, Tuple, List, Dict, Any
+import asyncio
+import collections
+import socket
+import time
+import aiohttp
+import aiohttp.abc
+
+
+class _CachingDNSResolver(aiohttp.abc.AbstractResolver):
+    # A per-process caching layer on top of aiohttp's default resolver. Both successful lookups and lookup failures are
+    #  cached, each for their own amount of time, in a bounded LRU cache. Concurrent lookups of the same host are
+    #  deduplicated - only the first one is actually performed, and the other ones wait for its result.
+    # 'getaddrinfo()', which is used by the default resolver, does not provide the TTLs of the resolved records, so the
+    #  configured TTLs are used for all the cached results instead.
+
+    _CacheKey = Tuple[str, int, int]  # host, port, address family
+
+    def __init__(self, max_size: int, positive_ttl: int, negative_ttl: int):
+        assert (max_size >= 0)
+        assert (positive_ttl >= 0)
+        assert (negative_ttl >= 0)
+
+        self._wrapped_resolver: Final[aiohttp.abc.AbstractResolver] = aiohttp.DefaultResolver()
+        # The values are tuples of: expiration time (monotonic), resolved addresses (None if the lookup failed), the
+        #  arguments of the 'OSError' raised by the failed lookup (None if the lookup succeeded)
+        self._cached_results: Final[collections.OrderedDict[_CachingDNSResolver._CacheKey, Tuple[float, Optional[List[Dict[str, Any]]], Optional[Tuple[Any, ...]]]]] = collections.OrderedDict()
+        self._pending_lookups: Final[Dict[_CachingDNSResolver._CacheKey, asyncio.Task]] = dict()
+        self._max_size: Final[int] = max_size
+        self._positive_ttl: Final[int] = positive_ttl
+        self._negative_ttl: Final[int] = negative_ttl
+        self._hit_count: int = 0
+        self._miss_count: int = 0
+
+    async def resolve(self, host: str, port: int = 0, family: int = socket.AF_INET) -> List[Dict[str, Any]]:
+        key = (host, port, int(family))
+
+        cached_result = self._get_cached_result(key)
+        if cached_result is not None:
+            self._hit_count += 1
+            addresses, error_args = cached_result
+            if addresses is None:
+                raise OSError(*error_args)
+            return list(addresses)
+
+        # A lookup of the same host which is already in progress counts as a hit as well, since it is not repeated
+        lookup_task = self._pending_lookups.get(key, None)
+        if lookup_task is None:
+            self._miss_count += 1
+            lookup_task = asyncio.create_task(self._look_up_and_cache_result(key))
+            lookup_task.add_done_callback(lambda task: self._finish_pending_lookup(key, task))
+            self._pending_lookups[key] = lookup_task
+        else:
+            self._hit_count += 1
+
+        # The lookup must not be cancelled when one of the coroutines waiting for it gets cancelled
+        return list(await asyncio.shield(lookup_task))
+
+    def _get_cached_result(self, key: _CachingDNSResolver._CacheKey) -> Optional[Tuple[Optional[List[Dict[str, Any]]], Optional[Tuple[Any, ...]]]]:
+        try:
+            expires_at, addresses, error_args = self._cached_results[key]
+        except KeyError:
+            return None
+
+        if time.monotonic() >= expires_at:
+            del self._cached_results[key]
+            return None
+
+        self._cached_results.move_to_end(key)
+        return addresses, error_args
+
+    async def _look_up_and_cache_result(self, key: _CachingDNSResolver._CacheKey) -> List[Dict[str, Any]]:
+        host, port, family = key
+
+        try:
+            addresses = await self._wrapped_resolver.resolve(host, port, family)
+        except OSError as e:
+            self._store_result(key, self._negative_ttl, None, e.args)
+            raise e
+
+        self._store_result(key, self._positive_ttl, addresses, None)
+        return addresses
+
+    def _store_result(self, key: _CachingDNSResolver._CacheKey, ttl: int, addresses: Optional[List[Dict[str, Any]]], error_args: Optional[Tuple[Any, ...]]) -> None:
+        if (self._max_size == 0) or (ttl == 0):
+            return
+
+        self._cached_results[key] = (time.monotonic() + ttl, addresses, error_args)
+        self._cached_results.move_to_end(key)
+
+        while len(self._cached_results) > self._max_size:
+            self._cached_results.popitem(last=False)
+
+    def _finish_pending_lookup(self, key: _CachingDNSResolver._CacheKey, lookup_task: asyncio.Task) -> None:
+        if self._pending_lookups.get(key, None) is lookup_task:
+            del self._pending_lookups[key]
+
+        # Prevents asyncio from complaining about an unretrieved exception if all the waiting coroutines got cancelled
+        if not lookup_task.cancelled():
+            lookup_task.exception()
+
+    async def close(self) -> None:
+        for lookup_task in self._pending_lookups.values():
+            lookup_task.cancel()
+        self._pending_lookups.clear()
+        self._cached_results.clear()
+
+        await self._wrapped_resolver.close()
+
+    def get_hit_count(self) -> int:
+        return self._hit_count
+
+    def get_miss_count(self) -> int:
+        return self._miss_count
@@ -21,10 +21,13 @@
 
 
 from datalidator.blueprints.extras.ObjectModel import ObjectModel
+from datalidator.blueprints.extras.OptionalItem import OptionalItem
 from datalidator.blueprints.impl.StringBlueprint import StringBlueprint
+from datalidator.blueprints.impl.IntegerBlueprint import IntegerBlueprint
 from datalidator.filters.impl.StringStripFilter import StringStripFilter
 from datalidator.validators.impl.SequenceIsNotEmptyValidator import SequenceIsNotEmptyValidator
 from datalidator.validators.impl.StringMatchesRegexValidator import StringMatchesRegexValidator
+from datalidator.validators.impl.NumberMinimumValueValidator import NumberMinimumValueValidator
 
 
 class _InternetFetcherModuleConfigModel(ObjectModel):
@@ -36,3 +39,39 @@ class _InternetFetcherModuleConfigModel(ObjectModel):
         filters=(StringStripFilter(),),
         validators=(StringMatchesRegexValidator(r'^[0-9a-z]+://.*\Z'),)
     )
+    max_connections = OptionalItem(
+        wrapped_blueprint=IntegerBlueprint(
+            validators=(NumberMinimumValueValidator(1),)
+        ),
+        default_value=64
+    )
+    max_connections_per_host = OptionalItem(
+        wrapped_blueprint=IntegerBlueprint(
+            validators=(NumberMinimumValueValidator(1),)
+        ),
+        default_value=4
+    )
+    keepalive_timeout = OptionalItem(
+        wrapped_blueprint=IntegerBlueprint(
+            validators=(NumberMinimumValueValidator(1),)
+        ),
+        default_value=30
+    )
+    dns_cache_size = OptionalItem(
+        wrapped_blueprint=IntegerBlueprint(
+            validators=(NumberMinimumValueValidator(0),)
+        ),
+        default_value=4096
+    )
+    dns_cache_ttl = OptionalItem(
+        wrapped_blueprint=IntegerBlueprint(
+            validators=(NumberMinimumValueValidator(0),)
+        ),
+        default_value=300
+    )
+    dns_negative_cache_ttl = OptionalItem(
+        wrapped_blueprint=IntegerBlueprint(
+            validators=(NumberMinimumValueValidator(0),)
+        ),
+        default_value=30
+    )
@@ -20,8 +20,9 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 
+from typing import Tuple
 import abc
-import urllib.robotparser
+from spideriment_ng.helpers.robots.RobotRules import RobotRules
 from spideriment_ng.modules.ModuleIface import ModuleIface
 
 
@@ -30,16 +31,21 @@ class RobotCacheModuleIface(ModuleIface, metaclass=abc.ABCMeta):
     #  worker tasks and therefore all modules must be asyncio-safe!
 
     @abc.abstractmethod
-    async def retrieve_from_cache(self, key: str) -> urllib.robotparser.RobotFileParser:
+    async def retrieve_from_cache(self, key: str) -> Tuple[RobotRules, float]:
         """
+        Returns the cached robot rules along with the number of seconds for which the entry is going to remain in the
+        cache (it may be zero or even negative if the entry is just about to expire).
+
         :raises RobotCacheModuleBaseExc
         """
 
         raise NotImplementedError(self.__class__.retrieve_from_cache.__qualname__)
 
     @abc.abstractmethod
-    async def put_into_cache(self, key: str, robot_parser: urllib.robotparser.RobotFileParser) -> None:
+    async def put_into_cache(self, key: str, robot_rules: RobotRules, ttl: int) -> None:
         """
+        The entry must not be retrieved from the cache after 'ttl' (a positive number of) seconds pass.
+
         :raises RobotCacheModuleBaseExc
         """
 
@@ -25,12 +25,16 @@ from spideriment_ng.modules._ModuleRegistryDefaultBase import _ModuleRegistryDef
 from spideriment_ng.modules.robotcaches.RobotCacheModuleIface import RobotCacheModuleIface
 from spideriment_ng.modules.robotcaches.memory.MemoryRobotCacheModule import MemoryRobotCacheModule
 from spideriment_ng.modules.robotcaches.memcached.MemcachedRobotCacheModule import MemcachedRobotCacheModule
+from spideriment_ng.modules.robotcaches.sharedmemory.SharedMemoryRobotCacheModule import SharedMemoryRobotCacheModule
+from spideriment_ng.modules.robotcaches.sqlite.SQLiteRobotCacheModule import SQLiteRobotCacheModule
 
 
 class RobotCacheModuleRegistry(_ModuleRegistryDefaultBase):
     _ROBOT_CACHE_MODULES: Final[Tuple[Type[RobotCacheModuleIface], ...]] = (
         MemoryRobotCacheModule,
         MemcachedRobotCacheModule,
+        SharedMemoryRobotCacheModule,
+        SQLiteRobotCacheModule,
     )
 
     @classmethod
@@ -0,0 +1,115 @@
+#!/bin/false
+
+# Copyright (c) 2022 Vít Labuda. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without modification, are permitted provided that the
+# following conditions are met:
+#  1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following
+#     disclaimer.
+#  2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the
+#     following disclaimer in the documentation and/or other materials provided with the distribution.
+#  3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote
+#     products derived from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES,
+# INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+from typing import Final, Optional, List, Tuple
+import zlib
+import struct
+from spideriment_ng.helpers.robots.RobotRule import RobotRule
+from spideriment_ng.helpers.robots.RobotRules import RobotRules
+
+
+class _RobotRulesSerializer:
+    # Serializes the already parsed (compiled) robot rules into a compact binary format, so a robot cache can restore
+    #  them without parsing the robots.txt file again.
+    # Format: version (u8), compressed flag (u8), expiration time (f64), payload (compressed using zlib if it is long
+    #  enough). The payload consists of the crawling delay and of the rule sets, each of which is a sequence of path
+    #  patterns and flags whether they allow or disallow the matching paths.
+    # The expiration time (a UNIX timestamp) is stored along with the rules, so a cache tier can tell how long the entry
+    #  is going to be kept when it is promoted into a higher tier.
+
+    _FORMAT_VERSION: Final[int] = 3
+    _COMPRESSION_THRESHOLD: Final[int] = 1024  # Shorter payloads are not compressed
+    _ENCODING: Final[str] = "utf-8"
+
+    _HEADER_STRUCT: Final[struct.Struct] = struct.Struct("<BBd")  # version, compressed, expiration time
+    _RULES_STRUCT: Final[struct.Struct] = struct.Struct("<II")  # crawling delay, rule set count
+    _RULE_SET_STRUCT: Final[struct.Struct] = struct.Struct("<I")  # rule count
+    _RULE_STRUCT: Final[struct.Struct] = struct.Struct("<?I")  # allowed, path pattern length
+
+    # None is returned if the robot rules cannot be represented in the format (e.g. if their crawling delay does not fit
+    #  into an unsigned 32-bit integer) - such robot rules are simply not cached.
+    def serialize(self, robot_rules: RobotRules, expiration_time: float) -> Optional[bytes]:
+        try:
+            return self._serialize(robot_rules, expiration_time)
+        except struct.error:
+            return None
+
+    def _serialize(self, robot_rules: RobotRules, expiration_time: float) -> bytes:
+        rule_sets = robot_rules.get_rule_sets()
+
+        payload = bytearray(self.__class__._RULES_STRUCT.pack(robot_rules.get_crawling_delay(), len(rule_sets)))
+        for rule_set in rule_sets:
+            payload += self.__class__._RULE_SET_STRUCT.pack(len(rule_set))
+            for rule in rule_set:
+                encoded_path_pattern = rule.get_path_pattern().encode(self.__class__._ENCODING)
+                payload += self.__class__._RULE_STRUCT.pack(rule.is_allowed(), len(encoded_path_pattern))
+                payload += encoded_path_pattern
+
+        compressed = (len(payload) >= self.__class__._COMPRESSION_THRESHOLD)
+        if compressed:
+            payload = zlib.compress(payload)
+
+        return self.__class__._HEADER_STRUCT.pack(self.__class__._FORMAT_VERSION, compressed, expiration_time) + payload
+
+    # Returns the robot rules and their expiration time. None is returned if the data are invalid or if they were
+    #  serialized using another version of the format.
+    def deserialize(self, serialized_robot_rules: bytes) -> Optional[Tuple[RobotRules, float]]:
+        try:
+            return self._deserialize(serialized_robot_rules)
+        except (struct.error, zlib.error, ValueError):
+            return None
+
+    def _deserialize(self, serialized_robot_rules: bytes) -> Optional[Tuple[RobotRules, float]]:
+        version, compressed, expiration_time = self.__class__._HEADER_STRUCT.unpack_from(serialized_robot_rules, 0)
+        if version != self.__class__._FORMAT_VERSION:
+            return None
+
+        payload = serialized_robot_rules[self.__class__._HEADER_STRUCT.size:]
+        if compressed:
+            payload = zlib.decompress(payload)
+
+        crawling_delay, rule_set_count = self.__class__._RULES_STRUCT.unpack_from(payload, 0)
+        offset = self.__class__._RULES_STRUCT.size
+
+        rule_sets = []
+        for _ in range(rule_set_count):
+            rule_set, offset = self._deserialize_rule_set(payload, offset)
+            rule_sets.append(rule_set)
+
+        return RobotRules(rule_sets=rule_sets, crawling_delay=crawling_delay), expiration_time
+
+    def _deserialize_rule_set(self, payload: bytes, offset: int) -> Tuple[List[RobotRule], int]:
+        rule_count, = self.__class__._RULE_SET_STRUCT.unpack_from(payload, offset)
+        offset += self.__class__._RULE_SET_STRUCT.size
+
+        rule_set = []
+        for _ in range(rule_count):
+            allowed, path_pattern_length = self.__class__._RULE_STRUCT.unpack_from(payload, offset)
+            offset += self.__class__._RULE_STRUCT.size
+
+            if (path_pattern_length == 0) or ((offset + path_pattern_length) > len(payload)):
+                raise ValueError("The serialized data are invalid!")
+
+            rule_set.append(RobotRule(payload[offset:(offset + path_pattern_length)].decode(self.__class__._ENCODING), allowed))
+            offset += path_pattern_length
+
+        return rule_set, offset
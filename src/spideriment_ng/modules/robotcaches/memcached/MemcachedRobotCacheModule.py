@@ -21,14 +21,16 @@
 
 
 from __future__ import annotations
-from typing import Final
+from typing import Final, Tuple
+import time
 import hashlib
-import urllib.robotparser
 import aiomcache
 from datalidator.blueprints.impl.ObjectBlueprint import ObjectBlueprint
+from spideriment_ng.helpers.robots.RobotRules import RobotRules
 from spideriment_ng.modules.ModuleInfo import ModuleInfo
 from spideriment_ng.modules.ModuleType import ModuleType
 from spideriment_ng.modules.robotcaches.RobotCacheModuleIface import RobotCacheModuleIface
+from spideriment_ng.modules.robotcaches._RobotRulesSerializer import _RobotRulesSerializer
 from spideriment_ng.modules.robotcaches.memcached._MemcachedRobotCacheModuleConfigModel import _MemcachedRobotCacheModuleConfigModel
 from spideriment_ng.modules.robotcaches.memcached.exc.MemcachedConnectionFailureExc import MemcachedConnectionFailureExc
 from spideriment_ng.modules.robotcaches.memcached.exc.MemcachedDisconnectionFailureExc import MemcachedDisconnectionFailureExc
@@ -45,6 +47,8 @@ class MemcachedRobotCacheModule(RobotCacheModuleIface):
 
     _MEMCACHED_KEY_PATTERN: Final[str] = "spideriment_ng.memcached_robot_cache_module.{supplied_key_hash}"
     _ENCODING: Final[str] = "utf-8"
+    # Memcached interprets expiration times longer than 30 days as absolute UNIX timestamps
+    _MAX_RELATIVE_EXPIRATION_TIME: Final[int] = (30 * 24 * 60 * 60)
 
     @classmethod
     def get_module_info(cls) -> ModuleInfo:
@@ -54,6 +58,7 @@ class MemcachedRobotCacheModule(RobotCacheModuleIface):
         self._memcached_client: Final[aiomcache.Client] = memcached_client
         self._memcached_host: Final[str] = memcached_host
         self._memcached_port: Final[int] = memcached_port
+        self._robot_rules_serializer: Final[_RobotRulesSerializer] = _RobotRulesSerializer()
         self._operational: bool = True
 
     @classmethod
@@ -83,7 +88,7 @@ class MemcachedRobotCacheModule(RobotCacheModuleIface):
         except Exception as f:
             raise MemcachedDisconnectionFailureExc(self._memcached_host, self._memcached_port, str(f))
 
-    async def retrieve_from_cache(self, key: str) -> urllib.robotparser.RobotFileParser:
+    async def retrieve_from_cache(self, key: str) -> Tuple[RobotRules, float]:
         assert self._operational
 
         memcached_key = self._make_memcached_key_from_supplied_key(key)
@@ -100,16 +105,25 @@ class MemcachedRobotCacheModule(RobotCacheModuleIface):
         if retrieved_value is None:
             raise MemcachedCacheMissExc(key)
 
-        return self._bytes_to_robot_parser(retrieved_value)
+        deserialized_value = self._robot_rules_serializer.deserialize(retrieved_value)
+        if deserialized_value is None:  # The value is corrupted or has been stored by an incompatible version of the program
+            raise MemcachedCacheMissExc(key)
+
+        robot_rules, expiration_time = deserialized_value
+        return robot_rules, (expiration_time - time.time())
 
-    async def put_into_cache(self, key: str, robot_parser: urllib.robotparser.RobotFileParser) -> None:
+    async def put_into_cache(self, key: str, robot_rules: RobotRules, ttl: int) -> None:
         assert self._operational
+        assert (ttl > 0)
 
         memcached_key = self._make_memcached_key_from_supplied_key(key)
-        memcached_value = self._robot_parser_to_bytes(robot_parser)
+        memcached_value = self._robot_rules_serializer.serialize(robot_rules, time.time() + ttl)
+        if memcached_value is None:  # The robot rules cannot be cached
+            return
+        memcached_exptime = self._make_memcached_exptime_from_ttl(ttl)
 
         try:
-            await self._memcached_client.set(key=memcached_key, value=memcached_value)
+            await self._memcached_client.set(key=memcached_key, value=memcached_value, exptime=memcached_exptime)
         except AssertionError as e:
             raise e
         except OSError as f:
@@ -123,13 +137,8 @@ class MemcachedRobotCacheModule(RobotCacheModuleIface):
 
         return memcached_key_str.encode(self.__class__._ENCODING)
 
-    def _bytes_to_robot_parser(self, bytes_: bytes) -> urllib.robotparser.RobotFileParser:
-        lines = bytes_.decode(self.__class__._ENCODING).splitlines()
-
-        robot_parser = urllib.robotparser.RobotFileParser()
-        robot_parser.parse(lines)
-
-        return robot_parser
+    def _make_memcached_exptime_from_ttl(self, ttl: int) -> int:
+        if ttl > self.__class__._MAX_RELATIVE_EXPIRATION_TIME:
+            return int(time.time()) + ttl
 
-    def _robot_parser_to_bytes(self, robot_parser: urllib.robotparser.RobotFileParser) -> bytes:
-        return str(robot_parser).encode(self.__class__._ENCODING)
+        return ttl
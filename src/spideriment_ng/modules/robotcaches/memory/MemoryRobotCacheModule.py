@@ -21,10 +21,11 @@
 
 
 from __future__ import annotations
-from typing import Final, Dict
+from typing import Final, Dict, Tuple
 import time
-import urllib.robotparser
+import collections
 from datalidator.blueprints.impl.ObjectBlueprint import ObjectBlueprint
+from spideriment_ng.helpers.robots.RobotRules import RobotRules
 from spideriment_ng.modules.ModuleInfo import ModuleInfo
 from spideriment_ng.modules.ModuleType import ModuleType
 from spideriment_ng.modules.robotcaches.RobotCacheModuleIface import RobotCacheModuleIface
@@ -40,18 +41,23 @@ class MemoryRobotCacheModule(RobotCacheModuleIface):
         configuration_blueprint=ObjectBlueprint(_MemoryRobotCacheModuleConfigModel)
     )
 
-    # Since clearing the cache is somewhat computationally intensive, entries are removed in "bursts" - up to the following fraction of the maximum cache size is removed at once, so the cache does not have to be cleared that often
-    _CLEAR_CACHE_BURST_FRACTION: Final[float] = (1 / 10)
-    _CLEAR_CACHE_MINIMUM_SECONDS_SINCE_LAST_HIT: Final[int] = 20
+    # The cache is a bounded LRU cache - the entries are kept in the order of their last use, so retrieving, putting
+    #  and evicting an entry takes constant time. When the cache is full, the least recently used entry is evicted to
+    #  make space for the new one. Expired entries are removed when they are encountered.
 
     @classmethod
     def get_module_info(cls) -> ModuleInfo:
         return cls._MODULE_INFO
 
     def __init__(self, max_entries: int):
-        self._cache_dict: Final[Dict[str, _CacheEntry]] = dict()
+        assert (max_entries > 0)
+
+        self._cache_dict: Final[collections.OrderedDict[str, _CacheEntry]] = collections.OrderedDict()
         self._max_entries: Final[int] = max_entries
-        self._clear_cache_burst: Final[int] = max(int(max_entries * self.__class__._CLEAR_CACHE_BURST_FRACTION), 1)
+        self._hit_count: int = 0
+        self._miss_count: int = 0
+        self._eviction_count: int = 0
+        self._expiration_count: int = 0
         self._operational: bool = True
 
     @classmethod
@@ -64,46 +70,42 @@ class MemoryRobotCacheModule(RobotCacheModuleIface):
 
         self._cache_dict.clear()
 
-    async def retrieve_from_cache(self, key: str) -> urllib.robotparser.RobotFileParser:
+    async def retrieve_from_cache(self, key: str) -> Tuple[RobotRules, float]:
         assert self._operational
 
         try:
             cache_entry = self._cache_dict[key]
         except KeyError:
+            self._miss_count += 1
             raise MemoryCacheMissExc(key)
 
-        cache_entry.set_last_hit_timestamp(self._get_current_timestamp())
-
-        return cache_entry.get_robot_parser()
-
-    async def put_into_cache(self, key: str, robot_parser: urllib.robotparser.RobotFileParser) -> None:
-        assert self._operational
-
-        self._clear_cache_if_necessary()
-
-        if (key in self._cache_dict) or self._is_there_space_in_cache():
-            self._cache_dict[key] = _CacheEntry(robot_parser, self._get_current_timestamp())
-
-    def _is_there_space_in_cache(self) -> bool:
-        return len(self._cache_dict) < self._max_entries
-
-    def _get_current_timestamp(self) -> int:
-        return int(time.time())
-
-    def _clear_cache_if_necessary(self) -> None:
-        if self._is_there_space_in_cache():
-            return
-
-        current_timestamp = self._get_current_timestamp()
+        remaining_ttl = (cache_entry.get_expiration_time() - time.monotonic())
+        if remaining_ttl <= 0:
+            del self._cache_dict[key]
+            self._expiration_count += 1
+            self._miss_count += 1
+            raise MemoryCacheMissExc(key)
 
-        to_be_removed = []
-        for key, cache_entry in self._cache_dict.items():
-            seconds_since_last_hit = (current_timestamp - cache_entry.get_last_hit_timestamp())
-            if seconds_since_last_hit >= self.__class__._CLEAR_CACHE_MINIMUM_SECONDS_SINCE_LAST_HIT:
-                to_be_removed.append((key, seconds_since_last_hit))
+        self._cache_dict.move_to_end(key)
+        self._hit_count += 1
 
-        to_be_removed.sort(key=lambda item: item[1], reverse=True)  # The "oldest" entries will be first
-        to_be_removed = to_be_removed[0:self._clear_cache_burst]
+        return cache_entry.get_robot_rules(), remaining_ttl
 
-        for key, _ in to_be_removed:
-            del self._cache_dict[key]
+    async def put_into_cache(self, key: str, robot_rules: RobotRules, ttl: int) -> None:
+        assert self._operational
+        assert (ttl > 0)
+
+        self._cache_dict[key] = _CacheEntry(robot_rules, time.monotonic() + ttl)
+        self._cache_dict.move_to_end(key)
+
+        while len(self._cache_dict) > self._max_entries:
+            self._cache_dict.popitem(last=False)
+            self._eviction_count += 1
+
+    def get_statistics(self) -> Dict[str, int]:
+        return {
+            "hits": self._hit_count,
+            "misses": self._miss_count,
+            "evictions": self._eviction_count,  # Expired entries are not included
+            "expirations": self._expiration_count
+        }
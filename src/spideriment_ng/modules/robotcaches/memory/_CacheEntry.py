@@ -21,19 +21,16 @@
 
 
 from typing import Final
-import urllib.robotparser
+from spideriment_ng.helpers.robots.RobotRules import RobotRules
 
 
 class _CacheEntry:
-    def __init__(self, robot_parser: urllib.robotparser.RobotFileParser, last_hit_timestamp: int):
-        self._robot_parser: Final[urllib.robotparser.RobotFileParser] = robot_parser
-        self._last_hit_timestamp: int = last_hit_timestamp
+    def __init__(self, robot_rules: RobotRules, expiration_time: float):
+        self._robot_rules: Final[RobotRules] = robot_rules
+        self._expiration_time: Final[float] = expiration_time  # In terms of 'time.monotonic()'
 
-    def get_robot_parser(self) -> urllib.robotparser.RobotFileParser:
-        return self._robot_parser
+    def get_robot_rules(self) -> RobotRules:
+        return self._robot_rules
 
-    def get_last_hit_timestamp(self) -> int:
-        return self._last_hit_timestamp
-
-    def set_last_hit_timestamp(self, last_hit_timestamp: int) -> None:
-        self._last_hit_timestamp = last_hit_timestamp
+    def get_expiration_time(self) -> float:
+        return self._expiration_time
@@ -0,0 +1,135 @@
+#!/bin/false
+
+# Copyright (c) 2022 Vít Labuda. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without modification, are permitted provided that the
+# following conditions are met:
+#  1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following
+#     disclaimer.
+#  2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the
+#     following disclaimer in the documentation and/or other materials provided with the distribution.
+#  3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote
+#     products derived from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES,
+# INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+from __future__ import annotations
+from typing import Final, Dict, Tuple
+import os
+import time
+from datalidator.blueprints.impl.ObjectBlueprint import ObjectBlueprint
+from spideriment_ng.helpers.robots.RobotRules import RobotRules
+from spideriment_ng.modules.ModuleInfo import ModuleInfo
+from spideriment_ng.modules.ModuleType import ModuleType
+from spideriment_ng.modules.robotcaches.RobotCacheModuleIface import RobotCacheModuleIface
+from spideriment_ng.modules.robotcaches._RobotRulesSerializer import _RobotRulesSerializer
+from spideriment_ng.modules.robotcaches.sharedmemory._SharedMemoryRobotCacheModuleConfigModel import _SharedMemoryRobotCacheModuleConfigModel
+from spideriment_ng.modules.robotcaches.sharedmemory._SharedMemoryHashTable import _SharedMemoryHashTable
+from spideriment_ng.modules.robotcaches.sharedmemory.exc.SharedMemoryOpeningFailureExc import SharedMemoryOpeningFailureExc
+from spideriment_ng.modules.robotcaches.sharedmemory.exc.SharedMemoryIncompatibleFileExc import SharedMemoryIncompatibleFileExc
+from spideriment_ng.modules.robotcaches.sharedmemory.exc.SharedMemoryClosingFailureExc import SharedMemoryClosingFailureExc
+from spideriment_ng.modules.robotcaches.sharedmemory.exc.SharedMemoryAccessFailureExc import SharedMemoryAccessFailureExc
+from spideriment_ng.modules.robotcaches.sharedmemory.exc.SharedMemoryCacheMissExc import SharedMemoryCacheMissExc
+
+
+class SharedMemoryRobotCacheModule(RobotCacheModuleIface):
+    _MODULE_INFO: Final[ModuleInfo] = ModuleInfo(
+        type_=ModuleType.ROBOT_CACHE,
+        name="sharedmemory",
+        configuration_blueprint=ObjectBlueprint(_SharedMemoryRobotCacheModuleConfigModel)
+    )
+
+    _ENCODING: Final[str] = "utf-8"
+
+    # All the worker processes (on a single machine) open the same memory-mapped file, so a robots.txt file fetched by
+    #  one of them is available to all the other ones. The file should be placed on a memory-backed filesystem (e.g.
+    #  '/dev/shm' on Linux).
+
+    @classmethod
+    def get_module_info(cls) -> ModuleInfo:
+        return cls._MODULE_INFO
+
+    def __init__(self, hash_table: _SharedMemoryHashTable, shared_memory_file_path: str):
+        self._hash_table: Final[_SharedMemoryHashTable] = hash_table
+        self._shared_memory_file_path: Final[str] = shared_memory_file_path
+        self._robot_rules_serializer: Final[_RobotRulesSerializer] = _RobotRulesSerializer()
+        self._hit_count: int = 0
+        self._miss_count: int = 0
+        self._eviction_count: int = 0
+        self._rejected_insert_count: int = 0
+        self._operational: bool = True
+
+    @classmethod
+    async def create_instance(cls, module_options: _SharedMemoryRobotCacheModuleConfigModel, instance_name: str) -> SharedMemoryRobotCacheModule:
+        shared_memory_file_path = module_options.shared_memory_file_path
+
+        try:
+            hash_table = _SharedMemoryHashTable.open(shared_memory_file_path, module_options.max_entries, module_options.max_entry_size)
+        except _SharedMemoryHashTable.IncompatibleFileExc:
+            raise SharedMemoryIncompatibleFileExc(shared_memory_file_path, os.getcwd())
+        except OSError as e:
+            raise SharedMemoryOpeningFailureExc(shared_memory_file_path, os.getcwd(), str(e))
+
+        return cls(hash_table, shared_memory_file_path)
+
+    async def destroy_instance(self) -> None:
+        assert self._operational
+        self._operational = False
+
+        # The file itself is not deleted, since it might still be used by other worker processes
+        try:
+            self._hash_table.close()
+        except OSError as e:
+            raise SharedMemoryClosingFailureExc(self._shared_memory_file_path, os.getcwd(), str(e))
+
+    async def retrieve_from_cache(self, key: str) -> Tuple[RobotRules, float]:
+        assert self._operational
+
+        current_time = time.time()
+        try:
+            retrieved_value = self._hash_table.get(key.encode(self.__class__._ENCODING), current_time)
+        except OSError as e:
+            raise SharedMemoryAccessFailureExc(self._shared_memory_file_path, os.getcwd(), str(e))
+
+        deserialized_value = (None if retrieved_value is None else self._robot_rules_serializer.deserialize(retrieved_value))
+        if deserialized_value is None:
+            self._miss_count += 1
+            raise SharedMemoryCacheMissExc(key)
+
+        self._hit_count += 1
+        robot_rules, expiration_time = deserialized_value
+        return robot_rules, (expiration_time - current_time)
+
+    async def put_into_cache(self, key: str, robot_rules: RobotRules, ttl: int) -> None:
+        assert self._operational
+        assert (ttl > 0)
+
+        current_time = time.time()
+        encoded_key = key.encode(self.__class__._ENCODING)
+        encoded_value = self._robot_rules_serializer.serialize(robot_rules, current_time + ttl)
+        if (encoded_value is None) or ((len(encoded_key) + len(encoded_value)) > self._hash_table.get_max_entry_size()):
+            self._rejected_insert_count += 1  # Too big (or otherwise unrepresentable) robots.txt files are not cached
+            return
+
+        try:
+            evicted = self._hash_table.put(encoded_key, encoded_value, current_time + ttl, current_time)
+        except OSError as e:
+            raise SharedMemoryAccessFailureExc(self._shared_memory_file_path, os.getcwd(), str(e))
+
+        if evicted:
+            self._eviction_count += 1
+
+    def get_statistics(self) -> Dict[str, int]:
+        return {
+            "hits": self._hit_count,
+            "misses": self._miss_count,
+            "evictions": self._eviction_count,
+            "rejected_inserts": self._rejected_insert_count  # Entries bigger than 'max_entry_size'
+        }
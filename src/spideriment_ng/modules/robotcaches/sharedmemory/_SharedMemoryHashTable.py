@@ -0,0 +1,167 @@
+#!/bin/false
+
+# Copyright (c) 2022 Vít Labuda. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without modification, are permitted provided that the
+# following conditions are met:
+#  1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following
+#     disclaimer.
+#  2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the
+#     following disclaimer in the documentation and/or other materials provided with the distribution.
+#  3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote
+#     products derived from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES,
+# INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+from __future__ import annotations
+from typing import Final, Optional, Tuple
+import os
+import mmap
+import fcntl
+import struct
+import hashlib
+import contextlib
+
+
+class _SharedMemoryHashTable:
+    # A fixed-size hash table stored in a memory-mapped file, which is shared by all the worker processes opening the
+    #  same file. The table consists of a header and of equally-sized slots; a key may be stored only in one of the
+    #  '_PROBED_SLOTS' slots following the slot its hash points to. If none of the slots is free, the entry expiring
+    #  the soonest is replaced. Access from multiple processes is synchronized using 'flock()' - reads hold a shared
+    #  lock, writes an exclusive one.
+    # Expiration times are UNIX timestamps, since they have to be comparable between processes.
+    # An existing file is never resized or reinitialized, as it might be mapped into the memory of other processes at the
+    #  same time (accessing the mapping of a truncated file makes a process crash with SIGBUS).
+    # All methods may raise 'OSError'.
+
+    class IncompatibleFileExc(Exception):
+        pass
+
+    _MAGIC: Final[bytes] = b"SNGRBTC\x01"
+    _HEADER_STRUCT: Final[struct.Struct] = struct.Struct("<8sII")  # magic, slot count, slot size
+    _HEADER_SIZE: Final[int] = 64
+    _SLOT_HEADER_STRUCT: Final[struct.Struct] = struct.Struct("<?xxxdII")  # used, expiration time, key length, value length
+    _PROBED_SLOTS: Final[int] = 8
+
+    def __init__(self, file_descriptor: int, mmapped_file: mmap.mmap, slot_count: int, slot_size: int):
+        self._file_descriptor: Final[int] = file_descriptor
+        self._mmapped_file: Final[mmap.mmap] = mmapped_file
+        self._slot_count: Final[int] = slot_count
+        self._slot_size: Final[int] = slot_size
+        self._max_entry_size: Final[int] = (slot_size - self.__class__._SLOT_HEADER_STRUCT.size)
+
+    # Raises 'IncompatibleFileExc' if the file exists, but its layout does not match the arguments.
+    @classmethod
+    def open(cls, file_path: str, slot_count: int, max_entry_size: int) -> _SharedMemoryHashTable:
+        assert (slot_count > 0)
+        assert (max_entry_size > 0)
+
+        slot_size = (cls._SLOT_HEADER_STRUCT.size + max_entry_size)
+        file_size = (cls._HEADER_SIZE + (slot_count * slot_size))
+        header = cls._HEADER_STRUCT.pack(cls._MAGIC, slot_count, slot_size)
+
+        file_descriptor = os.open(file_path, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            # The process which has created the file initializes it
+            with cls._file_lock(file_descriptor, fcntl.LOCK_EX):
+                current_file_size = os.fstat(file_descriptor).st_size
+                if current_file_size == 0:
+                    os.pwrite(file_descriptor, header, 0)
+                    os.ftruncate(file_descriptor, file_size)  # Zero-filled slots are not used
+                elif (current_file_size != file_size) or (os.pread(file_descriptor, len(header), 0) != header):
+                    raise cls.IncompatibleFileExc()
+
+            mmapped_file = mmap.mmap(file_descriptor, file_size, flags=mmap.MAP_SHARED, prot=(mmap.PROT_READ | mmap.PROT_WRITE))
+        except BaseException as e:
+            os.close(file_descriptor)
+            raise e
+
+        return cls(file_descriptor, mmapped_file, slot_count, slot_size)
+
+    def close(self) -> None:
+        try:
+            self._mmapped_file.close()
+        finally:
+            os.close(self._file_descriptor)
+
+    def get_max_entry_size(self) -> int:  # The combined length of a key and of its value
+        return self._max_entry_size
+
+    def get(self, key: bytes, current_time: float) -> Optional[bytes]:
+        with self.__class__._file_lock(self._file_descriptor, fcntl.LOCK_SH):
+            for slot_offset in self._get_probed_slot_offsets(key):
+                used, expiration_time, key_length, value_length = self.__class__._SLOT_HEADER_STRUCT.unpack_from(self._mmapped_file, slot_offset)
+                if (not used) or (expiration_time <= current_time) or (not self._is_key_in_slot(key, slot_offset, key_length)):
+                    continue
+
+                value_offset = (slot_offset + self.__class__._SLOT_HEADER_STRUCT.size + key_length)
+                return self._mmapped_file[value_offset:(value_offset + value_length)]
+
+        return None
+
+    # Returns True if a valid entry of another key had to be replaced (evicted).
+    def put(self, key: bytes, value: bytes, expiration_time: float, current_time: float) -> bool:
+        assert ((len(key) + len(value)) <= self._max_entry_size)
+
+        with self.__class__._file_lock(self._file_descriptor, fcntl.LOCK_EX):
+            key_slot_offset = None
+            free_slot_offset = None
+            soonest_expiring_slot_offset = None
+            soonest_expiration_time = None
+
+            for slot_offset in self._get_probed_slot_offsets(key):
+                used, slot_expiration_time, key_length, _ = self.__class__._SLOT_HEADER_STRUCT.unpack_from(self._mmapped_file, slot_offset)
+                if used and self._is_key_in_slot(key, slot_offset, key_length):
+                    key_slot_offset = slot_offset
+                    break
+
+                if (not used) or (slot_expiration_time <= current_time):
+                    if free_slot_offset is None:
+                        free_slot_offset = slot_offset
+                elif (soonest_expiration_time is None) or (slot_expiration_time < soonest_expiration_time):
+                    soonest_expiring_slot_offset = slot_offset
+                    soonest_expiration_time = slot_expiration_time
+
+            if key_slot_offset is not None:
+                target_slot_offset, evicted = key_slot_offset, False
+            elif free_slot_offset is not None:
+                target_slot_offset, evicted = free_slot_offset, False
+            else:
+                target_slot_offset, evicted = soonest_expiring_slot_offset, True
+
+            slot_contents = (self.__class__._SLOT_HEADER_STRUCT.pack(True, expiration_time, len(key), len(value)) + key + value)
+            self._mmapped_file[target_slot_offset:(target_slot_offset + len(slot_contents))] = slot_contents
+
+        return evicted
+
+    def _get_probed_slot_offsets(self, key: bytes) -> Tuple[int, ...]:
+        first_slot_index = (int.from_bytes(hashlib.blake2b(key, digest_size=8).digest(), "little") % self._slot_count)
+        probed_slots = min(self.__class__._PROBED_SLOTS, self._slot_count)
+
+        return tuple(
+            (self.__class__._HEADER_SIZE + (((first_slot_index + i) % self._slot_count) * self._slot_size))
+            for i in range(probed_slots)
+        )
+
+    def _is_key_in_slot(self, key: bytes, slot_offset: int, key_length: int) -> bool:
+        if key_length != len(key):
+            return False
+
+        key_offset = (slot_offset + self.__class__._SLOT_HEADER_STRUCT.size)
+        return self._mmapped_file[key_offset:(key_offset + key_length)] == key
+
+    @staticmethod
+    @contextlib.contextmanager
+    def _file_lock(file_descriptor: int, operation: int):
+        fcntl.flock(file_descriptor, operation)
+        try:
+            yield
+        finally:
+            fcntl.flock(file_descriptor, fcntl.LOCK_UN)
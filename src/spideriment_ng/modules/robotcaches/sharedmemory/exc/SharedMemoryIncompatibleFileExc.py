@@ -0,0 +1,38 @@
+#!/bin/false
+
+# Copyright (c) 2022 Vít Labuda. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without modification, are permitted provided that the
+# following conditions are met:
+#  1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following
+#     disclaimer.
+#  2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the
+#     following disclaimer in the documentation and/or other materials provided with the distribution.
+#  3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote
+#     products derived from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES,
+# INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+from typing import Final
+from spideriment_ng.modules.robotcaches.sharedmemory.exc.SharedMemoryRobotCacheModuleBaseExc import SharedMemoryRobotCacheModuleBaseExc
+
+
+class SharedMemoryIncompatibleFileExc(SharedMemoryRobotCacheModuleBaseExc):
+    def __init__(self, shared_memory_file_path: str, working_directory: str):
+        SharedMemoryRobotCacheModuleBaseExc.__init__(self, f"The shared memory file on path {repr(shared_memory_file_path)} (working directory: {repr(working_directory)}) has been created with different 'max_entries' or 'max_entry_size' options, or by another program - it must be deleted before it can be used with the current options (after stopping all the program instances using it)!", False)
+
+        self._shared_memory_file_path: Final[str] = shared_memory_file_path
+        self._working_directory: Final[str] = working_directory
+
+    def get_shared_memory_file_path(self) -> str:
+        return self._shared_memory_file_path
+
+    def get_working_directory(self) -> str:
+        return self._working_directory
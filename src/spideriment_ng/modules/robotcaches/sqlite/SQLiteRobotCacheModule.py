@@ -0,0 +1,169 @@
+#!/bin/false
+
+# Copyright (c) 2022 Vít Labuda. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without modification, are permitted provided that the
+# following conditions are met:
+#  1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following
+#     disclaimer.
+#  2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the
+#     following disclaimer in the documentation and/or other materials provided with the distribution.
+#  3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote
+#     products derived from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES,
+# INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+from __future__ import annotations
+from typing import Final, Optional, Any, Callable, Tuple, Dict
+import functools
+import os
+import time
+import sqlite3
+from datalidator.blueprints.impl.ObjectBlueprint import ObjectBlueprint
+from spideriment_ng.helpers.robots.RobotRules import RobotRules
+from spideriment_ng.helpers.sqlite.SQLiteDatabaseThread import SQLiteDatabaseThread
+from spideriment_ng.modules.ModuleInfo import ModuleInfo
+from spideriment_ng.modules.ModuleType import ModuleType
+from spideriment_ng.modules.robotcaches.RobotCacheModuleIface import RobotCacheModuleIface
+from spideriment_ng.modules.robotcaches._RobotRulesSerializer import _RobotRulesSerializer
+from spideriment_ng.modules.robotcaches.sqlite._SQLiteRobotCacheModuleConfigModel import _SQLiteRobotCacheModuleConfigModel
+from spideriment_ng.modules.robotcaches.sqlite.exc.SQLiteRobotCacheModuleBaseExc import SQLiteRobotCacheModuleBaseExc
+from spideriment_ng.modules.robotcaches.sqlite.exc.SQLiteOpeningFailureExc import SQLiteOpeningFailureExc
+from spideriment_ng.modules.robotcaches.sqlite.exc.SQLiteClosingFailureExc import SQLiteClosingFailureExc
+from spideriment_ng.modules.robotcaches.sqlite.exc.SQLiteQueryFailureExc import SQLiteQueryFailureExc
+from spideriment_ng.modules.robotcaches.sqlite.exc.SQLiteCacheMissExc import SQLiteCacheMissExc
+
+
+# Decorator
+def _sqlite_async_exception_handling_context(func: Callable) -> Callable:
+    @functools.wraps(func)
+    async def _async_exception_handling_wrapper_function(self, *args, **kwargs) -> Any:
+        try:
+            return await func(self, *args, **kwargs)
+        except (SQLiteRobotCacheModuleBaseExc, AssertionError) as e:
+            raise e
+        except sqlite3.Error as f:
+            raise SQLiteQueryFailureExc(self._cache_file_path, os.getcwd(), str(f))
+
+    return _async_exception_handling_wrapper_function
+
+
+class SQLiteRobotCacheModule(RobotCacheModuleIface):
+    _MODULE_INFO: Final[ModuleInfo] = ModuleInfo(
+        type_=ModuleType.ROBOT_CACHE,
+        name="sqlite",
+        configuration_blueprint=ObjectBlueprint(_SQLiteRobotCacheModuleConfigModel)
+    )
+
+    _CREATE_TABLE_QUERY: Final[str] = "CREATE TABLE IF NOT EXISTS robot_cache (cache_key TEXT NOT NULL PRIMARY KEY, expires_at INTEGER NOT NULL, serialized_robot_rules BLOB NOT NULL) WITHOUT ROWID;"
+    _CREATE_INDEX_QUERY: Final[str] = "CREATE INDEX IF NOT EXISTS robot_cache_expires_at ON robot_cache (expires_at);"
+    _RETRIEVE_QUERY: Final[str] = "SELECT serialized_robot_rules FROM robot_cache WHERE cache_key = ? AND expires_at > ?;"
+    _PUT_QUERY: Final[str] = "INSERT OR REPLACE INTO robot_cache (cache_key, expires_at, serialized_robot_rules) VALUES (?, ?, ?);"
+    _PURGE_EXPIRED_QUERY: Final[str] = "DELETE FROM robot_cache WHERE cache_key IN (SELECT cache_key FROM robot_cache WHERE expires_at <= ? LIMIT ?);"
+
+    _PURGE_EXPIRED_EVERY_N_PUTS: Final[int] = 256
+    _MAX_PURGED_ENTRIES_PER_PURGE: Final[int] = 1024
+
+    # The cached robots.txt rules are stored in a single SQLite database file, which is shared by all worker processes
+    #  of the program and which survives program restarts, so the robots.txt files of the hosts which were being
+    #  crawled before a restart do not have to be re-fetched all at once after it. Each operation consists of a single
+    #  statement (i.e. it is carried out in its own implicit transaction), so the processes hold the database's write
+    #  lock only very briefly. All the database operations of a worker process are carried out in its own database
+    #  thread (see 'SQLiteDatabaseThread').
+    # Expired entries are never returned; they are deleted in small batches every once in a while, so that the
+    #  database file does not grow indefinitely.
+
+    @classmethod
+    def get_module_info(cls) -> ModuleInfo:
+        return cls._MODULE_INFO
+
+    def __init__(self, database_thread: SQLiteDatabaseThread, cache_file_path: str):
+        self._database_thread: Final[SQLiteDatabaseThread] = database_thread
+        self._database_connection: Final[sqlite3.Connection] = database_thread.get_database_connection()  # Only for use in the database thread!
+        self._cache_file_path: Final[str] = cache_file_path
+        self._robot_rules_serializer: Final[_RobotRulesSerializer] = _RobotRulesSerializer()
+        self._puts_until_next_purge: int = self.__class__._PURGE_EXPIRED_EVERY_N_PUTS
+        self._hit_count: int = 0
+        self._miss_count: int = 0
+        self._operational: bool = True
+
+    @classmethod
+    async def create_instance(cls, module_options: _SQLiteRobotCacheModuleConfigModel, instance_name: str) -> SQLiteRobotCacheModule:
+        cache_file_path = module_options.cache_file_path
+
+        try:
+            database_thread = await SQLiteDatabaseThread.open(cache_file_path, module_options.busy_timeout, (cls._CREATE_TABLE_QUERY, cls._CREATE_INDEX_QUERY))
+        except sqlite3.Error as e:
+            raise SQLiteOpeningFailureExc(cache_file_path, os.getcwd(), str(e))
+
+        return cls(database_thread, cache_file_path)
+
+    async def destroy_instance(self) -> None:
+        assert self._operational
+        self._operational = False
+
+        try:
+            await self._database_thread.close()
+        except Exception as e:
+            raise SQLiteClosingFailureExc(self._cache_file_path, os.getcwd(), str(e))
+
+    @_sqlite_async_exception_handling_context
+    async def retrieve_from_cache(self, key: str) -> Tuple[RobotRules, float]:
+        assert self._operational
+
+        retrieved_value = await self._database_thread.run(self._retrieve_from_cache_in_database_thread, key)
+
+        deserialized_value = (None if retrieved_value is None else self._robot_rules_serializer.deserialize(retrieved_value))
+        if deserialized_value is None:
+            self._miss_count += 1
+            raise SQLiteCacheMissExc(key)
+
+        self._hit_count += 1
+        robot_rules, expiration_time = deserialized_value
+        return robot_rules, (expiration_time - time.time())
+
+    def _retrieve_from_cache_in_database_thread(self, key: str) -> Optional[bytes]:
+        row = self._database_connection.execute(self.__class__._RETRIEVE_QUERY, (key, self._get_current_timestamp())).fetchone()
+        if row is None:
+            return None
+
+        return row[0]
+
+    @_sqlite_async_exception_handling_context
+    async def put_into_cache(self, key: str, robot_rules: RobotRules, ttl: int) -> None:
+        assert self._operational
+        assert (ttl > 0)
+
+        serialized_robot_rules = self._robot_rules_serializer.serialize(robot_rules, time.time() + ttl)
+        if serialized_robot_rules is None:  # The robot rules cannot be cached
+            return
+
+        self._puts_until_next_purge -= 1
+        purge_expired = (self._puts_until_next_purge <= 0)
+        if purge_expired:
+            self._puts_until_next_purge = self.__class__._PURGE_EXPIRED_EVERY_N_PUTS
+
+        await self._database_thread.run(self._put_into_cache_in_database_thread, key, serialized_robot_rules, ttl, purge_expired)
+
+    def _put_into_cache_in_database_thread(self, key: str, serialized_robot_rules: bytes, ttl: int, purge_expired: bool) -> None:
+        current_timestamp = self._get_current_timestamp()
+
+        self._database_connection.execute(self.__class__._PUT_QUERY, (key, current_timestamp + ttl, serialized_robot_rules))
+        if purge_expired:
+            self._database_connection.execute(self.__class__._PURGE_EXPIRED_QUERY, (current_timestamp, self.__class__._MAX_PURGED_ENTRIES_PER_PURGE))
+
+    def _get_current_timestamp(self) -> int:
+        return int(time.time())
+
+    def get_statistics(self) -> Dict[str, int]:
+        return {
+            "hits": self._hit_count,
+            "misses": self._miss_count
+        }
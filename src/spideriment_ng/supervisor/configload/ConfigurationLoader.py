@@ -107,8 +107,15 @@ class ConfigurationLoader:
         return LimitsConfiguration(
             worker_processes=limits_config_model.worker_processes,
             worker_tasks_per_process=limits_config_model.worker_tasks_per_process,
+            url_lease_batch_size=limits_config_model.url_lease_batch_size,
+            max_buffered_crawling_results=limits_config_model.max_buffered_crawling_results,
+            crawling_result_flush_interval=limits_config_model.crawling_result_flush_interval,
             max_document_size=limits_config_model.max_document_size,
             max_robots_txt_size=limits_config_model.max_robots_txt_size,
+            robots_txt_cache_ttl=limits_config_model.robots_txt_cache_ttl,
+            robots_txt_not_found_cache_ttl=limits_config_model.robots_txt_not_found_cache_ttl,
+            robots_txt_error_cache_ttl=limits_config_model.robots_txt_error_cache_ttl,
+            robots_txt_promoted_cache_ttl=limits_config_model.robots_txt_promoted_cache_ttl,
             request_timeout=limits_config_model.request_timeout,
             url_max_length=limits_config_model.url_max_length,
             max_redirects=limits_config_model.max_redirects,
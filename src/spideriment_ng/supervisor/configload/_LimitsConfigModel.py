@@ -33,8 +33,15 @@ _DEFAULT_LIMIT_BLUEPRINT = IntegerBlueprint(
 class _LimitsConfigModel(ObjectModel):
     worker_processes = _DEFAULT_LIMIT_BLUEPRINT
     worker_tasks_per_process = _DEFAULT_LIMIT_BLUEPRINT
+    url_lease_batch_size = _DEFAULT_LIMIT_BLUEPRINT
+    max_buffered_crawling_results = _DEFAULT_LIMIT_BLUEPRINT
+    crawling_result_flush_interval = _DEFAULT_LIMIT_BLUEPRINT
     max_document_size = _DEFAULT_LIMIT_BLUEPRINT
     max_robots_txt_size = _DEFAULT_LIMIT_BLUEPRINT
+    robots_txt_cache_ttl = _DEFAULT_LIMIT_BLUEPRINT
+    robots_txt_not_found_cache_ttl = _DEFAULT_LIMIT_BLUEPRINT
+    robots_txt_error_cache_ttl = _DEFAULT_LIMIT_BLUEPRINT
+    robots_txt_promoted_cache_ttl = _DEFAULT_LIMIT_BLUEPRINT
     request_timeout = _DEFAULT_LIMIT_BLUEPRINT
     max_redirects = _DEFAULT_LIMIT_BLUEPRINT
     max_crawling_delay = _DEFAULT_LIMIT_BLUEPRINT
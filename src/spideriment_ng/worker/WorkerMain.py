@@ -34,6 +34,9 @@ from spideriment_ng.worker.modulect.ModuleInstanceCaretaker import ModuleInstanc
 from spideriment_ng.worker.di import WORKER_DI_NS
 from spideriment_ng.worker.di.WorkerDependencyProvider import WorkerDependencyProvider
 from spideriment_ng.worker.workertaskct.WorkerTaskCaretaker import WorkerTaskCaretaker
+from spideriment_ng.worker.workertask._dbadapter.URLLeaseQueue import URLLeaseQueue  # noqa
+from spideriment_ng.worker.workertask._dbadapter.CrawlingResultBuffer import CrawlingResultBuffer  # noqa
+from spideriment_ng.worker.workertask._robotassessor.RobotAssessor import RobotAssessor  # noqa
 
 
 class WorkerMain:
@@ -52,12 +55,29 @@ class WorkerMain:
                 ordered_document_parsers = await self._instantiate_multiple_modules_as_per_configurations(configuration.get_ordered_document_parser_modules(), caretaker, logger)
                 ordered_robot_caches = await self._instantiate_multiple_modules_as_per_configurations(configuration.get_ordered_robot_cache_modules(), caretaker, logger)
 
-                dependency_provider = WorkerDependencyProvider(worker_process_id, configuration, termination_flag_carrier, logger, fetcher, database, ordered_document_parsers, ordered_robot_caches)  # noqa
+                limits_configuration = configuration.get_limits_configuration()
+                url_lease_queue = URLLeaseQueue(limits_configuration.get_url_lease_batch_size())
+                crawling_result_buffer = CrawlingResultBuffer(limits_configuration.get_max_buffered_crawling_results(), limits_configuration.get_crawling_result_flush_interval())
+                robot_assessor = RobotAssessor()
+
+                dependency_provider = WorkerDependencyProvider(worker_process_id, configuration, termination_flag_carrier, logger, fetcher, database, ordered_document_parsers, ordered_robot_caches, url_lease_queue, crawling_result_buffer, robot_assessor)  # noqa
                 WORKER_DI_NS.set_dependency_provider(dependency_provider)
 
                 logger.log(LogSeverity.DEBUG, "Worker process initialized successfully!")
 
-                await WorkerTaskCaretaker().run()
+                # Buffered crawling results must be stored and URLs which have been leased from the database, but have
+                #  not been crawled, must be returned to it before the modules are destroyed - even if the worker tasks
+                #  have failed (otherwise, the database would still consider the URLs to be crawled by this crawler)
+                try:
+                    try:
+                        await WorkerTaskCaretaker().run()
+                    finally:
+                        await crawling_result_buffer.close()  # Also stops the periodic flushes
+                finally:
+                    await url_lease_queue.release_queued_urls()
+
+                self._log_module_statistics((fetcher, database, *ordered_document_parsers, *ordered_robot_caches), logger)
+                self._log_robot_assessor_statistics(robot_assessor, logger)
 
             logger.log(LogSeverity.DEBUG, "Worker process is now terminating.")
 
@@ -90,3 +110,17 @@ class WorkerMain:
     async def _instantiate_multiple_modules_as_per_configurations(self, module_configurations: Sequence[ConfiguredModule], caretaker: ModuleInstanceCaretaker, logger: Logger) -> Sequence[ModuleIface]:
         # The instances are in the same order as the configurations!
         return [(await self._instantiate_module_as_per_configuration(module_configuration, caretaker, logger)) for module_configuration in module_configurations]
+
+    def _log_module_statistics(self, module_instances: Sequence[ModuleIface], logger: Logger) -> None:
+        for module_instance in module_instances:
+            statistics = module_instance.get_statistics()
+            if len(statistics) == 0:
+                continue
+
+            module_class = module_instance.__class__
+            formatted_statistics = ", ".join(f"{name}={value}" for name, value in statistics.items())
+            logger.log(LogSeverity.DEBUG, f"Statistics of module '{module_class.get_module_info().get_name()}' / {module_class.__name__}: {formatted_statistics}")
+
+    def _log_robot_assessor_statistics(self, robot_assessor: RobotAssessor, logger: Logger) -> None:
+        formatted_statistics = ", ".join(f"{name}={value}" for name, value in robot_assessor.get_statistics().items())
+        logger.log(LogSeverity.DEBUG, f"Statistics of the robot assessor: {formatted_statistics}")
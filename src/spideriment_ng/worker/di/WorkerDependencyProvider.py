@@ -29,13 +29,17 @@ from spideriment_ng.modules.databases.DatabaseModuleIface import DatabaseModuleI
 from spideriment_ng.modules.documentparsers.DocumentParserModuleIface import DocumentParserModuleIface
 from spideriment_ng.modules.robotcaches.RobotCacheModuleIface import RobotCacheModuleIface
 from spideriment_ng.helpers.FlagCarrier import FlagCarrier
+from spideriment_ng.worker.workertask._dbadapter.URLLeaseQueue import URLLeaseQueue  # noqa
+from spideriment_ng.worker.workertask._dbadapter.CrawlingResultBuffer import CrawlingResultBuffer  # noqa
+from spideriment_ng.worker.workertask._robotassessor.RobotAssessor import RobotAssessor  # noqa
 from spideriment_ng.worker.di.exc.InvalidWorkerDependencyRequestedExc import InvalidWorkerDependencyRequestedExc
 
 
 class WorkerDependencyProvider(DependencyProviderInterface):
     def __init__(self, worker_process_id: int, configuration: Configuration, termination_flag_carrier: FlagCarrier, logger: Logger,
                  fetcher: FetcherModuleIface, database: DatabaseModuleIface, ordered_document_parsers: Sequence[DocumentParserModuleIface],
-                 ordered_robot_caches: Sequence[RobotCacheModuleIface]):
+                 ordered_robot_caches: Sequence[RobotCacheModuleIface], url_lease_queue: URLLeaseQueue,
+                 crawling_result_buffer: CrawlingResultBuffer, robot_assessor: RobotAssessor):
         self._worker_process_id: Final[int] = worker_process_id
         self._configuration: Final[Configuration] = configuration
         self._termination_flag_carrier: Final[FlagCarrier] = termination_flag_carrier
@@ -44,6 +48,9 @@ class WorkerDependencyProvider(DependencyProviderInterface):
         self._database: Final[DatabaseModuleIface] = database
         self._ordered_document_parsers: Final[Tuple[DocumentParserModuleIface, ...]] = tuple(ordered_document_parsers)
         self._ordered_robot_caches: Final[Tuple[RobotCacheModuleIface, ...]] = tuple(ordered_robot_caches)
+        self._url_lease_queue: Final[URLLeaseQueue] = url_lease_queue
+        self._crawling_result_buffer: Final[CrawlingResultBuffer] = crawling_result_buffer
+        self._robot_assessor: Final[RobotAssessor] = robot_assessor
 
     def get_worker_process_id(self) -> int:
         return self._worker_process_id
@@ -69,6 +76,15 @@ class WorkerDependencyProvider(DependencyProviderInterface):
     def get_ordered_robot_caches(self) -> Sequence[RobotCacheModuleIface]:
         return self._ordered_robot_caches
 
+    def get_url_lease_queue(self) -> URLLeaseQueue:
+        return self._url_lease_queue
+
+    def get_crawling_result_buffer(self) -> CrawlingResultBuffer:
+        return self._crawling_result_buffer
+
+    def get_robot_assessor(self) -> RobotAssessor:
+        return self._robot_assessor
+
     def get_dependency(self, name: str) -> Any:
         try:
             # Dependency names are not saved in constants because they have to match function argument names.
@@ -80,7 +96,10 @@ class WorkerDependencyProvider(DependencyProviderInterface):
                 "fetcher": self._fetcher,
                 "database": self._database,
                 "ordered_document_parsers": self._ordered_document_parsers,
-                "ordered_robot_caches": self._ordered_robot_caches
+                "ordered_robot_caches": self._ordered_robot_caches,
+                "url_lease_queue": self._url_lease_queue,
+                "crawling_result_buffer": self._crawling_result_buffer,
+                "robot_assessor": self._robot_assessor
             }[name])
         except KeyError:
             raise InvalidWorkerDependencyRequestedExc(name)
@@ -40,7 +40,8 @@ from spideriment_ng.worker.workertask._crawler.Crawler import Crawler  # noqa
 
 
 class WorkerTaskMain:
-    def __init__(self):
+    @WORKER_DI_NS.inject_dependencies("robot_assessor")
+    def __init__(self, robot_assessor: RobotAssessor):
         self._database_module_adapter: Final[DatabaseModuleAdapter] = DatabaseModuleAdapter()
 
         normalizer_factory = NormalizerFactory()
@@ -48,7 +49,7 @@ class WorkerTaskMain:
 
         self._crawler: Final[Crawler] = Crawler(
             database_module_adapter=self._database_module_adapter,
-            robot_assessor=RobotAssessor(),
+            robot_assessor=robot_assessor,
             url_normalizer=self._url_normalizer,
             document_normalizer=normalizer_factory.generate_document_normalizer_using_program_config()
         )
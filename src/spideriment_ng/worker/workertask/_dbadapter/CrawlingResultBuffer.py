@@ -0,0 +1,212 @@
+#!/bin/false
+
+# Copyright (c) 2022 Vít Labuda. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without modification, are permitted provided that the
+# following conditions are met:
+#  1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following
+#     disclaimer.
+#  2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the
+#     following disclaimer in the documentation and/or other materials provided with the distribution.
+#  3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote
+#     products derived from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES,
+# INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+from typing import Final, Optional, Sequence, List
+import asyncio
+import time
+from spideriment_ng.helpers.CrawlingErrorReason import CrawlingErrorReason
+from spideriment_ng.logger.Logger import Logger
+from spideriment_ng.logger.LogSeverity import LogSeverity
+from spideriment_ng.modules.databases.DatabaseModuleIface import DatabaseModuleIface
+from spideriment_ng.modules.databases.CrawledURLHandleIface import CrawledURLHandleIface
+from spideriment_ng.modules.databases.crawlingresults.CrawlingResultBase import CrawlingResultBase
+from spideriment_ng.modules.databases.crawlingresults.CrawlingErrorResult import CrawlingErrorResult
+from spideriment_ng.modules.databases.crawlingresults.CrawlingSuccessResult import CrawlingSuccessResult
+from spideriment_ng.modules.databases.exc.DatabaseModuleBaseExc import DatabaseModuleBaseExc
+from spideriment_ng.worker.di import WORKER_DI_NS
+
+
+class CrawlingResultBuffer:
+    _HARD_LIMIT_FACTOR: Final[int] = 8  # The buffer never holds more than 'max_buffered_results' * this results (+ one result per worker task)
+    _MIN_FLUSH_RETRY_DELAY: Final[float] = 1.0  # in seconds
+    _MAX_FLUSH_RETRY_DELAY: Final[float] = 60.0  # in seconds
+    _DROPPED_RESULT_ERROR_REASON: Final[CrawlingErrorReason] = CrawlingErrorReason.UNKNOWN_ERROR
+
+    # An instance of this class is shared between all worker tasks of a worker process (it is provided to them through
+    #  dependency injection). Crawling results (delays, errors and successes) reported by the worker tasks are collected
+    #  and stored to the database in groups, either when enough of them are buffered or periodically.
+    # The crawled URLs stay leased until their results are stored, so they cannot be handed out for crawling again in
+    #  the meantime.
+    # Results stay buffered until they have been stored successfully, so a failed flush is retried by the next one. If
+    #  a group of results cannot be stored, its results are stored one by one, so a single bad result cannot prevent
+    #  the other ones from being stored; the bad results are replaced by crawling errors (or, if even these cannot be
+    #  stored, their URLs are released), so their URLs do not stay leased by the crawler forever.
+    # If nothing can be stored (e.g. because the database is down), the flushes are retried with an exponential
+    #  backoff. Meanwhile, the buffer keeps accepting results up to a hard limit; when the hard limit is reached, the
+    #  worker tasks adding results have to wait for the next retry, and if it fails, its exception is propagated to them.
+
+    def __init__(self, max_buffered_results: int, flush_interval: int):
+        assert (max_buffered_results > 0)
+        assert (flush_interval > 0)
+
+        self._max_buffered_results: Final[int] = max_buffered_results
+        self._hard_buffered_results_limit: Final[int] = (max_buffered_results * self.__class__._HARD_LIMIT_FACTOR)
+        self._flush_interval: Final[int] = flush_interval
+        self._buffered_results: List[CrawlingResultBase] = []
+        self._flush_lock: Final[asyncio.Lock] = asyncio.Lock()
+        self._periodic_flush_task: Optional[asyncio.Task] = None
+        self._periodic_flush_exception: Optional[DatabaseModuleBaseExc] = None
+        self._flush_retry_delay: float = 0.0  # = 0 if the last flush succeeded
+        self._next_flush_attempt_time: float = 0.0  # time.monotonic()
+        self._operational: bool = True
+
+    async def add_result(self, crawling_result: CrawlingResultBase) -> None:
+        """
+        :raises DatabaseModuleBaseExc
+        """
+
+        assert self._operational
+
+        if self._periodic_flush_task is None:
+            self._periodic_flush_task = asyncio.create_task(self._flush_periodically())
+
+        # The result stays buffered even if an exception is raised below
+        self._buffered_results.append(crawling_result)
+
+        # If a periodic flush failed, the failure is reported (once) to a worker task in the same way as if it stored the
+        #  results itself; the periodic flushes carry on nevertheless
+        if self._periodic_flush_exception is not None:
+            periodic_flush_exception = self._periodic_flush_exception
+            self._periodic_flush_exception = None
+            raise periodic_flush_exception
+
+        # The worker task waits for the flush to finish - this keeps the number of buffered results bounded (to the
+        #  maximum number of buffered results + the number of worker tasks), even if the database is slow. While the
+        #  flushes are failing, the results are only buffered until the next retry, unless the hard limit is reached.
+        while len(self._buffered_results) >= self._hard_buffered_results_limit:
+            retry_delay = (self._next_flush_attempt_time - time.monotonic())
+            if retry_delay > 0:
+                await asyncio.sleep(retry_delay)
+            else:
+                await self.flush()
+
+        if (len(self._buffered_results) >= self._max_buffered_results) and (time.monotonic() >= self._next_flush_attempt_time):
+            await self.flush()
+
+    async def flush(self) -> None:
+        """
+        :raises DatabaseModuleBaseExc
+        """
+
+        async with self._flush_lock:
+            if len(self._buffered_results) == 0:
+                return
+
+            # New results may be appended to the buffer while the flush is in progress
+            crawling_results = tuple(self._buffered_results)
+
+            try:
+                try:
+                    await self._store_results(crawling_results)
+                except DatabaseModuleBaseExc:
+                    await self._store_results_one_by_one(crawling_results)
+            except DatabaseModuleBaseExc as e:
+                self._flush_retry_delay = min(max(self._flush_retry_delay * 2, self.__class__._MIN_FLUSH_RETRY_DELAY), self.__class__._MAX_FLUSH_RETRY_DELAY)
+                self._next_flush_attempt_time = (time.monotonic() + self._flush_retry_delay)
+                raise e
+
+            del self._buffered_results[:len(crawling_results)]
+            self._flush_retry_delay = 0.0
+            self._next_flush_attempt_time = 0.0
+
+    @WORKER_DI_NS.inject_dependencies("logger")
+    async def _store_results_one_by_one(self, crawling_results: Sequence[CrawlingResultBase], logger: Logger) -> None:
+        failed_results = []
+        last_exception = None
+        for crawling_result in crawling_results:
+            try:
+                await self._store_results((crawling_result,))
+            except DatabaseModuleBaseExc as e:
+                failed_results.append((crawling_result, e))
+                last_exception = e
+
+        stored_result_count = (len(crawling_results) - len(failed_results))
+        if stored_result_count == 0:
+            # Nothing could be stored, so the database (or the connection to it) is most likely failing - the results are
+            #  kept in the buffer and the next flush tries to store them again
+            assert (last_exception is not None)
+            raise last_exception
+
+        # The other results could be stored, so the failed ones are faulty and storing them again would fail as well;
+        #  they are dropped and replaced by crawling errors, so the crawler does not keep their URLs leased
+        for failed_result, exception in failed_results:
+            logger.log(LogSeverity.WARNING, f"Dropping a crawling result of {repr(failed_result.get_original_url().get_url_in_container().get_url())} which could not be stored: {exception}")
+
+        await self._replace_dropped_results_with_errors([failed_result for failed_result, _ in failed_results])
+
+    @WORKER_DI_NS.inject_dependencies("logger", "database")
+    async def _replace_dropped_results_with_errors(self, dropped_results: Sequence[CrawlingResultBase], logger: Logger, database: DatabaseModuleIface) -> None:
+        url_handles: List[CrawledURLHandleIface] = []
+        error_results: List[CrawlingResultBase] = []
+        for dropped_result in dropped_results:
+            redirected_url = (dropped_result.get_redirected_url() if isinstance(dropped_result, (CrawlingErrorResult, CrawlingSuccessResult)) else None)
+            url_handles.append(dropped_result.get_original_url())
+            if redirected_url is not None:
+                url_handles.append(redirected_url)
+            error_results.append(CrawlingErrorResult(dropped_result.get_original_url(), redirected_url, self.__class__._DROPPED_RESULT_ERROR_REASON))
+
+        try:
+            await self._store_results(error_results)
+            return
+        except DatabaseModuleBaseExc as e:
+            logger.log(LogSeverity.WARNING, f"Failed to store crawling errors in place of the dropped crawling results, so their URLs are going to be released: {e}")
+
+        try:
+            await database.release_urls_to_crawl(url_handles)
+        except DatabaseModuleBaseExc as f:
+            logger.log(LogSeverity.WARNING, f"Failed to release the URLs of the dropped crawling results: {f}")
+
+    async def close(self) -> None:
+        """
+        :raises DatabaseModuleBaseExc
+        """
+
+        assert self._operational
+        self._operational = False
+
+        # The periodic flush task is cancelled only when it is not flushing, so no results get lost
+        async with self._flush_lock:
+            if self._periodic_flush_task is not None:
+                self._periodic_flush_task.cancel()
+                await asyncio.wait((self._periodic_flush_task,))
+                self._periodic_flush_task = None
+
+        # The failure of a periodic flush does not need to be reported anymore, as the final flush retries it
+        self._periodic_flush_exception = None
+
+        await self.flush()
+
+    async def _flush_periodically(self) -> None:
+        while True:
+            await asyncio.sleep(self._flush_interval)
+
+            if time.monotonic() < self._next_flush_attempt_time:
+                continue
+
+            try:
+                await self.flush()
+            except DatabaseModuleBaseExc as e:
+                self._periodic_flush_exception = e
+
+    @WORKER_DI_NS.inject_dependencies("database")
+    async def _store_results(self, crawling_results: Sequence[CrawlingResultBase], database: DatabaseModuleIface) -> None:
+        await database.finish_crawling(crawling_results)
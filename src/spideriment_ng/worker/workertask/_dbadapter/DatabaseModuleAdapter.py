@@ -31,6 +31,7 @@ from spideriment_ng.modules.databases.exc.DatabaseModuleBaseExc import DatabaseM
 from spideriment_ng.worker.di import WORKER_DI_NS
 from spideriment_ng.worker.workertask._dbadapter.CrawlHandleIface import CrawlHandleIface
 from spideriment_ng.worker.workertask._dbadapter._CrawlHandle import _CrawlHandle
+from spideriment_ng.worker.workertask._dbadapter.URLLeaseQueue import URLLeaseQueue
 
 
 class DatabaseModuleAdapter:  # DP: Adapter
@@ -53,12 +54,12 @@ class DatabaseModuleAdapter:  # DP: Adapter
             finally:
                 await crawl_handle.finalize()
 
-    @WORKER_DI_NS.inject_dependencies("database", "termination_flag_carrier")
-    async def _get_url_to_crawl_from_db_when_available(self, database: DatabaseModuleIface, termination_flag_carrier: FlagCarrier) -> Optional[CrawledURLHandleIface]:
+    @WORKER_DI_NS.inject_dependencies("url_lease_queue", "termination_flag_carrier")
+    async def _get_url_to_crawl_from_db_when_available(self, url_lease_queue: URLLeaseQueue, termination_flag_carrier: FlagCarrier) -> Optional[CrawledURLHandleIface]:
         original_url_handle = None
         while (original_url_handle is None) and (not termination_flag_carrier.get()):
             try:
-                original_url_handle = await database.get_url_to_crawl()
+                original_url_handle = await url_lease_queue.get_url_to_crawl()
             except DatabaseModuleBaseExc as e:
                 if e.is_caused_by_no_more_links_to_crawl():
                     await asyncio.sleep(self.__class__._AVAILABLE_LINKS_FOR_CRAWLING_CHECK_INTERVAL)
@@ -0,0 +1,124 @@
+#!/bin/false
+
+# Copyright (c) 2022 Vít Labuda. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without modification, are permitted provided that the
+# following conditions are met:
+#  1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following
+#     disclaimer.
+#  2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the
+#     following disclaimer in the documentation and/or other materials provided with the distribution.
+#  3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote
+#     products derived from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES,
+# INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+from typing import Final, Optional, Deque
+import asyncio
+import collections
+from spideriment_ng.modules.databases.DatabaseModuleIface import DatabaseModuleIface
+from spideriment_ng.modules.databases.CrawledURLHandleIface import CrawledURLHandleIface
+from spideriment_ng.modules.databases.exc.DatabaseModuleBaseExc import DatabaseModuleBaseExc
+from spideriment_ng.worker.di import WORKER_DI_NS
+
+
+class URLLeaseQueue:
+    # An instance of this class is shared between all worker tasks of a worker process (it is provided to them through
+    #  dependency injection). URLs to crawl are leased from the database in batches, so the database does not have to
+    #  be asked for every single URL, and the queue is refilled in the background when it starts running low.
+
+    def __init__(self, lease_batch_size: int):
+        assert (lease_batch_size > 0)
+
+        self._lease_batch_size: Final[int] = lease_batch_size
+        self._refill_threshold: Final[int] = (lease_batch_size // 2)
+        self._queued_url_handles: Final[Deque[CrawledURLHandleIface]] = collections.deque()
+        self._refill_task: Optional[asyncio.Task] = None
+        self._refill_task_awaited: bool = False
+        self._background_refill_exception: Optional[BaseException] = None
+        self._operational: bool = True
+
+    async def get_url_to_crawl(self) -> CrawledURLHandleIface:
+        """
+        :raises DatabaseModuleBaseExc
+        """
+
+        assert self._operational
+
+        # A failure of a refill which nobody has waited for is reported to the first worker task asking for a URL after it
+        if self._background_refill_exception is not None:
+            background_refill_exception = self._background_refill_exception
+            self._background_refill_exception = None
+            raise background_refill_exception
+
+        while len(self._queued_url_handles) == 0:
+            # If the refill fails, the exception is propagated to all the worker tasks waiting for it
+            refill_task = self._get_or_start_refill_task()
+            self._refill_task_awaited = True
+            await asyncio.shield(refill_task)
+
+        url_handle = self._queued_url_handles.popleft()
+
+        if len(self._queued_url_handles) <= self._refill_threshold:
+            self._get_or_start_refill_task()  # The refill is carried out in the background
+
+        return url_handle
+
+    @WORKER_DI_NS.inject_dependencies("database")
+    async def release_queued_urls(self, database: DatabaseModuleIface) -> None:
+        """
+        :raises DatabaseModuleBaseExc
+        """
+
+        assert self._operational
+        self._operational = False
+
+        if self._refill_task is not None:
+            await asyncio.wait((self._refill_task,))
+
+        unused_url_handles = tuple(self._queued_url_handles)
+        self._queued_url_handles.clear()
+
+        await database.release_urls_to_crawl(unused_url_handles)
+
+    def _get_or_start_refill_task(self) -> asyncio.Task:
+        # Only one refill may be in progress at the same time
+        if self._refill_task is None:
+            self._refill_task = asyncio.create_task(self._refill())
+            self._refill_task_awaited = False
+            self._refill_task.add_done_callback(self._on_refill_task_done)
+
+        return self._refill_task
+
+    def _on_refill_task_done(self, refill_task: asyncio.Task) -> None:
+        self._refill_task = None
+
+        if refill_task.cancelled():
+            return
+
+        # The exception is retrieved in any case, so asyncio does not complain about it not being retrieved. Running out
+        #  of links to crawl is expected (the next worker task which needs a URL simply tries again later), but other
+        #  exceptions of refills which no worker task has waited for must not get lost.
+        exception = refill_task.exception()
+        if (exception is None) or self._refill_task_awaited:
+            return
+        if isinstance(exception, DatabaseModuleBaseExc) and exception.is_caused_by_no_more_links_to_crawl():
+            return
+
+        self._background_refill_exception = exception
+
+    @WORKER_DI_NS.inject_dependencies("database")
+    async def _refill(self, database: DatabaseModuleIface) -> None:
+        url_handles = await database.get_urls_to_crawl(self._lease_batch_size)
+
+        if self._operational:
+            self._queued_url_handles.extend(url_handles)
+        else:
+            await database.release_urls_to_crawl(url_handles)
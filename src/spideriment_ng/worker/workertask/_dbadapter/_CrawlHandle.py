@@ -26,9 +26,13 @@ from spideriment_ng.helpers.containers.document.URLContainer import URLContainer
 from spideriment_ng.helpers.containers.document.DocumentContainer import DocumentContainer
 from spideriment_ng.modules.databases.CrawledURLHandleIface import CrawledURLHandleIface
 from spideriment_ng.modules.databases.DatabaseModuleIface import DatabaseModuleIface
+from spideriment_ng.modules.databases.crawlingresults.CrawlingDelayResult import CrawlingDelayResult
+from spideriment_ng.modules.databases.crawlingresults.CrawlingErrorResult import CrawlingErrorResult
+from spideriment_ng.modules.databases.crawlingresults.CrawlingSuccessResult import CrawlingSuccessResult
 from spideriment_ng.modules.databases.exc.DatabaseModuleBaseExc import DatabaseModuleBaseExc
 from spideriment_ng.worker.di import WORKER_DI_NS
 from spideriment_ng.worker.workertask._dbadapter.CrawlHandleIface import CrawlHandleIface
+from spideriment_ng.worker.workertask._dbadapter.CrawlingResultBuffer import CrawlingResultBuffer
 
 
 class _CrawlHandle(CrawlHandleIface):
@@ -37,7 +41,7 @@ class _CrawlHandle(CrawlHandleIface):
     def __init__(self, original_url_handle: CrawledURLHandleIface):
         self._original_url_handle: Final[CrawledURLHandleIface] = original_url_handle
         self._redirected_url_handle: Optional[CrawledURLHandleIface] = None
-        self._open: bool = True  # = True if no delay, error or success has been SUCCESSFULLY reported; False otherwise
+        self._open: bool = True  # = True if no delay, error or success has been reported; False otherwise
         self._redirect_not_accepted: bool = False
 
     def get_url_to_crawl(self) -> CrawledURLHandleIface:
@@ -59,34 +63,37 @@ class _CrawlHandle(CrawlHandleIface):
 
         return self._redirected_url_handle
 
-    @WORKER_DI_NS.inject_dependencies("database")
-    async def delay(self, delay_seconds: int, database: DatabaseModuleIface) -> None:
+    @WORKER_DI_NS.inject_dependencies("crawling_result_buffer")
+    async def delay(self, delay_seconds: int, crawling_result_buffer: CrawlingResultBuffer) -> None:
         assert self._open
         assert (self._redirected_url_handle is None)  # Delay detection is always performed before final URL detection is
         assert (not self._redirect_not_accepted)
 
-        await database.finish_crawling_with_delay(self._original_url_handle, delay_seconds)
-
+        # The handle is closed beforehand, as the buffer keeps the result even if it raises an exception (the result
+        #  would otherwise be reported twice - see 'finalize()')
         self._open = False
+        await crawling_result_buffer.add_result(CrawlingDelayResult(self._original_url_handle, delay_seconds))
 
-    @WORKER_DI_NS.inject_dependencies("database")
-    async def error(self, error_reason: CrawlingErrorReason, database: DatabaseModuleIface) -> None:
+    @WORKER_DI_NS.inject_dependencies("crawling_result_buffer")
+    async def error(self, error_reason: CrawlingErrorReason, crawling_result_buffer: CrawlingResultBuffer) -> None:
         assert self._open
         if self._redirect_not_accepted:
             assert (error_reason in (CrawlingErrorReason.FINAL_URL_NOT_CRAWLABLE, self.__class__._FALLBACK_ERROR_REASON))
 
-        await database.finish_crawling_with_error(self._original_url_handle, self._redirected_url_handle, error_reason)
-
+        # The handle is closed beforehand, as the buffer keeps the result even if it raises an exception (the result
+        #  would otherwise be reported twice - see 'finalize()')
         self._open = False
+        await crawling_result_buffer.add_result(CrawlingErrorResult(self._original_url_handle, self._redirected_url_handle, error_reason))
 
-    @WORKER_DI_NS.inject_dependencies("database")
-    async def success(self, validated_document: DocumentContainer, database: DatabaseModuleIface) -> None:
+    @WORKER_DI_NS.inject_dependencies("crawling_result_buffer")
+    async def success(self, validated_document: DocumentContainer, crawling_result_buffer: CrawlingResultBuffer) -> None:
         assert self._open
         assert (not self._redirect_not_accepted)
 
-        await database.finish_crawling_with_success(self._original_url_handle, self._redirected_url_handle, validated_document)
-
+        # The handle is closed beforehand, as the buffer keeps the result even if it raises an exception (the result
+        #  would otherwise be reported twice - see 'finalize()')
         self._open = False
+        await crawling_result_buffer.add_result(CrawlingSuccessResult(self._original_url_handle, self._redirected_url_handle, validated_document))
 
     async def finalize(self) -> None:
         if self._open:
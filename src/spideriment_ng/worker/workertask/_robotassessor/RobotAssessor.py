@@ -20,24 +20,38 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 
-from typing import Final, Optional, Sequence
+from typing import Final, Optional, Sequence, Dict
+import asyncio
 import urllib.parse
-import urllib.robotparser
+from spideriment_ng.config.Configuration import Configuration
 from spideriment_ng.helpers.containers.document.URLContainer import URLContainer
+from spideriment_ng.helpers.robots.RobotRules import RobotRules
 from spideriment_ng.modules.robotcaches.RobotCacheModuleIface import RobotCacheModuleIface
 from spideriment_ng.modules.robotcaches.exc.RobotCacheModuleBaseExc import RobotCacheModuleBaseExc
 from spideriment_ng.worker.di import WORKER_DI_NS
 from spideriment_ng.worker.workertask._robotassessor._RobotFetchHelper import _RobotFetchHelper
+from spideriment_ng.worker.workertask._robotassessor._RobotFetchResult import _RobotFetchResult
+from spideriment_ng.worker.workertask._robotassessor._RobotFetchResultType import _RobotFetchResultType
 from spideriment_ng.worker.workertask._robotassessor._RobotAssessmentHelper import _RobotAssessmentHelper
 from spideriment_ng.worker.workertask._robotassessor.RobotAssessment import RobotAssessment
 
 
 class RobotAssessor:
+    # An instance of this class is shared between all worker tasks of a worker process (it is provided to them through
+    #  dependency injection), so when several worker tasks need the same robots.txt file which is not cached, it is
+    #  fetched only once and all of them wait for the single fetch to finish.
+    # The robot caches form tiers ordered by their priorities. When a robots.txt file is found in a lower tier, it is
+    #  promoted into all the higher (faster) tiers, so it is found there next time.
+
     _ROBOTS_TXT_PATH: Final[str] = "/robots.txt"
 
     def __init__(self):
         self._robot_fetch_helper: Final[_RobotFetchHelper] = _RobotFetchHelper()
         self._robot_assessment_helper: Final[_RobotAssessmentHelper] = _RobotAssessmentHelper()
+        self._in_flight_robots_file_fetches: Final[Dict[str, asyncio.Task]] = dict()
+        self._robot_cache_hit_counts: Final[Dict[int, int]] = dict()  # Tier index -> hit count
+        self._robot_cache_miss_count: int = 0
+        self._robot_cache_promotion_count: int = 0
 
     async def assess(self, validated_absolute_assessed_url: URLContainer) -> RobotAssessment:
         assert (validated_absolute_assessed_url.is_validated() and validated_absolute_assessed_url.is_certainly_absolute())
@@ -45,9 +59,9 @@ class RobotAssessor:
         assessed_url = validated_absolute_assessed_url.get_url()
 
         robots_txt_url = self._get_robots_txt_url_from_input_url(assessed_url)
-        parsed_robots_file = await self._get_parsed_robots_file(robots_txt_url)
+        robot_rules = await self._get_robot_rules(robots_txt_url)
 
-        return self._assess_parsed_robots_file(assessed_url, parsed_robots_file)
+        return self._assess_robot_rules(assessed_url, robot_rules)
 
     def _get_robots_txt_url_from_input_url(self, input_url: str) -> str:
         split_input_url = urllib.parse.urlsplit(input_url, allow_fragments=True)
@@ -60,33 +74,81 @@ class RobotAssessor:
             fragment=""
         ))  # noqa
 
-    async def _get_parsed_robots_file(self, robots_txt_url: str) -> Optional[urllib.robotparser.RobotFileParser]:
-        # Try caches first...
-        parsed_robots_file = await self._get_parsed_robots_file_from_caches(robots_txt_url)
-        if parsed_robots_file is not None:
-            return parsed_robots_file
+    async def _get_robot_rules(self, robots_txt_url: str) -> RobotRules:
+        # If the file is already being fetched by another worker task, wait for it...
+        fetch_task = self._in_flight_robots_file_fetches.get(robots_txt_url, None)
+        if fetch_task is not None:
+            return await asyncio.shield(fetch_task)
+
+        # ... otherwise, try caches...
+        robot_rules = await self._get_robot_rules_from_caches(robots_txt_url)
+        if robot_rules is not None:
+            return robot_rules
+
+        # ... and if no cache holds the file, fetch it (another worker task might have started fetching it while the
+        #  caches were being searched)
+        fetch_task = self._in_flight_robots_file_fetches.get(robots_txt_url, None)
+        if fetch_task is None:
+            fetch_task = self._start_robots_file_fetch(robots_txt_url)
+
+        # The fetch must not be cancelled when one of the worker tasks waiting for it gets cancelled; if it fails, the
+        #  exception is propagated to all the worker tasks waiting for it
+        return await asyncio.shield(fetch_task)
+
+    def _start_robots_file_fetch(self, robots_txt_url: str) -> asyncio.Task:
+        def _fetch_task_done_callback(done_fetch_task: asyncio.Task) -> None:
+            del self._in_flight_robots_file_fetches[robots_txt_url]
+            if not done_fetch_task.cancelled():
+                done_fetch_task.exception()  # Prevents asyncio from complaining if no worker task retrieved the exception
+
+        fetch_task = asyncio.create_task(self._fetch_and_cache_robots_file(robots_txt_url))
+        fetch_task.add_done_callback(_fetch_task_done_callback)
+        self._in_flight_robots_file_fetches[robots_txt_url] = fetch_task
+
+        return fetch_task
+
+    async def _fetch_and_cache_robots_file(self, robots_txt_url: str) -> RobotRules:
+        # If the file has not been found or could not be fetched, robot rules allowing everything are cached (for a
+        #  shorter time), so the file does not have to be requested again before crawling each URL from the host
+        fetch_result = await self._get_robots_file_using_fetcher(robots_txt_url)
 
-        # ... if no cache holds the file, try to fetch it
-        parsed_robots_file = await self._get_parsed_robots_file_using_fetcher(robots_txt_url)
-        if parsed_robots_file is None:
-            return None
+        cache_ttl = self._get_cache_ttl_for_fetch_result_type(fetch_result.get_result_type())
+        await self._cache_fetched_robot_rules(robots_txt_url, fetch_result.get_robot_rules(), cache_ttl)
 
-        # If the file is successfully fetched, cache it and return it
-        await self._cache_fetched_robots_file(robots_txt_url, parsed_robots_file)
-        return parsed_robots_file
+        return fetch_result.get_robot_rules()
 
     @WORKER_DI_NS.inject_dependencies("ordered_robot_caches")
-    async def _get_parsed_robots_file_from_caches(self, robots_txt_url: str, ordered_robot_caches: Sequence[RobotCacheModuleIface]) -> Optional[urllib.robotparser.RobotFileParser]:
-        for robot_cache in ordered_robot_caches:
+    async def _get_robot_rules_from_caches(self, robots_txt_url: str, ordered_robot_caches: Sequence[RobotCacheModuleIface]) -> Optional[RobotRules]:
+        for tier_index, robot_cache in enumerate(ordered_robot_caches):
             try:
-                return await robot_cache.retrieve_from_cache(robots_txt_url)
+                robot_rules, remaining_ttl = await robot_cache.retrieve_from_cache(robots_txt_url)
             except RobotCacheModuleBaseExc as e:
                 if not e.is_caused_by_cache_miss():
                     raise e
+                continue
 
+            self._robot_cache_hit_counts[tier_index] = (self._robot_cache_hit_counts.get(tier_index, 0) + 1)
+            await self._promote_robot_rules_into_higher_tiers(robots_txt_url, robot_rules, remaining_ttl, ordered_robot_caches[0:tier_index])
+            return robot_rules
+
+        self._robot_cache_miss_count += 1
         return None
 
-    async def _get_parsed_robots_file_using_fetcher(self, robots_txt_url: str) -> Optional[urllib.robotparser.RobotFileParser]:
+    @WORKER_DI_NS.inject_dependencies("configuration")
+    async def _promote_robot_rules_into_higher_tiers(self, robots_txt_url: str, robot_rules: RobotRules, remaining_ttl: float, higher_tier_robot_caches: Sequence[RobotCacheModuleIface], configuration: Configuration) -> None:
+        # The promoted entry must not outlive the entry in the lower tier (e.g. robot rules cached because of a
+        #  transient error are kept only for a short time), and it is kept at most for the promoted cache TTL, so
+        #  changes made to the lower tier (which may be shared with other crawlers) become visible eventually
+        cache_ttl = min(configuration.get_limits_configuration().get_robots_txt_promoted_cache_ttl(), int(remaining_ttl))
+        if cache_ttl <= 0:  # The entry is just about to expire
+            return
+
+        for robot_cache in higher_tier_robot_caches:
+            # Exceptions are not caught, since only "fatal" exceptions can occur when putting a new item into the caches
+            await robot_cache.put_into_cache(robots_txt_url, robot_rules, cache_ttl)
+            self._robot_cache_promotion_count += 1
+
+    async def _get_robots_file_using_fetcher(self, robots_txt_url: str) -> _RobotFetchResult:
         # The robots.txt URL was generated from a validated & absolute input (assessed) URL, so it can be considered
         #  validated & absolute too.
         validated_absolute_robots_txt_url = URLContainer(
@@ -97,14 +159,31 @@ class RobotAssessor:
 
         return await self._robot_fetch_helper.fetch_robots_file(validated_absolute_robots_txt_url)
 
+    @WORKER_DI_NS.inject_dependencies("configuration")
+    def _get_cache_ttl_for_fetch_result_type(self, fetch_result_type: _RobotFetchResultType, configuration: Configuration) -> int:
+        limits_config = configuration.get_limits_configuration()
+
+        return ({
+            _RobotFetchResultType.FOUND: limits_config.get_robots_txt_cache_ttl(),
+            _RobotFetchResultType.NOT_FOUND: limits_config.get_robots_txt_not_found_cache_ttl(),
+            _RobotFetchResultType.TRANSIENT_ERROR: limits_config.get_robots_txt_error_cache_ttl()
+        }[fetch_result_type])
+
     @WORKER_DI_NS.inject_dependencies("ordered_robot_caches")
-    async def _cache_fetched_robots_file(self, robots_txt_url: str, fetched_robots_file: urllib.robotparser.RobotFileParser, ordered_robot_caches: Sequence[RobotCacheModuleIface]) -> None:
+    async def _cache_fetched_robot_rules(self, robots_txt_url: str, fetched_robot_rules: RobotRules, cache_ttl: int, ordered_robot_caches: Sequence[RobotCacheModuleIface]) -> None:
         for robot_cache in ordered_robot_caches:  # The robots file is put into all the caches
             # Exceptions are not caught, since only "fatal" exceptions can occur when putting a new item into the caches
-            await robot_cache.put_into_cache(robots_txt_url, fetched_robots_file)
+            await robot_cache.put_into_cache(robots_txt_url, fetched_robot_rules, cache_ttl)
+
+    # Counters describing how the robot cache tiers were used, which are logged when the worker process is terminating
+    #  (in the same way as the statistics of modules); a miss means that the robots.txt file was not found in any tier.
+    @WORKER_DI_NS.inject_dependencies("ordered_robot_caches")
+    def get_statistics(self, ordered_robot_caches: Sequence[RobotCacheModuleIface]) -> Dict[str, int]:
+        statistics = {f"tier_{tier_index}_hits": self._robot_cache_hit_counts.get(tier_index, 0) for tier_index in range(len(ordered_robot_caches))}
+        statistics["misses"] = self._robot_cache_miss_count
+        statistics["promotions"] = self._robot_cache_promotion_count
 
-    def _assess_parsed_robots_file(self, assessed_url: str, parsed_robots_file: Optional[urllib.robotparser.RobotFileParser]) -> RobotAssessment:
-        if parsed_robots_file is None:
-            return self._robot_assessment_helper.generate_fallback_assessment()
+        return statistics
 
-        return self._robot_assessment_helper.assess_parsed_robots_file(assessed_url, parsed_robots_file)
+    def _assess_robot_rules(self, assessed_url: str, robot_rules: RobotRules) -> RobotAssessment:
+        return self._robot_assessment_helper.assess_robot_rules(assessed_url, robot_rules)
@@ -20,66 +20,13 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 
-from typing import Final, Tuple
-import math
-import urllib.robotparser
+from spideriment_ng.helpers.robots.RobotRules import RobotRules
 from spideriment_ng.worker.workertask._robotassessor.RobotAssessment import RobotAssessment
 
 
 class _RobotAssessmentHelper:
-    _ASSESSED_USER_AGENTS: Final[Tuple[str, ...]] = (
-        "spideriment", "Spideriment", "SPIDERIMENT",
-        "spideriment-ng", "Spideriment-NG", "SPIDERIMENT-NG",
-        "spideriment_ng", "Spideriment_NG", "SPIDERIMENT_NG"
-    )
-
-    def generate_fallback_assessment(self) -> RobotAssessment:
+    def assess_robot_rules(self, assessed_url: str, robot_rules: RobotRules) -> RobotAssessment:
         return RobotAssessment(
-            url_crawlable=True,
-            crawling_delay=0
-        )
-
-    def assess_parsed_robots_file(self, assessed_url: str, parsed_robots_file: urllib.robotparser.RobotFileParser) -> RobotAssessment:
-        url_crawlable = self._decide_whether_url_is_crawlable(assessed_url, parsed_robots_file)
-        crawling_delay = max(
-            self._get_crawl_delay(parsed_robots_file),
-            self._get_crawl_delay_from_request_rate(parsed_robots_file)
+            url_crawlable=robot_rules.is_url_allowed(assessed_url),
+            crawling_delay=robot_rules.get_crawling_delay()
         )
-
-        return RobotAssessment(
-            url_crawlable=url_crawlable,
-            crawling_delay=crawling_delay
-        )
-
-    def _decide_whether_url_is_crawlable(self, assessed_url: str, parsed_robots_file: urllib.robotparser.RobotFileParser) -> bool:
-        for user_agent in self.__class__._ASSESSED_USER_AGENTS:
-            if not parsed_robots_file.can_fetch(user_agent, assessed_url):
-                return False
-
-        return True
-
-    def _get_crawl_delay(self, parsed_robots_file: urllib.robotparser.RobotFileParser) -> int:
-        longest_crawl_delay = 0
-        for user_agent in self.__class__._ASSESSED_USER_AGENTS:
-            current_crawl_delay = parsed_robots_file.crawl_delay(user_agent)
-            if (current_crawl_delay is not None) and (current_crawl_delay > longest_crawl_delay):
-                longest_crawl_delay = current_crawl_delay
-
-        return longest_crawl_delay
-
-    def _get_crawl_delay_from_request_rate(self, parsed_robots_file: urllib.robotparser.RobotFileParser) -> int:
-        longest_crawl_delay = 0
-        for user_agent in self.__class__._ASSESSED_USER_AGENTS:
-            request_rate = parsed_robots_file.request_rate(user_agent)
-            if request_rate is None:
-                continue
-
-            try:
-                current_crawl_delay = math.ceil(request_rate.seconds / request_rate.requests)
-            except ZeroDivisionError:
-                continue
-
-            if current_crawl_delay > longest_crawl_delay:
-                longest_crawl_delay = current_crawl_delay
-
-        return longest_crawl_delay
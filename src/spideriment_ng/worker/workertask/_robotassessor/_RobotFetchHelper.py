@@ -20,42 +20,59 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 
-from typing import Final, Optional, Tuple
-import urllib.robotparser
+from typing import Final, Optional, Tuple, Union
 from spideriment_ng.config.Configuration import Configuration
 from spideriment_ng.helpers.containers.FetchedFileContainer import FetchedFileContainer
 from spideriment_ng.helpers.containers.document.URLContainer import URLContainer
 from spideriment_ng.helpers.decoding.DecodingHelper import DecodingHelper
 from spideriment_ng.helpers.decoding.exc.DecodingHelperBaseExc import DecodingHelperBaseExc
+from spideriment_ng.helpers.robots.RobotRules import RobotRules
+from spideriment_ng.helpers.robots.RobotRulesCompiler import RobotRulesCompiler
 from spideriment_ng.modules.fetchers.FetcherModuleIface import FetcherModuleIface
 from spideriment_ng.modules.fetchers.exc.FetcherModuleBaseExc import FetcherModuleBaseExc
+from spideriment_ng.modules.fetchers.exc.FetcherModuleExcType import FetcherModuleExcType
 from spideriment_ng.worker.di import WORKER_DI_NS
+from spideriment_ng.worker.workertask._robotassessor._RobotFetchResultType import _RobotFetchResultType
+from spideriment_ng.worker.workertask._robotassessor._RobotFetchResult import _RobotFetchResult
 
 
 class _RobotFetchHelper:
     _ALLOWED_MIME_TYPES: Final[Tuple[str, ...]] = ("text/plain",)
     _FALLBACK_ENCODING: Final[str] = "utf-8"
+    # The rules applying to any of these user agent names are obeyed
+    _ASSESSED_USER_AGENTS: Final[Tuple[str, ...]] = (
+        "spideriment", "Spideriment", "SPIDERIMENT",
+        "spideriment-ng", "Spideriment-NG", "SPIDERIMENT-NG",
+        "spideriment_ng", "Spideriment_NG", "SPIDERIMENT_NG"
+    )
+    # Fetching errors which are not listed here are considered transient (temporary)
+    _NOT_FOUND_FETCHER_EXC_TYPES: Final[Tuple[FetcherModuleExcType, ...]] = (
+        FetcherModuleExcType.NOT_FOUND,
+        FetcherModuleExcType.FORBIDDEN,
+        FetcherModuleExcType.REDIRECT
+    )
 
     def __init__(self):
         self._decoding_helper: Final[DecodingHelper] = DecodingHelper()
+        self._robot_rules_compiler: Final[RobotRulesCompiler] = RobotRulesCompiler(self.__class__._ASSESSED_USER_AGENTS)
 
-    # None means that the robots.txt file could not be downloaded or parsed (for whatever reason).
-    async def fetch_robots_file(self, validated_absolute_robots_txt_url: URLContainer) -> Optional[urllib.robotparser.RobotFileParser]:
+    async def fetch_robots_file(self, validated_absolute_robots_txt_url: URLContainer) -> _RobotFetchResult:
         downloaded_robots_txt = await self._download_robots_file_using_fetcher(validated_absolute_robots_txt_url)
-        if downloaded_robots_txt is None:
-            return None
+        if isinstance(downloaded_robots_txt, _RobotFetchResultType):
+            return self._generate_allow_all_result(downloaded_robots_txt)
 
         if not self._is_mime_type_allowed_for_robots_txt(downloaded_robots_txt.get_hinted_mime_type()):
-            return None
+            return self._generate_allow_all_result(_RobotFetchResultType.NOT_FOUND)
 
         decoded_robots_txt_string = self._decode_binary_robots_txt_data(downloaded_robots_txt.get_data(), downloaded_robots_txt.get_hinted_encoding())
         if decoded_robots_txt_string is None:
-            return None
+            return self._generate_allow_all_result(_RobotFetchResultType.NOT_FOUND)
 
-        return self._parse_robots_txt_string(decoded_robots_txt_string)
+        return _RobotFetchResult(_RobotFetchResultType.FOUND, self._robot_rules_compiler.compile_robots_txt(decoded_robots_txt_string))
 
+    # If the file cannot be downloaded, the type of the failure is returned instead.
     @WORKER_DI_NS.inject_dependencies("configuration", "fetcher")
-    async def _download_robots_file_using_fetcher(self, validated_absolute_robots_txt_url: URLContainer, configuration: Configuration, fetcher: FetcherModuleIface) -> Optional[FetchedFileContainer]:
+    async def _download_robots_file_using_fetcher(self, validated_absolute_robots_txt_url: URLContainer, configuration: Configuration, fetcher: FetcherModuleIface) -> Union[FetchedFileContainer, _RobotFetchResultType]:
         limits_config = configuration.get_limits_configuration()
 
         try:
@@ -64,8 +81,13 @@ class _RobotFetchHelper:
                 max_size=limits_config.get_max_robots_txt_size(),
                 timeout=limits_config.get_request_timeout()
             )
-        except FetcherModuleBaseExc:
-            return None
+        except FetcherModuleBaseExc as e:
+            if e.get_exception_type() in self.__class__._NOT_FOUND_FETCHER_EXC_TYPES:
+                return _RobotFetchResultType.NOT_FOUND
+            return _RobotFetchResultType.TRANSIENT_ERROR
+
+    def _generate_allow_all_result(self, result_type: _RobotFetchResultType) -> _RobotFetchResult:
+        return _RobotFetchResult(result_type, RobotRules.generate_allow_all_rules())
 
     def _is_mime_type_allowed_for_robots_txt(self, mime_type: str) -> bool:
         return mime_type.strip().lower() in self.__class__._ALLOWED_MIME_TYPES
@@ -78,9 +100,10 @@ class _RobotFetchHelper:
             except DecodingHelperBaseExc:
                 pass
 
-        # Automatic detection
+        # Automatic detection (robots.txt files are fetched only once per host, so it does not make sense to cache the
+        #  detected encodings)
         try:
-            return self._decoding_helper.try_detecting_encoding_and_try_decoding_data_using_it(binary_robots)
+            return self._decoding_helper.try_detecting_encoding_and_try_decoding_data_using_it(binary_robots, None)
         except DecodingHelperBaseExc:
             pass
 
@@ -89,14 +112,3 @@ class _RobotFetchHelper:
             return self._decoding_helper.try_decoding_data_using_encoding(binary_robots, self.__class__._FALLBACK_ENCODING, ignore_errors=False)
         except DecodingHelperBaseExc:
             return None
-
-    def _parse_robots_txt_string(self, decoded_robots_txt_string: str) -> Optional[urllib.robotparser.RobotFileParser]:
-        lines = decoded_robots_txt_string.splitlines()
-
-        robot_parser = urllib.robotparser.RobotFileParser()
-        try:
-            robot_parser.parse(lines)
-        except Exception:  # noqa; It is not clear what exceptions does 'RobotFileParser' raise
-            return None
-
-        return robot_parser